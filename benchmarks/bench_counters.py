@@ -0,0 +1,153 @@
+"""
+Benchmarks every concrete counter over standard families of random graphs, node counts and motif sizes.
+
+Reports the time of the binary (``process_time`` of ``PyMotifCounterRunStats``) separately from the time that the
+count spends in Python (transforming its input, file io, parsing its output and any other overhead), so that
+regressions of the wrapper layer are not hidden by the time of the binaries. Counters whose binaries are not installed
+are skipped, as are benchmarks whose counts do not complete within ``--timeout``.
+
+The results can be saved as a baseline and later runs compared to it. The comparison fails (exit status 1) if the
+Python overhead of any benchmark grows by more than ``--threshold`` (and by more than ``--min-delta`` seconds).
+
+Usage:
+    python -m benchmarks.bench_counters --nodes 100 500 --motif-sizes 3 4 --save baseline.json
+    python -m benchmarks.bench_counters --nodes 100 500 --motif-sizes 3 4 --compare baseline.json
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import sys
+import json
+import argparse
+import statistics
+import networkx
+from pymotifcounter import concretecounters
+from pymotifcounter.abstractcounter import PyMotifCounterBase
+from pymotifcounter.exceptions import PyMotifCounterError
+
+
+def orient(a_graph):
+    """
+    Returns a directed graph with each edge of an undirected graph, oriented as it is listed by ``edges()``.
+    """
+    directed_graph = networkx.DiGraph()
+    directed_graph.add_nodes_from(a_graph.nodes())
+    directed_graph.add_edges_from(a_graph.edges())
+    return directed_graph
+
+
+def scale_free_directed(n_nodes, seed):
+    """
+    Returns a directed scale-free graph without parallel edges or self loops.
+    """
+    a_graph = networkx.DiGraph(networkx.scale_free_graph(n_nodes, seed=seed))
+    a_graph.remove_edges_from(list(networkx.selfloop_edges(a_graph)))
+    return a_graph
+
+
+GRAPH_FAMILIES = {"erdos_renyi": lambda n, seed: networkx.gnp_random_graph(n, 4 / n, directed=True, seed=seed),
+                  "barabasi_albert": lambda n, seed: orient(networkx.barabasi_albert_graph(n, 2, seed=seed)),
+                  "watts_strogatz": lambda n, seed: orient(networkx.watts_strogatz_graph(n, 4, 0.1, seed=seed)),
+                  "scale_free_directed": scale_free_directed}
+
+
+def get_counters():
+    """
+    Returns an instance of each concrete counter whose binary is installed, by the name of its class.
+    """
+    counters = {}
+    for a_name, a_class in sorted(vars(concretecounters).items()):
+        # Base classes (e.g. of the native counters) are not counters
+        if isinstance(a_class, type) and issubclass(a_class, PyMotifCounterBase) and not a_name.endswith("Base"):
+            try:
+                counters[a_name] = a_class()
+            except PyMotifCounterError:
+                print(f"Skipping {a_name}, its binary is not installed.", file=sys.stderr)
+    return counters
+
+
+def benchmark(counter, a_graph, repeat):
+    """
+    Counts the motifs of a graph ``repeat`` times and returns the median time of each phase.
+    """
+    all_stats = [counter(a_graph).attrs["run_stats"] for _ in range(repeat)]
+    median_time = lambda phase: statistics.median(getattr(a_stats, phase) or 0.0 for a_stats in all_stats)
+    results = {a_phase: median_time(f"{a_phase}_time") for a_phase in ["transform", "io", "process", "parse",
+                                                                      "total"]}
+    results["overhead"] = statistics.median(a_stats.total_time - (a_stats.process_time or 0.0)
+                                            for a_stats in all_stats)
+    return results
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--counters", nargs="+", default=None,
+                            help="Class names of the counters to benchmark (Default: All that are installed)")
+    arg_parser.add_argument("--families", nargs="+", default=list(GRAPH_FAMILIES), choices=list(GRAPH_FAMILIES),
+                            help="Families of random graphs")
+    arg_parser.add_argument("--nodes", type=int, nargs="+", default=[100, 500], help="Number of nodes of the graphs")
+    arg_parser.add_argument("--motif-sizes", type=int, nargs="+", default=[3, 4], help="Motif sizes")
+    arg_parser.add_argument("--n-random", type=int, default=0, help="Number of random networks of each count")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Number of timing repetitions (median is reported)")
+    arg_parser.add_argument("--timeout", type=float, default=60, help="Timeout of each count (s)")
+    arg_parser.add_argument("--save", default=None, help="Saves the results to a JSON file")
+    arg_parser.add_argument("--compare", default=None, help="Compares the results to a JSON file of a previous run")
+    arg_parser.add_argument("--threshold", type=float, default=1.25,
+                            help="Largest ratio of overhead to that of --compare that is not a regression")
+    arg_parser.add_argument("--min-delta", type=float, default=0.002,
+                            help="Smallest increase of overhead (s) that can be a regression")
+    args = arg_parser.parse_args()
+
+    counters = get_counters()
+    if args.counters is not None:
+        counters = {a_name: counters[a_name] for a_name in args.counters if a_name in counters}
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare, "rt") as fd:
+            baseline = json.load(fd)
+
+    print(f"{'counter':<24}{'family':<21}{'nodes':>7}{'edges':>8}{'k':>3}{'binary (s)':>12}{'python (s)':>12}"
+          f"{'transform':>11}{'io':>9}{'parse':>9}{'python %':>10}{'vs base':>9}")
+    all_results = {}
+    regressions = []
+    for counter_name, counter in counters.items():
+        counter.timeout = args.timeout
+        if "n_random" in counter._parameters:
+            counter.get_parameter("n_random").value = args.n_random
+        # Counters without a motif size parameter run once per graph
+        motif_sizes = args.motif_sizes if "motif_size" in counter._parameters else [None]
+        for family_name in args.families:
+            for n_nodes in args.nodes:
+                a_graph = GRAPH_FAMILIES[family_name](n_nodes, 0)
+                for motif_size in motif_sizes:
+                    try:
+                        if motif_size is not None:
+                            counter.get_parameter("motif_size").value = motif_size
+                        results = benchmark(counter, a_graph, args.repeat)
+                    except PyMotifCounterError as e:
+                        print(f"Skipping {counter_name} {family_name} {n_nodes} {motif_size}: {e}", file=sys.stderr)
+                        continue
+
+                    benchmark_name = f"{counter_name}/{family_name}/{n_nodes}/{motif_size or '-'}"
+                    all_results[benchmark_name] = results
+                    versus_baseline = ""
+                    if benchmark_name in baseline:
+                        ratio = results["overhead"] / max(baseline[benchmark_name]["overhead"], 1e-9)
+                        versus_baseline = f"{ratio:.2f}x"
+                        if ratio > args.threshold and \
+                                results["overhead"] - baseline[benchmark_name]["overhead"] > args.min_delta:
+                            regressions.append(benchmark_name)
+                            versus_baseline += "!"
+                    print(f"{counter_name:<24}{family_name:<21}{n_nodes:>7}{a_graph.number_of_edges():>8}"
+                          f"{motif_size or '-':>3}{results['process']:>12.4f}{results['overhead']:>12.4f}"
+                          f"{results['transform']:>11.4f}{results['io']:>9.4f}{results['parse']:>9.4f}"
+                          f"{100 * results['overhead'] / results['total']:>9.1f}%{versus_baseline:>9}")
+
+    if args.save is not None:
+        with open(args.save, "wt") as fd:
+            json.dump(all_results, fd, indent=2)
+
+    if len(regressions) > 0:
+        print(f"Python overhead regressed in: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
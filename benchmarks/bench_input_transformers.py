@@ -0,0 +1,59 @@
+"""
+Benchmarks the throughput (edges / s) of the input transformers.
+
+Serialises random graphs with the per edge implementation that the input transformers used to have (one f-string per
+edge) and with the bulk NumPy implementation of ``PyMotifCounterInputTransformerBase``, from the networkx graph and
+from its ``(n_edges, 2)`` edge array.
+
+Usage:
+    python -m benchmarks.bench_input_transformers --edges 100000 1000000
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import argparse
+import itertools
+import timeit
+import numpy
+import networkx
+from pymotifcounter.concretecounters import (PyMotifCounterInputTransformerMfinder,
+                                             PyMotifCounterInputTransformerFanmod,
+                                             PyMotifCounterInputTransformerNetMODE,
+                                             PyMotifCounterInputTransformerPgd)
+
+
+def legacy_edge_list(a_graph, edge_format, with_header=False):
+    """
+    Serialises ``a_graph`` with one f-string per edge.
+    """
+    nodeid_to_num = dict(zip(a_graph.nodes(), range(1, a_graph.number_of_nodes() + 1)))
+    header = [f"{a_graph.number_of_nodes()+1}\n"] if with_header else []
+    return "".join(itertools.chain(header, (edge_format.format(nodeid_to_num[x[0]], nodeid_to_num[x[1]])
+                                            for x in networkx.to_edgelist(a_graph))))
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--edges", type=int, nargs="+", default=[100000, 1000000],
+                            help="Number of edges of the random graphs")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Number of timing repetitions (best is reported)")
+    args = arg_parser.parse_args()
+
+    benchmarks = [("mfinder", PyMotifCounterInputTransformerMfinder(), "{}\t{}\t1\n", False),
+                  ("fanmod", PyMotifCounterInputTransformerFanmod(), "{}\t{}\n", False),
+                  ("NetMODE", PyMotifCounterInputTransformerNetMODE(), "{}\t{}\n", True),
+                  ("pgd", PyMotifCounterInputTransformerPgd(), "{}, {}\n", False)]
+
+    print(f"{'backend':<10}{'edges':>10}{'per edge (edges/s)':>20}{'bulk (edges/s)':>16}{'speedup':>10}"
+          f"{'array (edges/s)':>17}{'speedup':>10}")
+    for n_edges in args.edges:
+        a_graph = networkx.gnm_random_graph(n_edges // 10, n_edges, directed=True, seed=0)
+        edges = numpy.array(list(a_graph.edges()))
+        for backend_name, transformer, edge_format, with_header in benchmarks:
+            t_legacy = min(timeit.repeat(lambda: legacy_edge_list(a_graph, edge_format, with_header),
+                                         number=1, repeat=args.repeat))
+            t_bulk = min(timeit.repeat(lambda: "".join(transformer(a_graph)), number=1, repeat=args.repeat))
+            t_array = min(timeit.repeat(lambda: "".join(transformer(edges)), number=1, repeat=args.repeat))
+            print(f"{backend_name:<10}{n_edges:>10}{n_edges / t_legacy:>20,.0f}{n_edges / t_bulk:>16,.0f}"
+                  f"{t_legacy / t_bulk:>9.1f}x{n_edges / t_array:>17,.0f}{t_legacy / t_array:>9.1f}x")
@@ -0,0 +1,88 @@
+"""
+Benchmarks the latency of counting many small graphs (the ego networks of a larger graph) one at a time.
+
+Compares the one-shot path (``counter(a_graph)``, which prepares its temporary files and parameters for every graph)
+with ``PyMotifCounterParallelExecutor.count()`` (whose workers are prepared once) and reports the throughput of
+``count_many()`` of the counter and of the executor.
+
+Usage:
+    python -m benchmarks.bench_latency --counters PyMotifCounterNetMODE --n-graphs 200 --workers 4
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import os
+import time
+import argparse
+import statistics
+import networkx
+from pymotifcounter.executors import PyMotifCounterParallelExecutor
+from .bench_counters import get_counters
+
+
+def ego_networks(n_nodes, n_graphs, radius, seed):
+    """
+    Returns the directed ego networks of the first ``n_graphs`` nodes of a scale-free graph.
+    """
+    a_graph = networkx.barabasi_albert_graph(n_nodes, 2, seed=seed).to_directed()
+    return [networkx.ego_graph(a_graph, a_node, radius=radius) for a_node in range(n_graphs)]
+
+
+def latencies(count, graphs):
+    """
+    Returns the time of counting each graph, one at a time.
+    """
+    all_latencies = []
+    for a_graph in graphs:
+        start_time = time.perf_counter()
+        count(a_graph)
+        all_latencies.append(time.perf_counter() - start_time)
+    return all_latencies
+
+
+def throughput(count_many, graphs):
+    """
+    Returns the number of graphs counted per second by a batch count.
+    """
+    start_time = time.perf_counter()
+    count_many(graphs)
+    return len(graphs) / (time.perf_counter() - start_time)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--counters", nargs="+", default=None,
+                            help="Class names of the counters to benchmark (Default: All that are installed)")
+    arg_parser.add_argument("--nodes", type=int, default=1000, help="Number of nodes of the graph of the egos")
+    arg_parser.add_argument("--n-graphs", type=int, default=200, help="Number of ego networks")
+    arg_parser.add_argument("--radius", type=int, default=1, help="Radius of the ego networks")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="Number of workers of the executor")
+    args = arg_parser.parse_args()
+
+    graphs = ego_networks(args.nodes, args.n_graphs, args.radius, 0)
+    print(f"{len(graphs)} ego networks of {statistics.mean(g.number_of_nodes() for g in graphs):.1f} nodes and "
+          f"{statistics.mean(g.number_of_edges() for g in graphs):.1f} edges on average, {args.workers} workers")
+    print(f"{'counter':<32}{'one-shot (ms)':>15}{'p95':>8}{'executor (ms)':>15}{'p95':>8}"
+          f"{'count_many':>12}{'executor':>10}   (graphs / s)")
+
+    counters = get_counters()
+    if args.counters is not None:
+        counters = {a_name: counters[a_name] for a_name in args.counters if a_name in counters}
+    for counter_name, counter in counters.items():
+        # Warm up the parser and the file system cache of the binary
+        counter(graphs[0])
+        one_shot = latencies(counter, graphs)
+        with PyMotifCounterParallelExecutor(counter, n_workers=args.workers) as executor:
+            # Prepare the workers
+            for a_graph in graphs[:args.workers]:
+                executor.count(a_graph)
+            executed = latencies(executor.count, graphs)
+            executor_many = throughput(executor.count_many, graphs)
+        count_many = throughput(counter.count_many, graphs)
+
+        quantiles = lambda x: (1000 * statistics.median(x), 1000 * statistics.quantiles(x, n=20)[-1])
+        print(f"{counter_name:<32}{quantiles(one_shot)[0]:>15.2f}{quantiles(one_shot)[1]:>8.2f}"
+              f"{quantiles(executed)[0]:>15.2f}{quantiles(executed)[1]:>8.2f}"
+              f"{count_many:>12.1f}{executor_many:>10.1f}")
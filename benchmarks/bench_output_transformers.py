@@ -0,0 +1,94 @@
+"""
+Benchmarks the conversion of parsed motif counter outputs to pandas DataFrames.
+
+Compares the cell-by-cell DataFrame filling that the output transformers used to perform to the columnar
+construction of ``PyMotifCounterOutputTransformerBase._to_dataframe()``, over large synthetic outputs.
+
+Usage:
+    python -m benchmarks.bench_output_transformers --rows 1000 5000
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import argparse
+import random
+import timeit
+import pandas
+from pymotifcounter.concretecounters import (PyMotifCounterOutputTransformerMfinder,
+                                             PyMotifCounterOutputTransformerFanmod,
+                                             PyMotifCounterOutputTransformerNetMODE)
+
+
+def synthetic_mfinder_output(n_rows, seed=42):
+    rnd = random.Random(seed)
+    rows = "\n\n".join(f"{k}\t{rnd.randint(0, 5000)}\t{rnd.uniform(0, 5000):.1f}+-{rnd.uniform(0, 50):.1f}\t"
+                       f"{rnd.uniform(-10, 10):.2f}\t{rnd.random():.3f}\t{rnd.uniform(0, 1000):.2f}\t"
+                       f"{rnd.randint(0, 200)}" for k in range(n_rows))
+    return f"Full list of subgraphs size 5 ids:\n\nMOTIF\tNREAL\tNRAND\n{rows}\n\n"
+
+
+def synthetic_fanmod_output(n_rows, seed=42):
+    rnd = random.Random(seed)
+    rows = "\n\n".join(f"{k},00110,{rnd.uniform(0, 100):.3f}%,{rnd.uniform(0, 100):.3f}%,{rnd.random():.5f},"
+                       f"{rnd.uniform(-10, 10):.2f},{rnd.random():.3f}\n,01101\n,10010\n,01001\n,10010"
+                       for k in range(n_rows))
+    return f"Result overview:\n\nID,Adj-Matrix,Frequency,Mean-Freq,Standard-Dev,Z-Score,p-Value\n\n{rows}\n\n"
+
+
+def synthetic_netmode_output(n_rows, seed=42):
+    rnd = random.Random(seed)
+    rows = "\n".join(f"gID: {k}  freq: {rnd.randint(0, 5000)}  ave_rand_freq: {rnd.uniform(0, 5000):.3f} "
+                     f"(sd: {rnd.uniform(0, 50):.3f})  conc: {rnd.random():.5f}  ave_rand_conc: {rnd.random():.5f} "
+                     f"(sd: {rnd.random():.5f})  f-ZScore: {rnd.uniform(-10, 10):.3f}  f-pValue: {rnd.random():.3f}  "
+                     f"c-ZScore: {rnd.uniform(-10, 10):.3f}  c-pValue: {rnd.random():.3f}" for k in range(n_rows))
+    return f"calc Z-Score\n{rows}\n"
+
+
+def legacy_fill(column_data):
+    """
+    Reproduces the cell-by-cell DataFrame construction that the output transformers used to perform.
+    """
+    df_output = pandas.DataFrame(columns=list(column_data.keys()), index=None)
+    n_rows = len(next(iter(column_data.values())))
+    for a_row_idx in range(n_rows):
+        for a_column, a_column_values in column_data.items():
+            df_output.at[a_row_idx, a_column] = a_column_values[a_row_idx]
+    return df_output
+
+
+def get_column_data(transformer, str_data):
+    """
+    Parses ``str_data`` once and returns the columnar data that both DataFrame construction methods start from.
+    """
+    if isinstance(transformer, PyMotifCounterOutputTransformerNetMODE):
+        rows = transformer._get_cached_parser().parseString(str_data)["zscore"]
+        column_data = transformer._rows_to_columns(rows, ["gID", "freq", "conc", "f-ZScore", "f-pValue",
+                                                          "c-ZScore", "c-pValue"])
+        column_data.update({"ave_rand_freq": [a_row["ave_rand_freq"]["ave_rand_freq"] for a_row in rows],
+                            "ave_rand_conc": [a_row["ave_rand_conc"]["ave_rand_conc"] for a_row in rows],
+                            "ave_rand_freq_sd": [a_row["ave_rand_freq"]["sd"] for a_row in rows],
+                            "ave_rand_conc_sd": [a_row["ave_rand_conc"]["sd"] for a_row in rows]})
+        return column_data
+    return transformer._rows_to_columns(transformer._get_cached_parser().searchString(str_data)[0]["enumeration"])
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000],
+                            help="Number of rows of the synthetic outputs")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Number of timing repetitions (best is reported)")
+    args = arg_parser.parse_args()
+
+    benchmarks = [("mfinder", PyMotifCounterOutputTransformerMfinder(), synthetic_mfinder_output),
+                  ("fanmod", PyMotifCounterOutputTransformerFanmod(), synthetic_fanmod_output),
+                  ("NetMODE", PyMotifCounterOutputTransformerNetMODE(), synthetic_netmode_output)]
+
+    print(f"{'backend':<10}{'rows':>8}{'legacy (s)':>14}{'columnar (s)':>14}{'speedup':>10}")
+    for backend_name, transformer, output_generator in benchmarks:
+        for n_rows in args.rows:
+            column_data = get_column_data(transformer, output_generator(n_rows))
+            t_legacy = min(timeit.repeat(lambda: legacy_fill(column_data), number=1, repeat=args.repeat))
+            t_columnar = min(timeit.repeat(lambda: transformer._to_dataframe(column_data), number=1,
+                                           repeat=args.repeat))
+            print(f"{backend_name:<10}{n_rows:>8}{t_legacy:>14.4f}{t_columnar:>14.4f}{t_legacy / t_columnar:>9.0f}x")
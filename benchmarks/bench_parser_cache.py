@@ -0,0 +1,61 @@
+"""
+Benchmarks the per-call saving of building the pyparsing grammars once per process.
+
+Parses the small output of a size-3 count (as returned for a small ego-network) with a grammar that is rebuilt on
+every call and with the grammar cached by ``PyMotifCounterOutputTransformerBase._get_cached_parser()``.
+
+Usage:
+    python -m benchmarks.bench_parser_cache --calls 1000
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import argparse
+import timeit
+from pymotifcounter.concretecounters import (PyMotifCounterOutputTransformerMfinder,
+                                             PyMotifCounterOutputTransformerFanmod,
+                                             PyMotifCounterOutputTransformerNetMODE)
+from .bench_output_transformers import (synthetic_mfinder_output,
+                                        synthetic_fanmod_output,
+                                        synthetic_netmode_output)
+
+
+def parse_uncached(transformer, str_data):
+    """
+    Parses ``str_data`` with the pyparsing engine, building the grammar first (as every call used to).
+    """
+    parser = transformer._get_parser()
+    if isinstance(transformer, PyMotifCounterOutputTransformerNetMODE):
+        return parser.parseString(str_data)
+    return parser.searchString(str_data)
+
+
+def parse_cached(transformer, str_data):
+    """
+    Parses ``str_data`` with the pyparsing engine, using the cached grammar.
+    """
+    parser = transformer._get_cached_parser()
+    if isinstance(transformer, PyMotifCounterOutputTransformerNetMODE):
+        return parser.parseString(str_data)
+    return parser.searchString(str_data)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--calls", type=int, default=1000, help="Number of calls to time")
+    arg_parser.add_argument("--rows", type=int, default=13, help="Number of rows of each output")
+    args = arg_parser.parse_args()
+
+    benchmarks = [("mfinder", PyMotifCounterOutputTransformerMfinder(engine="pyparsing"), synthetic_mfinder_output),
+                  ("fanmod", PyMotifCounterOutputTransformerFanmod(engine="pyparsing"), synthetic_fanmod_output),
+                  ("NetMODE", PyMotifCounterOutputTransformerNetMODE(engine="pyparsing"), synthetic_netmode_output)]
+
+    print(f"{'backend':<10}{'uncached (us/call)':>20}{'cached (us/call)':>18}{'saving (us/call)':>18}")
+    for backend_name, transformer, output_generator in benchmarks:
+        str_data = output_generator(args.rows)
+        # Warm up the cache, the one-off construction is not part of the per-call cost.
+        transformer._get_cached_parser()
+        t_uncached = timeit.timeit(lambda: parse_uncached(transformer, str_data), number=args.calls) / args.calls
+        t_cached = timeit.timeit(lambda: parse_cached(transformer, str_data), number=args.calls) / args.calls
+        print(f"{backend_name:<10}{t_uncached * 1e6:>20.1f}{t_cached * 1e6:>18.1f}{(t_uncached - t_cached) * 1e6:>18.1f}")
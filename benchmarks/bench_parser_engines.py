@@ -0,0 +1,40 @@
+"""
+Benchmarks the fast (regular expression) and pyparsing engines of the output transformers.
+
+Usage:
+    python -m benchmarks.bench_parser_engines --rows 1000 5000
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import argparse
+import timeit
+from pymotifcounter.concretecounters import (PyMotifCounterOutputTransformerMfinder,
+                                             PyMotifCounterOutputTransformerFanmod,
+                                             PyMotifCounterOutputTransformerNetMODE)
+from .bench_output_transformers import (synthetic_mfinder_output,
+                                        synthetic_fanmod_output,
+                                        synthetic_netmode_output)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000],
+                            help="Number of rows of the synthetic outputs")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Number of timing repetitions (best is reported)")
+    args = arg_parser.parse_args()
+
+    benchmarks = [("mfinder", PyMotifCounterOutputTransformerMfinder, synthetic_mfinder_output),
+                  ("fanmod", PyMotifCounterOutputTransformerFanmod, synthetic_fanmod_output),
+                  ("NetMODE", PyMotifCounterOutputTransformerNetMODE, synthetic_netmode_output)]
+
+    print(f"{'backend':<10}{'rows':>8}{'pyparsing (s)':>16}{'fast (s)':>12}{'speedup':>10}")
+    for backend_name, transformer_class, output_generator in benchmarks:
+        for n_rows in args.rows:
+            str_data = output_generator(n_rows)
+            grammar_transformer = transformer_class(engine="pyparsing")
+            fast_transformer = transformer_class(engine="fast")
+            t_grammar = min(timeit.repeat(lambda: grammar_transformer(str_data, None), number=1, repeat=args.repeat))
+            t_fast = min(timeit.repeat(lambda: fast_transformer(str_data, None), number=1, repeat=args.repeat))
+            print(f"{backend_name:<10}{n_rows:>8}{t_grammar:>16.4f}{t_fast:>12.4f}{t_grammar / t_fast:>9.0f}x")
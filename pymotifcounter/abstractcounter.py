@@ -7,21 +7,317 @@ Base objects outlining the functionality of PyMotifCounter
 """
 
 import os
+import sys
+import copy
+import time
 import types
+import signal
+import hashlib
+import warnings
+import asyncio
+import itertools
+import threading
 import subprocess
+import numpy
 import pandas
 
 from .parameters import *
 import tempfile
 import shutil
 from .exceptions import *
+from .cache import *
+from .runstats import *
+from .util import load_edge_file
 from functools import reduce
 
+# The directory that the scratch directories of counts are created in, if it is not set per counter
+_SCRATCH_DIR_VARIABLE = "PYMOTIFCOUNTER_SCRATCH_DIR"
+
+
+def get_default_scratch_dir():
+    """
+    Returns the directory that the private scratch directories of counts (and prepared graphs) are created in.
+
+    Notes:
+        * This is the ``PYMOTIFCOUNTER_SCRATCH_DIR`` environment variable if it is set, otherwise None, the default
+          temporary directory of ``tempfile``.
+        * Pointing it to a memory backed tmpfs (e.g. ``/dev/shm`` on Linux) saves the disk io of the input and output
+          files of processes, but those files (about the size of the graph and of the output of a count) then occupy
+          memory. It is therefore opt-in, rather than the default, as it does not suit graphs that are counted from
+          on-disk edge files because they do not fit in memory.
+
+    :rtype: str
+    """
+    return os.environ.get(_SCRATCH_DIR_VARIABLE) or None
+
+
+def _make_scratch_dir(scratch_dir=None):
+    """
+    Creates a private scratch directory within ``scratch_dir`` (Default: ``get_default_scratch_dir()``).
+
+    :rtype: str
+    """
+    return tempfile.mkdtemp(prefix="pymotifcounter_", dir=scratch_dir or get_default_scratch_dir())
+
+
+def _remove_scratch_dir(a_dir):
+    """
+    Removes a scratch directory and everything in it.
+
+    Notes:
+        * The directory is first renamed, so that its path disappears at once rather than file by file (and is
+          free to be re-used) even if a process that ran in it left files behind.
+    """
+    removed_dir = f"{a_dir}.removed"
+    try:
+        os.rename(a_dir, removed_dir)
+    except OSError:
+        removed_dir = a_dir
+    shutil.rmtree(removed_dir, ignore_errors=True)
+
+
+def _iter_file_blocks(file_path, block_size, mode="rt"):
+    """
+    Returns a generator of the blocks of ``block_size`` characters (or bytes) of a file.
+    """
+    with open(file_path, mode) as fd:
+        for a_block in iter(lambda: fd.read(block_size), fd.read(0)):
+            yield a_block
+
+
+def _read_stream(a_stream, outputs, a_name):
+    """
+    Reads a stream of a process until it is closed, setting its contents to ``outputs[a_name]``.
+    """
+    with a_stream:
+        outputs[a_name] = a_stream.read()
+
+
+def _reap_process(pid, exit_status):
+    """
+    Waits for a process to exit and reaps it, appending its exit code and resource usage to ``exit_status``.
+
+    Notes:
+        * As for ``subprocess.Popen``, a process that was reaped elsewhere is considered to have exited with 0. Its
+          resource usage is None.
+    """
+    try:
+        _, status, rusage = os.wait4(pid, 0)
+    except ChildProcessError:
+        exit_status.extend((0, None))
+        return
+    exit_status.extend((os.waitstatus_to_exitcode(status), rusage))
+
 
 class PyMotifCounterOutputTransformerBase:
     """
     Transforms the output of a motif counter to a computable object (usually a pandas DataFrame).
+
+    Notes:
+        * Concrete transformers describe the DataFrame they return via ``_columns``, a dictionary that maps each
+          column name to its data type, in the order the columns should appear in the result.
+        * Outputs can be parsed by two engines:
+            * ``pyparsing``, a validating parser built from the grammar returned by ``_get_parser()``. Grammars are
+              built once per process and shared by all instances of a transformer (see ``_get_cached_parser()``).
+            * ``fast``, a compiled regular expression scan of the output's table (where a concrete transformer
+              provides one). If the fast engine cannot account for every row of the table, the output is handed
+              over to the ``pyparsing`` engine.
     """
+    _columns = {}
+    # The column that identifies each motif and, for each column of counts, the columns of the mean, standard deviation,
+    # z-score and p-value of the counts over random networks (see ``nullmodel.PyMotifCounterNullModel``)
+    _id_column = None
+    _random_stats_columns = {}
+    # Standard numeric tokens, matching the ones recognised by the pyparsing grammars
+    _float_pattern = r"[+-]?(?:nan|[0-9]*\.[0-9]+)"
+    _int_pattern = r"[0-9]+"
+    # Grammars already built, per transformer class
+    _parser_cache = {}
+    _parser_cache_lock = threading.Lock()
+
+    def __init__(self, engine="fast"):
+        """
+        Initialises an output transformer.
+
+        :param engine: The parsing engine to use, one of ``fast, pyparsing`` (Default: ``fast``)
+        :type engine: str
+        """
+        self._engine = None
+        self.engine = engine
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @engine.setter
+    def engine(self, new_engine):
+        if new_engine not in ("fast", "pyparsing"):
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Parser engine {new_engine} should be one of "
+                                      f"fast, pyparsing.")
+        self._engine = new_engine
+
+    def _scan_table(self, str_data, row_regex, column_names, anchored=False):
+        """
+        Scans the first table of ``str_data`` whose rows are matched by ``row_regex``.
+
+        Notes:
+            * The matched rows must form one contiguous block, as they would for the ``pyparsing`` grammars. If
+              anything other than whitespace interrupts the block, the table is not accounted for by the fast engine.
+
+        :param str_data: The data holding the information to parse
+        :type str_data: str
+        :param row_regex: A compiled regular expression with one group per column that matches one row of the table.
+        :type row_regex: re.Pattern
+        :param column_names: The column that each group of ``row_regex`` is assigned to.
+        :type column_names: list
+        :param anchored: Whether the table must begin at the start of ``str_data`` (Default: False)
+        :type anchored: bool
+        :returns: A dictionary of column name to array of (string) values or None if the table could not be scanned.
+        :rtype: dict
+        """
+        row_matches = list(row_regex.finditer(str_data))
+        if len(row_matches) == 0:
+            return None
+        if anchored and str_data[:row_matches[0].start()].strip() != "":
+            return None
+        table_span = str_data[row_matches[0].start():row_matches[-1].end()]
+        if row_regex.sub("", table_span).strip() != "":
+            return None
+        return self._matches_to_columns([a_match.groups("") for a_match in row_matches], column_names)
+
+    def _matches_to_columns(self, matches, column_names):
+        """
+        Transposes the groups matched by the fast engine's regular expression to columnar form.
+
+        :param matches: A list of tuples as returned by ``re.findall()``
+        :type matches: list
+        :param column_names: The column that each matched group is assigned to.
+        :type column_names: list
+        :returns: A dictionary of column name to array of (string) values.
+        :rtype: dict
+        """
+        str_table = numpy.array(matches, dtype=str).reshape((len(matches), len(column_names)))
+        return {a_column: str_table[:, a_column_idx] for a_column_idx, a_column in enumerate(column_names)}
+
+    @staticmethod
+    def _get_parser():
+        """
+        Builds the grammar that parses the output of a given motif counter.
+
+        :return: The top level element of a PyParsing parser that handles the extraction of the useful data.
+        :rtype: pyparsing.ParserElement
+        """
+        return None
+
+    @classmethod
+    def _get_cached_parser(cls):
+        """
+        Returns the grammar of this transformer, building it only once per process.
+
+        Notes:
+            * The grammar is streamlined before it is shared, so that parsing does not modify it. This allows the same
+              grammar to be used concurrently by multiple threads.
+            * Packrat parsing is not enabled, it is a process-wide ``pyparsing`` setting and it slows these grammars
+              down rather than speeding them up.
+
+        :return: See ``_get_parser()``
+        :rtype: pyparsing.ParserElement
+        """
+        parser = cls._parser_cache.get(cls)
+        if parser is None:
+            with cls._parser_cache_lock:
+                parser = cls._parser_cache.get(cls)
+                if parser is None:
+                    parser = cls._get_parser()
+                    if parser is not None:
+                        parser.streamline()
+                    cls._parser_cache[cls] = parser
+        return parser
+
+    def _get_enumeration(self, parsed_output):
+        """
+        Returns the rows of the enumeration found by ``searchString()`` of a grammar that names it ``enumeration``.
+
+        :param parsed_output: The result of ``searchString()``.
+        :type parsed_output: pyparsing.ParseResults
+        :returns: The parsed rows of the enumeration.
+        :rtype: pyparsing.ParseResults
+        :raises: PyMotifCounterError if the output does not contain the enumeration.
+        """
+        # TODO: LOW, Revise the parsers so that they only have one root level.
+        if len(parsed_output) == 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Output could not be parsed, it does not contain "
+                                      f"an enumeration.")
+        return parsed_output[0]["enumeration"]
+
+    def _rows_to_columns(self, rows, column_names=None):
+        """
+        Transposes a sequence of parsed rows to columnar form.
+
+        Notes:
+            * Columns that are missing from the first row are considered to be absent from the output altogether
+              (for example, the random network statistics of a count without random networks).
+
+        :param rows: A sequence of dict-like rows (e.g. ``pyparsing.ParseResults``)
+        :type rows: list
+        :param column_names: The names of the columns to extract from each row (Default: All columns in ``_columns``)
+        :type column_names: list
+        :returns: A dictionary of column name to list of values.
+        :rtype: dict
+        """
+        if column_names is None:
+            column_names = list(self._columns.keys())
+        if len(rows) > 0:
+            column_names = [a_column for a_column in column_names if a_column in rows[0]]
+        return {a_column: [a_row[a_column] for a_row in rows] for a_column in column_names}
+
+    def _to_dataframe(self, column_data):
+        """
+        Builds a DataFrame of results in one step from columnar data.
+
+        Notes:
+            * Each column is converted to the data type declared for it in ``_columns``. Integer columns whose values
+              exceed the ``int64`` range are retained as Python integers (``object``), whether they were parsed as
+              strings (fast engine) or as integers (``pyparsing`` engine).
+
+        :param column_data: A dictionary of column name to sequence of values.
+        :type column_data: dict
+        :returns: A DataFrame with one column per key of ``column_data``, ordered as in ``_columns``.
+        :rtype: pandas.DataFrame
+        """
+        df_data = {}
+        for a_column, a_dtype in self._columns.items():
+            if a_column not in column_data:
+                continue
+            try:
+                df_data[a_column] = numpy.asarray(column_data[a_column], dtype=a_dtype)
+            except OverflowError:
+                df_data[a_column] = numpy.asarray([int(a_value) for a_value in column_data[a_column]], dtype=object)
+        return pandas.DataFrame(df_data)
+
+    def _parse_fast(self, str_data):
+        """
+        Parses the output with the fast engine.
+
+        :param str_data: The data holding the information to parse
+        :type str_data: str
+        :returns: A dictionary of column name to values or None if the output should be handled by the ``pyparsing``
+                  engine.
+        :rtype: dict
+        """
+        return None
+
+    def _parse_grammar(self, str_data):
+        """
+        Parses the output with the ``pyparsing`` engine.
+
+        :param str_data: The data holding the information to parse
+        :type str_data: str
+        :returns: A dictionary of column name to values.
+        :rtype: dict
+        """
+        return {}
+
     def __call__(self, str_data, ctx=None):
         """
         Actually performs the conversion and returns a dataframe of results.
@@ -34,7 +330,12 @@ class PyMotifCounterOutputTransformerBase:
         :returns: Computable form of the motif count data.
         :rtype: pandas.DataFrame
         """
-        return None
+        column_data = None
+        if self._engine == "fast":
+            column_data = self._parse_fast(str_data)
+        if column_data is None:
+            column_data = self._parse_grammar(str_data)
+        return self._to_dataframe(column_data)
 
     def from_file(self, file_path, ctx=None):
         """
@@ -55,16 +356,167 @@ class PyMotifCounterOutputTransformerBase:
 class PyMotifCounterInputTransformerBase:
     """
     Transforms any given networkx graph to the representation expected by a given motif counting algorithm.
+
+    Notes:
+        * Most algorithms expect an edge list of numeric node ids. Transformers of such algorithms only have to
+          declare the ``printf`` style format of each edge (``_edge_format``) and, optionally, a header
+          (``_get_header()``). The edge list is then produced in bulk, from an integer array of edges.
+        * Such transformers also accept graphs that are not ``networkx`` graphs, without converting them to
+          ``networkx`` (see ``_get_edge_array()``).
     """
+    # The format of each edge, applied to its source and target node ids (None if __call__ is overridden)
+    _edge_format = None
+    # The number of edges that are formatted at once
+    _block_size = 8192
+
+    def _get_edge_array(self, a_graph):
+        """
+        Returns the edges of a graph as an array of node indices.
+
+        Notes:
+            * Nodes are indexed from 0 and graphs can be:
+                * ``networkx`` graphs: Nodes are indexed in the order of ``a_graph.nodes()`` and edges are in the
+                  order of ``a_graph.edges()``.
+                * ``(n_edges, 2)`` integer ``numpy`` arrays of node indices: The graph has ``max(index) + 1`` nodes
+                  and edges are in the order of the rows.
+                * ``scipy.sparse`` adjacency matrices: Each non-zero element ``(i, j)`` is an edge from node ``i`` to
+                  node ``j``, in row major order (undirected graphs are expected as their upper triangle, e.g. via
+                  ``scipy.sparse.triu()``).
+                * ``pandas`` DataFrames with ``source, target`` columns of node ids of any type (as returned by
+                  ``networkx.to_pandas_edgelist()``): Nodes are indexed in the order in which they first appear (as
+                  ``networkx.from_pandas_edgelist()`` does) and edges are in the order of the rows.
+                * Paths of on-disk edge files (``.npy`` or raw ``int32`` files, see ``util.load_edge_file()``): As
+                  ``numpy`` arrays, but edges are memory mapped rather than loaded in memory.
+
+        :param a_graph: The graph to be analysed.
+        :type a_graph: <<networkx.Graph>>, numpy.ndarray, scipy.sparse.sparray, pandas.DataFrame, str
+        :returns: An ``(n_edges, 2)`` array of source and target node indices and the number of nodes.
+        :rtype: tuple(numpy.ndarray, int)
+        :raises: TypeError if the type of the graph is not supported, PyMotifCounterError if its structure is invalid.
+        """
+        if isinstance(a_graph, (str, os.PathLike)):
+            return self._get_ndarray_edge_array(load_edge_file(a_graph))
+        if isinstance(a_graph, numpy.ndarray):
+            return self._get_ndarray_edge_array(a_graph)
+        if isinstance(a_graph, pandas.DataFrame):
+            return self._get_dataframe_edge_array(a_graph)
+        # scipy is only imported by the caller, if it uses sparse matrices
+        scipy_sparse = sys.modules.get("scipy.sparse")
+        if scipy_sparse is not None and scipy_sparse.issparse(a_graph):
+            return self._get_sparse_edge_array(a_graph)
+        if hasattr(a_graph, "adj") and hasattr(a_graph, "is_directed"):
+            return self._get_networkx_edge_array(a_graph)
+        raise TypeError(f"{self.__class__.__name__}::Unsupported graph type {type(a_graph)}")
+
+    def _get_networkx_edge_array(self, a_graph):
+        """
+        Returns the edges of a ``networkx`` graph (see ``_get_edge_array()``).
+
+        Notes:
+            * Rather than iterating over the edges, the adjacency of each node is mapped to node indices in bulk. The
+              edges of undirected graphs are reported from the node that comes first, as ``a_graph.edges()`` does.
+        """
+        nodeid_to_num = dict(zip(a_graph.nodes(), range(a_graph.number_of_nodes())))
+        if a_graph.is_multigraph():
+            return (numpy.fromiter(map(nodeid_to_num.__getitem__, itertools.chain.from_iterable(a_graph.edges())),
+                                   dtype=numpy.int64,
+                                   count=2 * a_graph.number_of_edges()).reshape(-1, 2),
+                    a_graph.number_of_nodes())
+
+        adjacency = a_graph.adj
+        degrees = numpy.fromiter(map(len, adjacency.values()), dtype=numpy.int64, count=len(adjacency))
+        sources = numpy.repeat(numpy.fromiter(map(nodeid_to_num.__getitem__, adjacency.keys()),
+                                              dtype=numpy.int64,
+                                              count=len(adjacency)),
+                               degrees)
+        targets = numpy.fromiter(map(nodeid_to_num.__getitem__, itertools.chain.from_iterable(adjacency.values())),
+                                 dtype=numpy.int64,
+                                 count=len(sources))
+        if not a_graph.is_directed():
+            is_first = targets >= sources
+            sources, targets = sources[is_first], targets[is_first]
+        return numpy.column_stack((sources, targets)), a_graph.number_of_nodes()
+
+    def _get_ndarray_edge_array(self, edges):
+        """
+        Validates an ``(n_edges, 2)`` array of node indices (see ``_get_edge_array()``).
+
+        Notes:
+            * The array is not copied, so that memory mapped arrays are read in blocks as they are formatted. The
+              range of node indices is also determined in blocks.
+        """
+        if edges.ndim != 2 or edges.shape[1] != 2 or not numpy.issubdtype(edges.dtype, numpy.integer):
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Edge arrays should be (n_edges, 2) integer "
+                                      f"arrays, received {edges.shape} {edges.dtype} array")
+        min_index, max_index = 0, -1
+        for block_start in range(0, len(edges), self._block_size * 128):
+            block = edges[block_start:block_start + self._block_size * 128]
+            min_index, max_index = min(min_index, int(block.min())), max(max_index, int(block.max()))
+        if min_index < 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Edge arrays should contain node indices >= 0")
+        return edges, max_index + 1
+
+    def _get_sparse_edge_array(self, adj_mat):
+        """
+        Returns the edges of a ``scipy.sparse`` adjacency matrix in row major order (see ``_get_edge_array()``).
+        """
+        if adj_mat.ndim != 2 or adj_mat.shape[0] != adj_mat.shape[1]:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Adjacency matrices should be square, received "
+                                      f"{adj_mat.shape} matrix")
+        adj_mat = adj_mat.tocsr(copy=True)
+        adj_mat.eliminate_zeros()
+        adj_mat.sort_indices()
+        sources = numpy.repeat(numpy.arange(adj_mat.shape[0], dtype=numpy.int64), numpy.diff(adj_mat.indptr))
+        return numpy.column_stack((sources, adj_mat.indices.astype(numpy.int64))), adj_mat.shape[0]
+
+    def _get_dataframe_edge_array(self, edges_df):
+        """
+        Returns the edges of a DataFrame with ``source, target`` columns (see ``_get_edge_array()``).
+        """
+        if "source" not in edges_df.columns or "target" not in edges_df.columns:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Edge DataFrames should have source, target "
+                                      f"columns, received {list(edges_df.columns)}")
+        node_indices, node_ids = pandas.factorize(edges_df[["source", "target"]].to_numpy().ravel())
+        return node_indices.astype(numpy.int64, copy=False).reshape(-1, 2), len(node_ids)
+
+    def _get_header(self, n_nodes):
+        """
+        Returns any text that precedes the edge list.
+
+        :param n_nodes: The number of nodes of the graph.
+        :type n_nodes: int
+        :rtype: str
+        """
+        return ""
+
+    def _format_edges(self, edges):
+        """
+        Formats an array of edges to text, in blocks of ``_block_size`` edges.
+
+        Notes:
+            * Node indices are written as node ids that start from 1.
+
+        :param edges: An ``(n_edges, 2)`` array of source and target node indices.
+        :type edges: numpy.ndarray
+        :returns: A generator of the text of each block of edges.
+        """
+        for block_start in range(0, len(edges), self._block_size):
+            block = numpy.asarray(edges[block_start:block_start + self._block_size], dtype=numpy.int64) + 1
+            yield (self._edge_format * len(block)) % tuple(block.ravel().tolist())
+
     def __call__(self, a_graph):
         """
-        Returns a generator of the representation of each edge of a_graph.
+        Returns a generator of the representation of a_graph.
 
-        :param a_graph: A ``networkx`` graph object to be analysed.
-        :type a_graph: <<networkx.Graph>>
-        :returns:
+        :param a_graph: The graph to be analysed (see ``_get_edge_array()`` for the supported types).
+        :type a_graph: <<networkx.Graph>>, numpy.ndarray, scipy.sparse.sparray, pandas.DataFrame
+        :returns: A generator of strings that, concatenated, form the representation of a_graph.
         """
-        return None
+        if self._edge_format is None:
+            return None
+        edges, n_nodes = self._get_edge_array(a_graph)
+        header = self._get_header(n_nodes)
+        return itertools.chain([header] if header != "" else [], self._format_edges(edges))
 
     def to_file(self, a_graph, file_path):
         """
@@ -82,11 +534,110 @@ class PyMotifCounterInputTransformerBase:
                 fd.write(a_line)
 
 
+class PyMotifCounterPreparedGraph:
+    """
+    A graph that is transformed to the input representation of each counter once and re-used by any number of counts.
+
+    Notes:
+        * The representation of the graph is produced by the input transformer of the first counter that uses it
+          and is held in a file that is shared by all counters whose input transformers are of the same class (i.e.
+          that expect the same input format).
+        * Counts over a prepared graph pass its file directly to processes that read their input from a file and
+          stream it to processes that read their input from stdin.
+        * Prepared graphs should be closed (or used as context managers) to remove their files. They can not be
+          counted once they are closed.
+
+    Example:
+        ::
+
+            with PyMotifCounterPreparedGraph(a_graph) as prepared_graph:
+                counter = PyMotifCounterMfinder()
+                for motif_size in range(3, 5):
+                    counter.get_parameter("motif_size").value = motif_size
+                    motif_counts = counter(prepared_graph)
+    """
+    # The size of the blocks in which the file of a graph is streamed to stdin
+    _read_block_size = 64 * 1024
+
+    def __init__(self, a_graph, scratch_dir=None):
+        """
+        Initialises a prepared graph.
+
+        :param a_graph: The graph to prepare (see ``PyMotifCounterInputTransformerBase._get_edge_array()`` for the
+                        types that are supported besides ``networkx`` graphs).
+        :type a_graph: <<networkx.Graph>>
+        :param scratch_dir: The directory that the files of the graph are created in (Default: None, see
+                            ``get_default_scratch_dir()``)
+        :type scratch_dir: str
+        """
+        self._graph = a_graph
+        self._tmp_dir = _make_scratch_dir(scratch_dir)
+        self._lock = threading.Lock()
+        # Input transformer class -> file of the transformed graph
+        self._files = {}
+
+    @property
+    def graph(self):
+        return self._graph
+
+    @property
+    def closed(self):
+        return self._tmp_dir is None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_file(self, input_transformer):
+        """
+        Returns the file that holds the graph in the representation of an input transformer, creating it if required.
+
+        :param input_transformer: The input transformer of a counter.
+        :type input_transformer: PyMotifCounterInputTransformerBase
+        :returns: The path of the file.
+        :rtype: str
+        :raises: PyMotifCounterError if the prepared graph is closed.
+        """
+        with self._lock:
+            if self._tmp_dir is None:
+                raise PyMotifCounterError(f"{self.__class__.__name__}::The prepared graph is closed.")
+            transformer_class = type(input_transformer)
+            if transformer_class not in self._files:
+                file_path = os.path.join(self._tmp_dir, f"input_{len(self._files)}")
+                input_transformer.to_file(self._graph, file_path)
+                self._files[transformer_class] = file_path
+            return self._files[transformer_class]
+
+    def iter_file(self, input_transformer):
+        """
+        Returns a generator of the blocks of the file that holds the graph in the representation of an input
+        transformer (see ``get_file()``).
+        """
+        return _iter_file_blocks(self.get_file(input_transformer), self._read_block_size)
+
+    def close(self):
+        """
+        Removes the files of the prepared graph.
+        """
+        with self._lock:
+            tmp_dir, self._tmp_dir = self._tmp_dir, None
+            self._files = {}
+        if tmp_dir is not None:
+            _remove_scratch_dir(tmp_dir)
+
+
 class PyMotifCounterBase:
     """
     Represents an external motif counting process.
     """
-    
+    # The (approximate) size of the chunks in which input is written to the stdin of a process
+    _stdin_chunk_size = 64 * 1024
+
+    # The events of a count that hooks can be registered on (see ``add_hook()``)
+    _hook_events = ("run_start", "process_spawn", "process_exit", "parse_complete", "error")
+
     def __init__(self, binary_location,
                  input_parameter,
                  output_parameter,
@@ -96,7 +647,8 @@ class PyMotifCounterBase:
         """
         Initialises a motif counter object.
 
-        :param binary_location: A path leading to a binary in a location other than the default.
+        :param binary_location: A path leading to a binary in a location other than the default (None for counters
+                                that do not run a binary).
         :type binary_location: str
         :param input_parameter: Specification of the default way that this process accepts input
         :type input_parameter: PyMotifCounterParameterFilepath
@@ -115,10 +667,13 @@ class PyMotifCounterBase:
         # Otherwise, attempt to discover the binary on the system
         # If it is not found, the binary_location will be set to "" which will raise an exception from the base
         # object
-        bin_loc = shutil.which(binary_location) or ""
+        # Native counters (see ``counter_native.PyMotifCounterNativeBase``) do not have a binary.
+        bin_loc = None
+        if binary_location is not None:
+            bin_loc = shutil.which(binary_location) or ""
 
-        if not os.path.exists(bin_loc):
-            raise PyMotifCounterError(f"{self.__class__.__name__}::Binary location {bin_loc} invalid.")
+            if not os.path.exists(bin_loc):
+                raise PyMotifCounterError(f"{self.__class__.__name__}::Binary location {bin_loc} invalid.")
 
         # Add parameters other than io
         self._parameters = {}
@@ -137,6 +692,13 @@ class PyMotifCounterBase:
         self._output_parameter = output_parameter
         self._input_transformer = input_transformer
         self._output_transformer = output_transformer
+        self._cache = None
+        self._stream_input = True
+        self._timeout = 320
+        self._kill_grace = 5
+        self._salvage_partial = False
+        self._scratch_dir = None
+        self._hooks = dict.fromkeys(self._hook_events, ())
         
     @property
     def in_param(self):
@@ -146,6 +708,115 @@ class PyMotifCounterBase:
     def out_param(self):
         return self._output_parameter
 
+    @property
+    def in_transformer(self):
+        return self._input_transformer
+
+    @property
+    def out_transformer(self):
+        return self._output_transformer
+
+    @property
+    def stream_input(self):
+        """
+        Whether the input of processes that read their stdin is streamed to them while it is being transformed.
+
+        Notes:
+            * If False, the transformed graph is held in memory (as ``base_transformed_graph`` of the context) before
+              it is written to the process.
+        """
+        return self._stream_input
+
+    @stream_input.setter
+    def stream_input(self, new_stream_input):
+        if not isinstance(new_stream_input, bool):
+            raise TypeError(f"stream_input should be bool, received {type(new_stream_input)}")
+        self._stream_input = new_stream_input
+
+    @property
+    def timeout(self):
+        """
+        The maximum number of seconds that a process can run for (None for no limit, Default: 320).
+
+        Notes:
+            * Processes that time out are sent a SIGTERM and, if they are still running ``kill_grace`` seconds
+              later, a SIGKILL.
+            * The timeout can also be set per call (see ``__call__()``).
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, new_timeout):
+        if new_timeout is not None and not new_timeout > 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::timeout should be positive or None, "
+                                      f"received {new_timeout}")
+        self._timeout = new_timeout
+
+    @property
+    def kill_grace(self):
+        """
+        The number of seconds that a process that timed out is given to exit after a SIGTERM, before it is sent a
+        SIGKILL (Default: 5).
+        """
+        return self._kill_grace
+
+    @kill_grace.setter
+    def kill_grace(self, new_kill_grace):
+        if not new_kill_grace >= 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::kill_grace should be non-negative, "
+                                      f"received {new_kill_grace}")
+        self._kill_grace = new_kill_grace
+
+    @property
+    def salvage_partial(self):
+        """
+        Whether the output that a process produced before it timed out is parsed, rather than raising
+        ``PyMotifCounterTimeoutError`` (Default: False).
+
+        Notes:
+            * Results that are salvaged are marked by ``attrs["timed_out"]`` of the returned DataFrame. If the partial
+              output can not be parsed, ``PyMotifCounterTimeoutError`` is raised.
+        """
+        return self._salvage_partial
+
+    @salvage_partial.setter
+    def salvage_partial(self, new_salvage_partial):
+        if not isinstance(new_salvage_partial, bool):
+            raise TypeError(f"salvage_partial should be bool, received {type(new_salvage_partial)}")
+        self._salvage_partial = new_salvage_partial
+
+    @property
+    def scratch_dir(self):
+        """
+        The directory that the private scratch directory of each batch of counts is created in (Default: None, see
+        ``get_default_scratch_dir()``).
+
+        Notes:
+            * Each batch (including each single count) runs its process in a scratch directory of its own, that holds
+              the io files of the process and anything else the process creates in its working directory. Counts
+              therefore never share files, regardless of how many of them run concurrently.
+            * Counts of graphs that comfortably fit in memory can be pointed to a memory backed tmpfs (e.g.
+              ``/dev/shm``) to save disk io.
+        """
+        return self._scratch_dir
+
+    @scratch_dir.setter
+    def scratch_dir(self, new_scratch_dir):
+        if new_scratch_dir is not None and not os.path.isdir(new_scratch_dir):
+            raise PyMotifCounterError(f"{self.__class__.__name__}::scratch_dir should be an existing directory or "
+                                      f"None, received {new_scratch_dir}")
+        self._scratch_dir = new_scratch_dir
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, new_cache):
+        if new_cache is not None and not isinstance(new_cache, PyMotifCounterResultCache):
+            raise TypeError(f"cache should be PyMotifCounterResultCache, received {type(new_cache)}")
+        self._cache = new_cache
+
     def add_parameter(self, a_param):
         """
         Adds a new parameter that the underlying algorithm depends on.
@@ -213,6 +884,156 @@ class PyMotifCounterBase:
             p_params += a_param_value.get_parameter_form()
         return p_params
 
+    def add_hook(self, event, callback):
+        """
+        Registers a callable that is called on an event of each count of the counter.
+
+        Notes:
+            * The events are:
+                * ``run_start``: A count starts (before its graph is transformed).
+                * ``process_spawn``: The process of a count starts (not fired for cached results).
+                * ``process_exit``: The process of a count is reaped (not fired for cached results).
+                * ``parse_complete``: The result of a count is ready.
+                * ``error``: A count raises an exception (including timeouts and failed processes).
+            * Callbacks receive a dictionary with the ``event, backend`` (the counter class name), ``binary`` (the
+              path of the binary), ``n_nodes, n_edges`` (of the graph), ``parameters`` (the value of each parameter
+              by its alias, or name) and ``stats`` (the ``PyMotifCounterRunStats`` of the count so far) of the
+              count. Depending on the event, it also includes the ``pid`` (``process_spawn``), the ``returncode,
+              timed_out`` (``process_exit``), the ``result`` (``parse_complete``) or the ``error`` (``error``).
+            * Callbacks are called from the thread (or event loop) of the count, therefore they should be thread
+              safe and quick. Exceptions raised by callbacks are turned into warnings, so that they do not interrupt
+              counts.
+            * Counters without hooks do not compute any of the above.
+
+        :param event: One of the events listed above.
+        :type event: str
+        :param callback: A unary callable.
+        :type callback: callable
+        :returns: The PyMotifCounter object
+        :rtype: PyMotifCounterBase
+        """
+        if event not in self._hooks:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Unknown event {event}, expected one of "
+                                      f"{', '.join(self._hook_events)}.")
+        if not callable(callback):
+            raise TypeError(f"callback should be callable, received {type(callback)}")
+        # Hooks are replaced rather than modified, so that counts that run concurrently do not need to lock them.
+        self._hooks[event] = self._hooks[event] + (callback, )
+        return self
+
+    def remove_hook(self, event, callback):
+        """
+        Unregisters a callable that was registered via ``add_hook()``.
+
+        :param event: See ``add_hook()``
+        :type event: str
+        :param callback: A callable that is registered on the event.
+        :type callback: callable
+        :returns: The PyMotifCounter object
+        :rtype: PyMotifCounterBase
+        """
+        if callback not in self._hooks.get(event, ()):
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Callback is not registered on event {event}.")
+        hooks = list(self._hooks[event])
+        hooks.remove(callback)
+        self._hooks[event] = tuple(hooks)
+        return self
+
+    @staticmethod
+    def get_graph_size(a_graph):
+        """
+        Returns the number of nodes and edges of a graph of any of the types that counters accept.
+
+        :param a_graph: See ``PyMotifCounterInputTransformerBase._get_edge_array()``
+        :returns: The number of nodes and the number of edges (None if the graph of a prepared graph is not
+                  available).
+        :rtype: tuple(int, int)
+        """
+        if isinstance(a_graph, PyMotifCounterPreparedGraph):
+            a_graph = a_graph.graph
+        if a_graph is None:
+            return None, None
+        if hasattr(a_graph, "number_of_edges"):
+            return a_graph.number_of_nodes(), a_graph.number_of_edges()
+        if hasattr(a_graph, "nnz"):
+            return a_graph.shape[0], a_graph.nnz
+        edges, n_nodes = PyMotifCounterInputTransformerBase()._get_edge_array(a_graph)
+        return n_nodes, len(edges)
+
+    def _fire_hook(self, event, ctx, **kwargs):
+        """
+        Calls the callbacks that are registered on an event of a count.
+
+        :param event: See ``add_hook()``
+        :type event: str
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :param kwargs: Any information that is specific to the event.
+        """
+        hooks = self._hooks[event]
+        if len(hooks) == 0:
+            return
+        if "base_graph_size" not in ctx:
+            ctx["base_graph_size"] = self.get_graph_size(ctx["base_original_graph"])
+        event_info = {"event": event,
+                      "backend": self.__class__.__name__,
+                      "binary": self._binary_location,
+                      "n_nodes": ctx["base_graph_size"][0],
+                      "n_edges": ctx["base_graph_size"][1],
+                      "parameters": {a_param._alias or a_param._name: a_param.value
+                                     for a_param in sorted(set(self._parameters.values()), key=lambda x: x._name)},
+                      "stats": ctx["base_stats"]}
+        event_info.update(kwargs)
+        for a_callback in hooks:
+            try:
+                a_callback(event_info)
+            except Exception as e:
+                warnings.warn(f"{self.__class__.__name__}::Callback {a_callback!r} of event {event} raised "
+                              f"{e!r}", RuntimeWarning)
+
+    def __deepcopy__(self, memo):
+        """
+        Copies the counter, sharing its cache and its hooks with the copy.
+
+        Notes:
+            * Copies (e.g. the runs of ``sweep.PyMotifCounterSweep``) report to the same hooks as the counter but
+              hooks that are added to a copy afterwards are not added to the counter.
+        """
+        a_copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = a_copy
+        for an_attribute, a_value in vars(self).items():
+            if an_attribute == "_cache":
+                a_copy._cache = a_value
+            elif an_attribute == "_hooks":
+                a_copy._hooks = dict(a_value)
+            else:
+                setattr(a_copy, an_attribute, copy.deepcopy(a_value, memo))
+        return a_copy
+
+    def _get_process_threads(self):
+        """
+        Returns the number of threads that one run of the underlying process uses.
+
+        Notes:
+            * Counters whose binaries are multi-threaded override this so that the processes that run in parallel
+              (see ``executors.PyMotifCounterParallelExecutor``) do not oversubscribe the available cores.
+
+        :returns: The number of threads of each process (Default: 1)
+        :rtype: int
+        """
+        return 1
+
+    def _set_process_threads(self, n_threads):
+        """
+        Limits the number of threads that one run of the underlying process can use.
+
+        :param n_threads: The number of threads available to each process.
+        :type n_threads: int
+        :returns: The PyMotifCounter object
+        :rtype: PyMotifCounterBase
+        """
+        return self
+
     def _transform_network(self, a_graph):
         """
         Transforms a given networkx graph to the intermediate representation expected 
@@ -235,14 +1056,266 @@ class PyMotifCounterBase:
         """
         Actually calls the external process and adds the return value to the context.
 
+        Notes:
+            * The process is always reaped before this function returns or raises. Processes that time out are
+              terminated (see ``timeout``) and any other error (e.g. a ``KeyboardInterrupt``) kills the process.
+
         :param ctx: Current state of the process ctx, **including** ``base_transformed_graph, base_original_graph,
-                    base_parameters``.
+                    base_parameters, base_timeout``.
         :type ctx: dict
         :returns: Updated context (depends on process specifics)
         :rtype: dict
+        :raises: PyMotifCounterTimeoutError if the process times out, PyMotifCounterProcessError if it exits with an
+                 error.
+        """
+        # Decide where to direct the input
+        start_time = time.perf_counter()
+        if ctx["base_input_file"] is not None:
+            p = subprocess.Popen([self._binary_location] + ctx["base_parameters"],
+                                 universal_newlines=True,
+                                 cwd=ctx["base_cwd"],
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+            writer = None
+        else:
+            p = subprocess.Popen([self._binary_location] + ctx["base_parameters"],
+                                 universal_newlines=True,
+                                 cwd=ctx["base_cwd"],
+                                 stdin=subprocess.PIPE,
+                                 stdout=subprocess.PIPE,
+                                 stderr=subprocess.PIPE)
+            # The input is written by a separate thread while the outputs of the process are drained, so that
+            # neither side of the pipes can block the other.
+            proc_stdin, p.stdin = p.stdin, None
+            writer_errors = []
+            writer = threading.Thread(target=self._write_input,
+                                      args=(proc_stdin, ctx["base_transformed_graph"], writer_errors),
+                                      daemon=True)
+            writer.start()
+
+        # Each output is drained by a thread of its own and the process is reaped by another one, via os.wait4(), to
+        # record its resource usage. Popen does not wait for the process and signals are sent to its pid directly, so
+        # that only the reaper can reap it.
+        outputs = {"out": "", "err": ""}
+        readers = [threading.Thread(target=_read_stream, args=(p.stdout, outputs, "out"), daemon=True),
+                   threading.Thread(target=_read_stream, args=(p.stderr, outputs, "err"), daemon=True)]
+        exit_status = []
+        reaper = threading.Thread(target=_reap_process, args=(p.pid, exit_status), daemon=True)
+        for a_thread in readers + [reaper]:
+            a_thread.start()
+
+        def signal_process(a_signal):
+            if reaper.is_alive():
+                try:
+                    os.kill(p.pid, a_signal)
+                except ProcessLookupError:
+                    pass
+
+        timed_out = False
+        try:
+            self._fire_hook("process_spawn", ctx, pid=p.pid)
+            reaper.join(ctx["base_timeout"])
+            if reaper.is_alive():
+                timed_out = True
+                # Ask the process to exit, then force it. Output is collected throughout, so that it can be salvaged.
+                signal_process(signal.SIGTERM)
+                reaper.join(self._kill_grace)
+                signal_process(signal.SIGKILL)
+        finally:
+            signal_process(signal.SIGKILL)
+            reaper.join()
+            for a_reader in readers:
+                a_reader.join()
+            # A writer that is blocked on a process that is not reading its input is released by the process
+            # exiting.
+            if writer is not None:
+                writer.join()
+
+        p.returncode, rusage = exit_status
+        ctx["base_stats"].process_time = time.perf_counter() - start_time
+        if rusage is not None:
+            ctx["base_stats"].set_rusage(rusage)
+        self._fire_hook("process_exit", ctx, returncode=p.returncode, timed_out=timed_out)
+
+        if writer is not None and len(writer_errors) > 0:
+            raise writer_errors[0]
+
+        return self._check_run(ctx, outputs["out"], outputs["err"], p.returncode, timed_out)
+
+    def _check_run(self, ctx, out, err, returncode, timed_out):
+        """
+        Adds the outcome of a process to the context and raises any errors that it signifies.
+
+        :param ctx: Current state of the process ctx.
+        :type ctx: dict
+        :param out: The stdout of the process.
+        :type out: str
+        :param err: The stderr of the process.
+        :type err: str
+        :param returncode: The exit status of the process.
+        :type returncode: int
+        :param timed_out: Whether the process timed out.
+        :type timed_out: bool
+        :returns: Updated context, **including** ``base_proc_response, base_proc_error, base_proc_returncode,
+                  base_timed_out``.
+        :rtype: dict
+        :raises: PyMotifCounterTimeoutError if the process timed out (and its output is not salvaged),
+                 PyMotifCounterProcessError if it exited with an error.
         """
+        ctx.update({"base_proc_response": out,
+                    "base_proc_error": err,
+                    "base_proc_returncode": returncode,
+                    "base_timed_out": timed_out})
+        ctx["base_stats"].returncode = returncode
+        ctx["base_stats"].timed_out = timed_out
+        if timed_out:
+            if not self._salvage_partial:
+                raise PyMotifCounterTimeoutError(f"{self.__class__.__name__}::Process did not complete within "
+                                                 f"{ctx['base_timeout']}s.")
+        elif returncode != 0:
+            raise PyMotifCounterProcessError(f"{self.__class__.__name__}::Process exited with status {returncode}: "
+                                             f"{err.strip()[-1000:]}")
         return ctx
-        
+
+    def _iter_input_chunks(self, transformed_graph):
+        """
+        Groups the transformed graph in chunks of approximately ``_stdin_chunk_size`` characters.
+
+        :param transformed_graph: The transformed graph as a string or as an iterable of strings (e.g. the
+                                  generator returned by the input transformer).
+        :type transformed_graph: str, Iterable[str]
+        :returns: A generator of str chunks.
+        """
+        if isinstance(transformed_graph, str):
+            for chunk_start in range(0, len(transformed_graph), self._stdin_chunk_size):
+                yield transformed_graph[chunk_start:chunk_start + self._stdin_chunk_size]
+            return
+
+        chunk, chunk_size = [], 0
+        for a_line in transformed_graph:
+            chunk.append(a_line)
+            chunk_size += len(a_line)
+            if chunk_size >= self._stdin_chunk_size:
+                yield "".join(chunk)
+                chunk, chunk_size = [], 0
+        if chunk_size > 0:
+            yield "".join(chunk)
+
+    def _write_input(self, proc_stdin, transformed_graph, errors):
+        """
+        Writes the transformed graph to the stdin of a process in chunks and then closes it.
+
+        :param proc_stdin: The (text mode) stdin of the process.
+        :type proc_stdin: io.TextIOWrapper
+        :param transformed_graph: See ``_iter_input_chunks()``
+        :type transformed_graph: str, Iterable[str]
+        :param errors: A list that any exception raised while transforming the graph is appended to.
+        :type errors: list
+        """
+        try:
+            for a_chunk in self._iter_input_chunks(transformed_graph):
+                proc_stdin.write(a_chunk)
+        except BrokenPipeError:
+            # The process exited without consuming all of its input. Any reasons are conveyed by its output.
+            pass
+        except Exception as e:
+            errors.append(e)
+        finally:
+            try:
+                proc_stdin.close()
+            except BrokenPipeError:
+                pass
+
+    async def _write_input_async(self, proc_stdin, transformed_graph):
+        """
+        Asynchronous version of ``_write_input()``.
+
+        :param proc_stdin: The stdin of the process.
+        :type proc_stdin: asyncio.StreamWriter
+        :param transformed_graph: See ``_iter_input_chunks()``
+        :type transformed_graph: str, Iterable[str]
+        """
+        try:
+            for a_chunk in self._iter_input_chunks(transformed_graph):
+                proc_stdin.write(a_chunk.encode())
+                await proc_stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            proc_stdin.close()
+
+    async def _run_async(self, ctx):
+        """
+        Asynchronous version of ``_run()``.
+
+        Notes:
+            * If the process times out it is terminated as in ``_run()``. If the awaiting task is cancelled, the
+              process is killed (and reaped) before the cancellation propagates.
+
+        :param ctx: Current state of the process ctx, **including** ``base_transformed_graph, base_original_graph,
+                    base_parameters, base_timeout``.
+        :type ctx: dict
+        :returns: Updated context (depends on process specifics)
+        :rtype: dict
+        :raises: PyMotifCounterTimeoutError if the process times out, PyMotifCounterProcessError if it exits with an
+                 error.
+        """
+        # Decide where to direct the input
+        start_time = time.perf_counter()
+        if ctx["base_input_file"] is not None:
+            p = await asyncio.create_subprocess_exec(self._binary_location, *ctx["base_parameters"],
+                                                     cwd=ctx["base_cwd"],
+                                                     stdout=asyncio.subprocess.PIPE,
+                                                     stderr=asyncio.subprocess.PIPE)
+        else:
+            p = await asyncio.create_subprocess_exec(self._binary_location, *ctx["base_parameters"],
+                                                     cwd=ctx["base_cwd"],
+                                                     stdin=asyncio.subprocess.PIPE,
+                                                     stdout=asyncio.subprocess.PIPE,
+                                                     stderr=asyncio.subprocess.PIPE)
+
+        # Output is collected as it is produced, so that it can be salvaged if the process times out.
+        out, err = bytearray(), bytearray()
+
+        async def read_stream(a_stream, a_buffer):
+            a_chunk = await a_stream.read(self._stdin_chunk_size)
+            while a_chunk:
+                a_buffer.extend(a_chunk)
+                a_chunk = await a_stream.read(self._stdin_chunk_size)
+
+        async def communicate():
+            streams = [read_stream(p.stdout, out), read_stream(p.stderr, err)]
+            if ctx["base_input_file"] is None:
+                # Write the input while the outputs of the process are drained
+                streams.append(self._write_input_async(p.stdin, ctx["base_transformed_graph"]))
+            await asyncio.gather(*streams)
+            await p.wait()
+
+        timed_out = False
+        communication = asyncio.ensure_future(communicate())
+        try:
+            self._fire_hook("process_spawn", ctx, pid=p.pid)
+            try:
+                await asyncio.wait_for(asyncio.shield(communication), ctx["base_timeout"])
+            except asyncio.TimeoutError:
+                timed_out = True
+                p.terminate()
+                try:
+                    await asyncio.wait_for(asyncio.shield(communication), self._kill_grace)
+                except asyncio.TimeoutError:
+                    p.kill()
+                    await communication
+        finally:
+            # Cancelled or failed
+            if p.returncode is None:
+                p.kill()
+                await p.wait()
+            communication.cancel()
+
+        ctx["base_stats"].process_time = time.perf_counter() - start_time
+        self._fire_hook("process_exit", ctx, returncode=p.returncode, timed_out=timed_out)
+        return self._check_run(ctx, out.decode(), err.decode(), p.returncode, timed_out)
+
     def _after_run(self, ctx):
         """
         Performs any clean up.
@@ -254,40 +1327,48 @@ class PyMotifCounterBase:
         :rtype: dict
         """
         return ctx
-    
-    def __call__(self, a_graph):
+
+    def _setup_batch(self):
         """
-        Initiates a motif count.
+        Prepares everything that is shared by all the counts of a batch of graphs.
 
-        :param a_graph: The Networkx graph to enumerate motifs over.
-        :type a_graph: networkx.Graph (or any other networkx class that is supported).
-        :returns: Most commonly a DataFrame that contains information about a given motif count/
-        :rtype: pandas.DataFrame
+        Notes:
+            * Parameters are validated once and the temporary files that are used for the io of the process are
+              placed in one temporary directory that is re-used by each count of the batch. This means that the
+              parameters that are passed to the process are also the same for each count.
+            * All the state of a batch (the paths of the temporary files and the working directory of the process)
+              is held in the returned context, rather than in the counter, so that one counter can run any number of
+              batches concurrently (e.g. from multiple threads).
+            * The process runs in the temporary directory of the batch, so that files that binaries create in their
+              working directory (e.g. NetMODE's ``adjMat.txt``) are private to the batch. The directory is created in
+              ``scratch_dir``.
+
+        :returns: A context that is the starting point for the context of each count, containing ``base_tmp_dir,
+                  base_cwd, base_input_file, base_output_file, base_parameters, base_timeout``. The io files are None
+                  if the process uses the std streams instead.
+        :rtype: dict
         :raises: PyMotifCounterParameterError from the validation step.
         """
         # Validate parameters
         self.validate_parameters()
 
-        # Initialise the context for this run with the given graph
-        ctx = {"base_original_graph": a_graph}
+        base_tmp_dir = _make_scratch_dir(self._scratch_dir)
+        batch_ctx = {"base_tmp_dir": base_tmp_dir,
+                     "base_cwd": base_tmp_dir,
+                     "base_input_file": None,
+                     "base_output_file": None,
+                     "base_timeout": self._timeout}
 
-        # Decide how to handle the input
-        if self.in_param.value == "-":
-            # If the input parameter is stdin then use the attached transformer to transform a given
-            # network to the representation expected by the underlying motif counting algorithm.
-            ctx.update({"base_transformed_graph": "".join(self._input_transformer(a_graph))})
-        else:
-            # If the input parameter is not stdin it will be a temporary file
-            _, in_tmp_file_name = tempfile.mkstemp()
-            self._input_transformer.to_file(a_graph, file_path=in_tmp_file_name)
-            self.in_param.default_value = in_tmp_file_name
+        # If the input parameter is not stdin it will be a temporary file (that must exist for the parameter to
+        # validate).
+        if self.in_param.value != "-":
+            batch_ctx["base_input_file"] = os.path.join(batch_ctx["base_tmp_dir"], "input")
+            open(batch_ctx["base_input_file"], "wt").close()
 
-        # Similarly, update the output parameter but in this case no actual io is performed because the
+        # Similarly, determine the output file but in this case no actual io is performed because the
         # output is not yet available.
-        # If the output is to be sent to a temporary file, determine that here.
         if self.out_param.value != "-":
-            _, out_tmp_file_name = tempfile.mkstemp()
-            self.out_param.default_value = out_tmp_file_name
+            batch_ctx["base_output_file"] = os.path.join(batch_ctx["base_tmp_dir"], "output")
 
         # Provided that everything is alright, get all the parameters in their appropriate form
         # In doing this, we still need to retain the parameter ordering to discriminate between positional arguments and
@@ -296,60 +1377,378 @@ class PyMotifCounterBase:
         p_params = [{"param": a_param.get_parameter_form(), "pos": a_param.pos} for a_param in all_parameters]
 
         # If either of the io variables are to be sent to an std stream then remove them from the parameters
-        if self.in_param.value != "-":
-            p_params += [{"param": self.in_param.get_parameter_form(), "pos": self.in_param.pos}]
+        try:
+            if batch_ctx["base_input_file"] is not None:
+                p_params += [{"param": self.in_param.get_parameter_form(batch_ctx["base_input_file"]),
+                              "pos": self.in_param.pos}]
 
-        if self.out_param.value != "-":
-            p_params += [{"param": self.out_param.get_parameter_form(), "pos": self.out_param.pos}]
+            if batch_ctx["base_output_file"] is not None:
+                p_params += [{"param": self.out_param.get_parameter_form(batch_ctx["base_output_file"]),
+                              "pos": self.out_param.pos}]
+        except PyMotifCounterParameterError:
+            self._teardown_batch(batch_ctx)
+            raise
 
         # Now sort these parameters and get th final form
         p_params = list(reduce(lambda x, y: x + y["param"], sorted(p_params, key=lambda z: z["pos"]), []))
 
-        ctx.update({"base_parameters": p_params})
+        batch_ctx.update({"base_parameters": p_params})
+        return batch_ctx
 
-        # Run any other preparation
-        ctx = self._before_run(ctx)
+    def _teardown_batch(self, batch_ctx):
+        """
+        Removes everything that was created by ``_setup_batch()``.
 
-        # ...execute...
-        # Create the process object
-        # TODO: HIGH, this needs exception handling for timeout
-        # TODO: HIGH, if the process returns an error, this error should be piped up as an exception
+        :param batch_ctx: The context returned by ``_setup_batch()``
+        :type batch_ctx: dict
+        """
+        _remove_scratch_dir(batch_ctx["base_tmp_dir"])
 
-        # Decide where to direct the input
-        if self.in_param.value != "-":
-            p = subprocess.Popen([self._binary_location] + p_params,
-                                 universal_newlines=True,
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE)
-            out, err = p.communicate(timeout=320)
+    def _count_prepare(self, a_graph, batch_ctx, timeout=None):
+        """
+        Prepares the context of one motif count of a batch, up to (and excluding) running the process.
+
+        :param a_graph: The Networkx graph to enumerate motifs over.
+        :type a_graph: networkx.Graph (or any other networkx class that is supported).
+        :param batch_ctx: The context returned by ``_setup_batch()``
+        :type batch_ctx: dict
+        :param timeout: The timeout of this count (Default: None, the ``timeout`` of the counter)
+        :type timeout: float
+        :returns: The context of the count, ready to be passed to ``_run()``, **including** ``base_stats`` (see
+                  ``PyMotifCounterRunStats``).
+        :rtype: dict
+        """
+        # Initialise the context for this run with the given graph
+        stats = PyMotifCounterRunStats()
+        ctx = dict(batch_ctx)
+        ctx.update({"base_original_graph": a_graph,
+                    "base_stats": stats})
+        if timeout is not None:
+            ctx.update({"base_timeout": timeout})
+        self._fire_hook("run_start", ctx)
+        try:
+            return self._prepare_input(ctx)
+        except Exception as e:
+            self._fire_hook("error", ctx, error=e)
+            raise
+
+    def _prepare_input(self, ctx):
+        """
+        Prepares the input and output of the process of a count (see ``_count_prepare()``).
+
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: The context of the count, ready to be passed to ``_run()``.
+        :rtype: dict
+        """
+        a_graph = ctx["base_original_graph"]
+        stats = ctx["base_stats"]
+        # Decide how to handle the input
+        if isinstance(a_graph, PyMotifCounterPreparedGraph):
+            # The representation of a prepared graph is already available
+            if ctx["base_input_file"] is None:
+                ctx.update({"base_transformed_graph": stats.time_iter(a_graph.iter_file(self._input_transformer),
+                                                                      "io_time")})
+            else:
+                prepared_file = a_graph.get_file(self._input_transformer)
+                ctx.update({"base_parameters": [prepared_file if a_param == ctx["base_input_file"] else a_param
+                                                for a_param in ctx["base_parameters"]],
+                            "base_input_file": prepared_file})
+        elif ctx["base_input_file"] is None:
+            # If the input parameter is stdin then use the attached transformer to transform a given
+            # network to the representation expected by the underlying motif counting algorithm. If the input is
+            # streamed, the transformation happens while it is written to the process.
+            with stats.timer("transform_time"):
+                transformed_graph = self._input_transformer(a_graph)
+            transformed_graph = stats.time_iter(transformed_graph, "transform_time")
+            if not self._stream_input:
+                transformed_graph = "".join(transformed_graph)
+            ctx.update({"base_transformed_graph": transformed_graph})
         else:
-            p = subprocess.Popen([self._binary_location] + p_params,
-                                 universal_newlines=True,
-                                 stdin=subprocess.PIPE,
-                                 stdout=subprocess.PIPE,
-                                 stderr=subprocess.PIPE)
-            out, err = p.communicate(input=ctx["base_transformed_graph"], timeout=320)
+            # Equivalent to the transformer's to_file(), timing the transformation separately from the writing.
+            with stats.timer("transform_time"):
+                transformed_graph = self._input_transformer(a_graph)
+            transform_time = stats.transform_time
+            with stats.timer("io_time"), open(ctx["base_input_file"], "wt") as fd:
+                for a_line in stats.time_iter(transformed_graph, "transform_time"):
+                    fd.write(a_line)
+            stats.io_time -= stats.transform_time - transform_time
 
-        ctx.update({"base_proc_response": out,
-                    "base_proc_error": err})
+        # Make sure that the output of a previous count of the batch is not mistaken for the output of this one.
+        if ctx["base_output_file"] is not None and os.path.exists(ctx["base_output_file"]):
+            os.remove(ctx["base_output_file"])
 
-        # Transform the output to a computable form
-        if self.out_param.value != "-":
-            final_output = self._output_transformer.from_file(self.out_param.value, ctx)
+        # Run any other preparation
+        return self._before_run(ctx)
+
+    def _get_cache_key(self, ctx):
+        """
+        Returns the key that identifies the result of a count in a ``PyMotifCounterResultCache``.
+
+        Notes:
+            * The key is derived from the counter class, the identity of the binary (its path, size and
+              modification time), the parameters that are passed to the process (excluding the location of its
+              temporary files) and the digest of the transformed graph, which is hashed block by block.
+            * A streamed input is consumed by hashing it, therefore it is spooled to the temporary directory of the
+              batch while it is hashed and the process is streamed the spooled file instead. Memory use remains
+              bounded.
+
+        :param ctx: The context of a count, as returned by ``_count_prepare()``.
+        :type ctx: dict
+        :rtype: str
+        """
+        graph_hash = hashlib.sha256()
+        if ctx["base_input_file"] is not None:
+            for a_block in _iter_file_blocks(ctx["base_input_file"], self._stdin_chunk_size, "rb"):
+                graph_hash.update(a_block)
+        elif isinstance(ctx["base_transformed_graph"], str):
+            graph_hash.update(ctx["base_transformed_graph"].encode())
         else:
-            final_output = self._output_transformer(out, ctx)
-        ctx.update({"base_output_transformed": final_output})
+            spool_file = os.path.join(ctx["base_tmp_dir"], "input_spool")
+            with open(spool_file, "wt") as fd:
+                for a_block in ctx["base_transformed_graph"]:
+                    graph_hash.update(a_block.encode())
+                    fd.write(a_block)
+            ctx.update({"base_transformed_graph": _iter_file_blocks(spool_file, self._stdin_chunk_size)})
+        binary_stat = os.stat(self._binary_location)
+        return PyMotifCounterResultCache.make_key(f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+                                                  self._binary_location,
+                                                  f"{binary_stat.st_size}:{binary_stat.st_mtime_ns}",
+                                                  "\0".join("" if a_param == ctx["base_input_file"] else
+                                                            a_param.replace(ctx["base_tmp_dir"], "")
+                                                            for a_param in ctx["base_parameters"]),
+                                                  graph_hash.digest())
 
-        # Clean up temporary files
-        if self.in_param.value != "-":
-            if os.path.exists(self.in_param.value):
-                os.remove(self.in_param.value)
+    def _get_cached_result(self, ctx):
+        """
+        Returns the cached result of a count, if a cache is attached to the counter.
 
-        if self.out_param.value != "-":
-            if os.path.exists(self.out_param.value):
-                os.remove(self.out_param.value)
+        :param ctx: The context of a count, as returned by ``_count_prepare()``. If a cache is attached, it is updated
+                    with ``base_cache_key``.
+        :type ctx: dict
+        :returns: The cached result or None if the count has to run.
+        :rtype: pandas.DataFrame
+        """
+        if self._cache is None:
+            return None
+        ctx.update({"base_cache_key": self._get_cache_key(ctx)})
+        return self._cache.get(ctx["base_cache_key"])
+
+    def _count_finalise(self, ctx):
+        """
+        Transforms the output of a process that has run to a computable form and performs any clean up.
+
+        :param ctx: The context of the count, as returned by ``_run()``.
+        :type ctx: dict
+        :returns: Most commonly a DataFrame that contains information about a given motif count.
+        :rtype: pandas.DataFrame
+        """
+        stats = ctx["base_stats"]
+        # Transform the output to a computable form
+        try:
+            if ctx["base_output_file"] is not None:
+                # Equivalent to the transformer's from_file(), timing the reading separately from the parsing.
+                with stats.timer("io_time"), open(ctx["base_output_file"], "rt") as fd:
+                    proc_response = fd.read()
+            else:
+                proc_response = ctx["base_proc_response"]
+            with stats.timer("parse_time"):
+                final_output = self._output_transformer(proc_response, ctx)
+        except Exception as e:
+            if ctx.get("base_timed_out", False):
+                raise PyMotifCounterTimeoutError(f"{self.__class__.__name__}::Process did not complete within "
+                                                 f"{ctx['base_timeout']}s and its partial output could not be "
+                                                 f"parsed.") from e
+            raise
+        if ctx.get("base_timed_out", False):
+            final_output.attrs["timed_out"] = True
+        ctx.update({"base_output_transformed": final_output})
 
         # Do any other cleanup.
         ctx = self._after_run(ctx)
 
-        return final_output
+        # Partial results are not cached
+        if "base_cache_key" in ctx and not ctx.get("base_timed_out", False):
+            self._cache.put(ctx["base_cache_key"], final_output)
+
+        return self._attach_stats(final_output, ctx)
+
+    def _attach_stats(self, a_result, ctx):
+        """
+        Marks the end of a count and attaches its stats to its result (as ``attrs["run_stats"]``).
+
+        :param a_result: The result of the count.
+        :type a_result: pandas.DataFrame
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: The result of the count.
+        :rtype: pandas.DataFrame
+        """
+        ctx["base_stats"].stop()
+        a_result.attrs["run_stats"] = ctx["base_stats"]
+        self._fire_hook("parse_complete", ctx, result=a_result)
+        return a_result
+
+    def _count(self, a_graph, batch_ctx, timeout=None):
+        """
+        Performs one motif count of a batch.
+
+        :param a_graph: The Networkx graph to enumerate motifs over.
+        :type a_graph: networkx.Graph (or any other networkx class that is supported).
+        :param batch_ctx: The context returned by ``_setup_batch()``
+        :type batch_ctx: dict
+        :param timeout: See ``_count_prepare()``
+        :type timeout: float
+        :returns: Most commonly a DataFrame that contains information about a given motif count.
+        :rtype: pandas.DataFrame
+        """
+        ctx = self._count_prepare(a_graph, batch_ctx, timeout)
+        try:
+            cached_output = self._get_cached_result(ctx)
+            if cached_output is not None:
+                ctx["base_stats"].cached = True
+                return self._attach_stats(cached_output, ctx)
+            # ...execute...
+            ctx = self._run(ctx)
+            return self._count_finalise(ctx)
+        except Exception as e:
+            self._fire_hook("error", ctx, error=e)
+            raise
+
+    def __call__(self, a_graph, timeout=None):
+        """
+        Initiates a motif count.
+
+        Notes:
+            * Besides ``networkx`` graphs, counters whose input transformers produce edge lists also accept edge
+              arrays, sparse adjacency matrices and edge DataFrames (see
+              ``PyMotifCounterInputTransformerBase._get_edge_array()``).
+            * Graphs that are counted multiple times (e.g. with different parameters) can be transformed once, via
+              ``PyMotifCounterPreparedGraph``.
+            * A process that does not complete within the timeout is terminated (see ``timeout``, ``kill_grace`` and
+              ``salvage_partial``).
+
+        :param a_graph: The Networkx graph to enumerate motifs over.
+        :type a_graph: networkx.Graph (or any other networkx class that is supported).
+        :param timeout: The maximum number of seconds that the process can run for (Default: None, the ``timeout``
+                        of the counter)
+        :type timeout: float
+        :returns: Most commonly a DataFrame that contains information about a given motif count/
+        :rtype: pandas.DataFrame
+        :raises: PyMotifCounterParameterError from the validation step, PyMotifCounterTimeoutError if the process
+                 times out, PyMotifCounterProcessError if the process exits with an error.
+        """
+        batch_ctx = self._setup_batch()
+        try:
+            return self._count(a_graph, batch_ctx, timeout)
+        finally:
+            self._teardown_batch(batch_ctx)
+
+    async def count_async(self, a_graph, timeout=None):
+        """
+        Initiates a motif count without blocking the running event loop while the process runs.
+
+        Notes:
+            * Each call has its own temporary files, therefore any number of counts of the same counter can be
+              awaited concurrently (e.g. via ``asyncio.gather()``).
+            * Cancelling the awaiting task kills the process.
+
+        Example:
+            ::
+
+                motif_counts = await PyMotifCounterMfinder().count_async(a_graph, timeout=60)
+
+        :param a_graph: The Networkx graph to enumerate motifs over.
+        :type a_graph: networkx.Graph (or any other networkx class that is supported).
+        :param timeout: See ``__call__()``
+        :type timeout: float
+        :returns: See ``__call__()``
+        :rtype: pandas.DataFrame
+        :raises: See ``__call__()``
+        """
+        batch_ctx = self._setup_batch()
+        try:
+            ctx = self._count_prepare(a_graph, batch_ctx, timeout)
+            try:
+                cached_output = self._get_cached_result(ctx)
+                if cached_output is not None:
+                    ctx["base_stats"].cached = True
+                    return self._attach_stats(cached_output, ctx)
+                ctx = await self._run_async(ctx)
+                return self._count_finalise(ctx)
+            except Exception as e:
+                self._fire_hook("error", ctx, error=e)
+                raise
+        finally:
+            self._teardown_batch(batch_ctx)
+
+    def _count_many_iter(self, graphs, batch_ctx, timeout=None):
+        """
+        Generator of the motif counts of a batch of graphs (see ``count_many()``).
+
+        :param graphs: An iterable of Networkx graphs to enumerate motifs over.
+        :type graphs: Iterable[networkx.Graph]
+        :param batch_ctx: The context returned by ``_setup_batch()``, which is torn down once the generator is
+                          exhausted or closed.
+        :type batch_ctx: dict
+        :param timeout: The timeout of each count (see ``__call__()``)
+        :type timeout: float
+        """
+        try:
+            for a_graph_idx, a_graph in enumerate(graphs):
+                yield a_graph_idx, self._count(a_graph, batch_ctx, timeout)
+        finally:
+            self._teardown_batch(batch_ctx)
+
+    def count_many(self, graphs, as_generator=False, timeout=None):
+        """
+        Initiates a motif count over each graph of an iterable of graphs.
+
+        Notes:
+            * Parameter validation, the construction of the parameters that are passed to the process and the
+              creation of the temporary files that are used for its io are performed once for the whole batch, when
+              ``count_many()`` is called (rather than when a generator of results is first advanced).
+            * If the results are returned as a generator, the temporary files are removed once the generator is
+              exhausted or closed.
+
+        :param graphs: An iterable of Networkx graphs to enumerate motifs over.
+        :type graphs: Iterable[networkx.Graph]
+        :param as_generator: Whether to return a generator of ``(graph_index, DataFrame)`` tuples, rather than a
+                             single DataFrame (Default: False)
+        :type as_generator: bool
+        :param timeout: The maximum number of seconds that the process of each graph can run for (see
+                        ``__call__()``)
+        :type timeout: float
+        :returns: A long format DataFrame where the ``graph_index`` column identifies the graph (by its position in
+                  ``graphs``) that each motif count row refers to, or a generator of the count of each graph.
+        :rtype: pandas.DataFrame
+        :raises: PyMotifCounterParameterError from the validation step.
+        """
+        results = self._count_many_iter(graphs, self._setup_batch(), timeout)
+        if as_generator:
+            return results
+        return self._concat_results(results)
+
+    @staticmethod
+    def _concat_results(results):
+        """
+        Concatenates the results of multiple counts to a long format DataFrame.
+
+        :param results: An iterable of ``(graph_index, DataFrame)`` tuples.
+        :type results: Iterable[tuple]
+        :returns: A DataFrame with a leading ``graph_index`` column followed by the columns of each count. Its
+                  ``attrs["run_stats"]`` lists the stats of each count, in the order of ``graph_index``.
+        :rtype: pandas.DataFrame
+        """
+        all_results = []
+        all_stats = []
+        for a_graph_idx, a_result in results:
+            a_result.insert(0, "graph_index", a_graph_idx)
+            all_results.append(a_result)
+            all_stats.append(a_result.attrs.get("run_stats"))
+        if len(all_results) == 0:
+            all_results = pandas.DataFrame(columns=["graph_index"])
+        else:
+            all_results = pandas.concat(all_results, ignore_index=True)
+        all_results.attrs = {"run_stats": all_stats}
+        return all_results
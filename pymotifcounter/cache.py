@@ -0,0 +1,205 @@
+"""
+A content-addressed cache for the results of motif counts.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+import contextlib
+import collections
+from .exceptions import *
+
+
+class PyMotifCounterResultCache:
+    """
+    Caches the results of motif counts in memory and, optionally, on the disk.
+
+    Notes:
+        * Results are addressed by a key that is derived from the content of a count (see
+          ``PyMotifCounterBase._get_cache_key()``), therefore one cache can be shared by multiple counters.
+        * The memory tier is a least recently used (LRU) cache of at most ``max_memory_bytes``.
+        * The disk tier is an SQLite database of at most ``max_disk_bytes``. Its entries are evicted in least recently
+          used order too and it persists across processes. Results that are found on the disk are promoted to the
+          memory tier.
+        * Results are copied on their way in and out of the cache, so that changes to a returned DataFrame do not
+          affect the cached one.
+
+    Example:
+        ::
+
+            counter = PyMotifCounterMfinder()
+            counter.cache = PyMotifCounterResultCache(disk_path="motif_counts.sqlite")
+    """
+    def __init__(self, max_memory_bytes=256 * 1024 ** 2, disk_path=None, max_disk_bytes=4 * 1024 ** 3):
+        """
+        Initialises a result cache.
+
+        :param max_memory_bytes: The maximum size of the results held in memory (0 disables the memory tier).
+        :type max_memory_bytes: int
+        :param disk_path: The path of the SQLite database of the disk tier (Default: None, no disk tier).
+        :type disk_path: str
+        :param max_disk_bytes: The maximum size of the results held on the disk.
+        :type max_disk_bytes: int
+        """
+        if max_memory_bytes < 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::max_memory_bytes should be non-negative, "
+                                      f"received {max_memory_bytes}")
+        if max_disk_bytes < 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::max_disk_bytes should be non-negative, "
+                                      f"received {max_disk_bytes}")
+
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._disk_path = disk_path
+        self._lock = threading.Lock()
+        # key -> (pickled result, size)
+        self._memory = collections.OrderedDict()
+        self._memory_bytes = 0
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "memory_evictions": 0, "disk_evictions": 0}
+
+        if self._disk_path is not None:
+            with self._connect() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                             "size INTEGER NOT NULL, last_access INTEGER NOT NULL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)")
+
+    @property
+    def stats(self):
+        """
+        Returns the hit / miss and eviction statistics of the cache, as well as the size of each tier.
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({"memory_items": len(self._memory), "memory_bytes": self._memory_bytes})
+        stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+        if self._disk_path is not None:
+            with self._connect() as conn:
+                disk_items, disk_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) "
+                                                      "FROM results").fetchone()
+            stats.update({"disk_items": disk_items, "disk_bytes": disk_bytes})
+        return stats
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Returns the hexadecimal SHA-256 digest of a sequence of str / bytes parts.
+
+        Notes:
+            * Each part is length-prefixed so that different sequences of parts can not produce the same key.
+
+        :param parts: The parts that identify a result.
+        :type parts: str, bytes
+        :rtype: str
+        """
+        key = hashlib.sha256()
+        for a_part in parts:
+            if isinstance(a_part, str):
+                a_part = a_part.encode()
+            key.update(len(a_part).to_bytes(8, "little"))
+            key.update(a_part)
+        return key.hexdigest()
+
+    def _connect(self):
+        """
+        Returns a new connection to the disk tier, that is closed on exiting its context.
+        """
+        return contextlib.closing(sqlite3.connect(self._disk_path, timeout=60, isolation_level=None))
+
+    def _put_memory(self, key, data):
+        """
+        Adds a pickled result to the memory tier, evicting least recently used results to make room for it.
+        """
+        if len(data) > self._max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        self._memory[key] = (data, len(data))
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self._max_memory_bytes:
+            _, (_, a_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= a_size
+            self._stats["memory_evictions"] += 1
+
+    def get(self, key):
+        """
+        Returns the result that is cached under a given key.
+
+        :param key: A key as returned by ``make_key()``.
+        :type key: str
+        :returns: The cached result or None if it is not in the cache.
+        :rtype: pandas.DataFrame
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return pickle.loads(self._memory[key][0])
+
+        data = None
+        if self._disk_path is not None:
+            with self._connect() as conn:
+                row = conn.execute("SELECT data FROM results WHERE key = ?", (key, )).fetchone()
+                if row is not None:
+                    data = row[0]
+                    conn.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time_ns(), key))
+
+        with self._lock:
+            if data is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._put_memory(key, data)
+        return pickle.loads(data)
+
+    def put(self, key, result):
+        """
+        Caches a result under a given key.
+
+        :param key: A key as returned by ``make_key()``.
+        :type key: str
+        :param result: The result of a count.
+        :type result: pandas.DataFrame
+        """
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._put_memory(key, data)
+
+        if self._disk_path is None or len(data) > self._max_disk_bytes:
+            return
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT OR REPLACE INTO results (key, data, size, last_access) VALUES (?, ?, ?, ?)",
+                         (key, data, len(data), time.time_ns()))
+            disk_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            n_evicted = 0
+            for an_old_key, a_size in conn.execute("SELECT key, size FROM results WHERE key != ? "
+                                                   "ORDER BY last_access", (key, )).fetchall():
+                if disk_bytes <= self._max_disk_bytes:
+                    break
+                conn.execute("DELETE FROM results WHERE key = ?", (an_old_key, ))
+                disk_bytes -= a_size
+                n_evicted += 1
+            conn.execute("COMMIT")
+
+        with self._lock:
+            self._stats["disk_evictions"] += n_evicted
+
+    def clear(self):
+        """
+        Removes all results from the cache and resets its statistics.
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._stats = dict.fromkeys(self._stats, 0)
+        if self._disk_path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results")
@@ -9,3 +9,5 @@ from .counter_netmode import *
 from .counter_mfinder import *
 from .counter_fanmod import *
 from .counter_pgd import *
+from .counter_native import *
+from .counter_esu import *
@@ -0,0 +1,223 @@
+"""
+Implements the ESU / RAND-ESU subgraph enumeration counter, that runs in the Python process.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import math
+import random
+import itertools
+import collections
+import numpy
+from .counter_native import *
+
+
+def _are_probabilities():
+    """
+    Validates a comma separated list of probabilities (e.g. ``"1,1,0.5"``), each in ``(0, 1]``.
+    """
+    def validate(x):
+        try:
+            probabilities = [float(a_value) for a_value in x.split(",")] if x != "" else []
+        except ValueError:
+            return f"{x} is not a comma separated list of numbers"
+        return "OK" if all(0 < a_value <= 1 for a_value in probabilities) else f"{x} are not all within (0, 1]"
+    return validate
+
+
+class PyMotifCounterOutputTransformerEsu(PyMotifCounterOutputTransformerNative):
+    _columns = {"motif_id": "int64",
+                "nsampled": "int64",
+                "nreal": "float64",
+                "creal_mili": "float64"}
+    _id_column = "motif_id"
+    _random_stats_columns = {"nreal": ("nrand_stats_m", "nrand_stats_s", "nreal_z_score", "nreal_pval")}
+
+
+class PyMotifCounterEsu(PyMotifCounterNativeBase):
+    """
+    Enumerates the connected subgraphs of a graph with the ESU algorithm (or samples them with RAND-ESU), without an
+    external binary.
+
+    Notes:
+        * ESU extends each subgraph only by the neighbours of its last node that are not adjacent to any of its other
+          nodes and that follow its first node. Each connected subgraph is therefore enumerated exactly once.
+        * RAND-ESU follows each extension at depth ``d`` (the ``d``-th node of the subgraph) with probability
+          ``sampling_probabilities[d - 1]`` and therefore samples each connected subgraph with probability equal to the
+          product of all probabilities. Without ``sampling_probabilities`` every subgraph is enumerated.
+        * Returns the number of sampled subgraphs of each motif (``nsampled``), the estimated number of its subgraphs
+          in the graph (``nreal``, which is exact without sampling) and its concentration per thousand
+          (``creal_mili``). Only motifs that occur in the (sampled) subgraphs are listed, in ascending ``motif_id``.
+        * ``motif_id`` is the smallest ``util.adj_mat_to_motif_id()`` of any labelling of the nodes of a motif, as for
+          mfinder. Each labelled adjacency matrix is mapped to it only once and the mapping is shared by all counts.
+        * Edges connect subgraphs regardless of their direction. Parallel edges are merged and self loops are ignored.
+        * The enumeration runs in Python and its time grows with the number of subgraphs, which grows quickly with the
+          motif size and the degrees of the nodes. Large graphs are better sampled.
+
+    This counter supports the following parameters:
+
+    :param motif_size: Motif size (3 <= motif_size <= 6) (Default ``3``)
+    :type motif_size: Integer
+    :param is_undirected: Set if the input network is **not** directed. (Default ``False``)
+    :type is_undirected: Bool
+    :param sampling_probabilities: Comma separated probability of each depth of RAND-ESU, one per node of the motif
+                                   (Default ``""``, full enumeration)
+    :type sampling_probabilities: String
+    :param random_seed: Seed of the random number generator of RAND-ESU (Default ``0``)
+    :type random_seed: Integer
+    """
+    # (motif_size, labelled key) -> motif_id, see ``_get_motif_id()``
+    _motif_ids = {}
+
+    def __init__(self):
+        parameters = [PyMotifCounterParameterInt(name="motif_size",
+                                                 alias="motif_size",
+                                                 help_str="Motif size to search",
+                                                 default_value=3,
+                                                 validation_callbacks=(is_ge(3), is_le(6))),
+                      PyMotifCounterParameterFlag(name="is_undirected",
+                                                  alias="is_undirected",
+                                                  help_str="Input network is a non-directed network",
+                                                  default_value=False,
+                                                  is_required=False),
+                      PyMotifCounterParameterStr(name="sampling_probabilities",
+                                                 alias="sampling_probabilities",
+                                                 help_str="Comma separated probability of each depth of RAND-ESU",
+                                                 default_value="",
+                                                 validation_callbacks=(_are_probabilities(), ),
+                                                 is_required=False),
+                      PyMotifCounterParameterInt(name="random_seed",
+                                                 alias="random_seed",
+                                                 help_str="Seed of the random number generator of RAND-ESU",
+                                                 default_value=0,
+                                                 is_required=False)]
+        super().__init__(output_transformer=PyMotifCounterOutputTransformerEsu(),
+                         parameters=parameters)
+
+    def _get_sampling_probabilities(self):
+        """
+        Returns the probability of each depth of RAND-ESU, as a list of ``motif_size`` floats.
+
+        :rtype: list
+        :raises: PyMotifCounterParameterError if there is not one probability per node of the motif.
+        """
+        motif_size = self.get_parameter("motif_size").value
+        sampling_probabilities = self.get_parameter("sampling_probabilities").value
+        if sampling_probabilities == "":
+            return [1.0] * motif_size
+        probabilities = [float(a_value) for a_value in sampling_probabilities.split(",")]
+        if len(probabilities) != motif_size:
+            raise PyMotifCounterParameterError(f"{self.__class__.__name__}::sampling_probabilities must have one "
+                                               f"value per node of the motif ({motif_size}), received "
+                                               f"{len(probabilities)}.")
+        return probabilities
+
+    def _setup_batch(self):
+        batch_ctx = super()._setup_batch()
+        self._get_sampling_probabilities()
+        return batch_ctx
+
+    @classmethod
+    def _get_motif_id(cls, key, motif_size):
+        """
+        Returns the motif id of a labelled subgraph.
+
+        Notes:
+            * The key of a subgraph has two bits for each pair of its nodes ``(u, v), u < v``, ordered by ``v`` and
+              then ``u``: Whether there is an edge from ``v`` to ``u`` and whether there is one from ``u`` to ``v``.
+            * The motif id is the smallest id of the adjacency matrix of any permutation of its nodes.
+
+        :param key: The key of the subgraph, with nodes labelled by the order by which they were added to it.
+        :type key: int
+        :param motif_size: The number of nodes of the subgraph.
+        :type motif_size: int
+        :rtype: int
+        """
+        motif_id = cls._motif_ids.get((motif_size, key))
+        if motif_id is not None:
+            return motif_id
+        adj_mat = numpy.zeros((motif_size, motif_size), dtype=numpy.int64)
+        node_pairs = [(u, v) for v in range(1, motif_size) for u in range(v)]
+        for pair_index, (u, v) in enumerate(reversed(node_pairs)):
+            edge_bits = (key >> (2 * pair_index)) & 3
+            adj_mat[v, u], adj_mat[u, v] = edge_bits >> 1, edge_bits & 1
+        permutations = numpy.array(list(itertools.permutations(range(motif_size))))
+        permuted = adj_mat[permutations[:, :, None], permutations[:, None, :]].reshape(len(permutations), -1)
+        motif_id = int((permuted @ (1 << numpy.arange(motif_size ** 2 - 1, -1, -1, dtype=numpy.int64))).min())
+        cls._motif_ids[(motif_size, key)] = motif_id
+        return motif_id
+
+    @staticmethod
+    def _enumerate(neighbours, out_edges, probabilities, rng):
+        """
+        Returns the number of sampled subgraphs of each labelled key (see ``_get_motif_id()``).
+
+        :param neighbours: The neighbours of each node, regardless of the direction of their edges.
+        :type neighbours: list
+        :param out_edges: The set of the nodes that each node has edges to.
+        :type out_edges: list
+        :param probabilities: The probability of each depth, see ``_get_sampling_probabilities()``.
+        :type probabilities: list
+        :param rng: The random number generator that decides the extensions that are sampled.
+        :type rng: random.Random
+        :rtype: collections.Counter
+        """
+        motif_size = len(probabilities)
+        subgraph_counts = collections.Counter()
+
+        def extend(subgraph, extension, exclusive, root, key):
+            if len(subgraph) == motif_size:
+                subgraph_counts[key] += 1
+                return
+            probability = probabilities[len(subgraph)]
+            extension = list(extension)
+            while len(extension) > 0:
+                w = extension.pop()
+                if probability < 1 and rng.random() >= probability:
+                    continue
+                new_key = key
+                for u in subgraph:
+                    new_key = (new_key << 2) | ((u in out_edges[w]) << 1) | (w in out_edges[u])
+                extend(subgraph + [w],
+                       extension + [u for u in neighbours[w] if u > root and u not in exclusive],
+                       exclusive.union(neighbours[w]), root, new_key)
+
+        for v in range(len(neighbours)):
+            if probabilities[0] < 1 and rng.random() >= probabilities[0]:
+                continue
+            extend([v], [u for u in neighbours[v] if u > v], set(neighbours[v]).union((v, )), v, 0)
+        return subgraph_counts
+
+    def _count_motifs(self, adj_mat, ctx):
+        """
+        Enumerates (or samples) the connected subgraphs of a graph.
+
+        :param adj_mat: See ``PyMotifCounterNativeBase._count_motifs()``
+        :type adj_mat: scipy.sparse.csr_array
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: The ``motif_id, nsampled, nreal, creal_mili`` columns, in ascending order of ``motif_id``.
+        :rtype: dict
+        """
+        motif_size = self.get_parameter("motif_size").value
+        probabilities = self._get_sampling_probabilities()
+        skeleton = ((adj_mat + adj_mat.T) > 0).tocsr()
+        neighbours = [skeleton.indices[skeleton.indptr[k]:skeleton.indptr[k + 1]].tolist()
+                      for k in range(skeleton.shape[0])]
+        out_edges = [set(adj_mat.indices[adj_mat.indptr[k]:adj_mat.indptr[k + 1]].tolist())
+                     for k in range(adj_mat.shape[0])]
+
+        motif_counts = collections.Counter()
+        for key, a_count in self._enumerate(neighbours, out_edges, probabilities,
+                                            random.Random(self.get_parameter("random_seed").value)).items():
+            motif_counts[self._get_motif_id(key, motif_size)] += a_count
+
+        motif_ids = sorted(motif_counts)
+        nsampled = [motif_counts[a_motif_id] for a_motif_id in motif_ids]
+        n_subgraphs = sum(nsampled)
+        sampling_probability = math.prod(probabilities)
+        return {"motif_id": motif_ids,
+                "nsampled": nsampled,
+                "nreal": [a_count / sampling_probability for a_count in nsampled],
+                "creal_mili": [1000 * a_count / n_subgraphs for a_count in nsampled]}
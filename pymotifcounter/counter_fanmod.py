@@ -5,14 +5,28 @@ Implements the fanmod_cmd concrete counter.
 :date: Nov 2021
 """
 
-import networkx
+import re
 import pyparsing
 import pandas
 from .abstractcounter import *
 
 
 class PyMotifCounterOutputTransformerFanmod(PyMotifCounterOutputTransformerBase):
-    # TODO: MID, The parser --> DataFrame is pretty standard by now, should be incorporated in the standard round-trip
+    _columns = {"ID": "int64",
+                "Frequency": "float64",
+                "Mean_Freq": "float64",
+                "Standard_Dev": "float64",
+                "Z_Score": "float64",
+                "p_Value": "float64"}
+    _id_column = "ID"
+    _random_stats_columns = {"Frequency": ("Mean_Freq", "Standard_Dev", "Z_Score", "p_Value")}
+    # One row of the "Result overview:" table, including the rest of the rows of its adjacency matrix
+    _row_regex = re.compile(r"^[ \t]*({i})[ \t]*,[ \t]*[01]+[ \t]*,[ \t]*({f})[ \t]*%"
+                            r"(?:[ \t]*,[ \t]*({f})[ \t]*%[ \t]*,[ \t]*({f})[ \t]*,[ \t]*({f})[ \t]*,[ \t]*({f}|{i}))?"
+                            r"(?:\s*,[ \t]*[01]+)+[ \t]*$".format(i=PyMotifCounterOutputTransformerBase._int_pattern,
+                                                                f=PyMotifCounterOutputTransformerBase._float_pattern),
+                            flags=re.MULTILINE)
+
     @staticmethod
     def _get_parser():
         """
@@ -50,50 +64,46 @@ class PyMotifCounterOutputTransformerFanmod(PyMotifCounterOutputTransformerBase)
         data_parsing = pyparsing.OneOrMore(row_data)("enumeration")
         return data_parsing
 
-    def __call__(self, str_data, a_ctx):
-        """
-        Transforms the raw string output from the fanmod process to a computable pandas DataFrame
-
-        :param str_data:
-        :type str_data:
-        :param a_ctx: Dictionary of context information from the subsequent execution steps
-        :type a_ctx: dict
-        :return: A DataFrame with all enumerated motifs according to fanmod's algorithm.
-        :rtype: pandas.DataFrame
+    def _parse_fast(self, str_data):
         """
-        parsed_output = self._get_parser().searchString(str_data)
-        # TODO: LOW, Revise the parser so that it only has one root level.
-        # Notice here how the parser's row field names are propagated to the columns of the returned DataFrame
-        df_output = pandas.DataFrame(columns=list(filter(lambda x: x != "Adj_Matrix",
-                                                         parsed_output[0]["enumeration"][0].keys())),
-                                     index=None)
-        for a_row_idx, a_row_data in enumerate(parsed_output[0]["enumeration"]):
-            # TODO: HIGH, The conversion can be performed more automatically through pandas rather than a loop
-            df_output.at[a_row_idx, "ID"] = a_row_data["ID"]
-            df_output.at[a_row_idx, "Frequency"] = a_row_data["Frequency"]
-            # Fanmod produces different outputs depending on whether the random net population was produced
-            if "Mean_Freq" in a_row_data:
-                df_output.at[a_row_idx, "Mean_Freq"] = a_row_data["Mean_Freq"]
-                df_output.at[a_row_idx, "Standard_Dev"] = a_row_data["Standard_Dev"]
-                df_output.at[a_row_idx, "Z_Score"] = a_row_data["Z_Score"]
-                df_output.at[a_row_idx, "p_Value"] = a_row_data["p_Value"]
-        return df_output
+        Scans the "Result overview:" section of fanmod's output with a regular expression.
 
-
-class PyMotifCounterInputTransformerFanmod(PyMotifCounterInputTransformerBase):
-    def __call__(self, a_graph):
+        :param str_data: The raw string output of the fanmod process
+        :type str_data: str
+        :return: A dictionary of column name to (string) values or None if the table could not be scanned.
+        :rtype: dict
         """
-        Returns a generator over a graph's edge list representation.
+        column_data = self._scan_table(str_data, self._row_regex, list(self._columns.keys()))
+        if column_data is None:
+            return None
+        # Fanmod produces different outputs depending on whether the random net population was produced, the
+        # statistics columns are only included if they are present in the output.
+        has_stats = column_data["Mean_Freq"] != ""
+        if has_stats.all():
+            return column_data
+        if has_stats.any():
+            return None
+        return {"ID": column_data["ID"], "Frequency": column_data["Frequency"]}
+
+    def _parse_grammar(self, str_data):
+        """
+        Parses the raw string output from the fanmod process with the pyparsing grammar.
 
-        :param a_graph: The networkx graph to transform
-        :type a_graph: <<networkx.Graph>>
-        :returns: A generator for each line of the edge list
-        :rtype: generator
+        :param str_data: The raw string output of the fanmod process
+        :type str_data: str
+        :return: A dictionary of column name to values for all enumerated motifs according to fanmod's algorithm.
+        :rtype: dict
+        :raises: PyMotifCounterError if the output does not contain the enumeration.
         """
-        # Obtain network representation
-        # First of all, encode the node ID to a number.
-        nodeid_to_num = dict(zip(a_graph.nodes(), range(1, a_graph.number_of_nodes()+1)))
-        return (f"{nodeid_to_num[x[0]]}\t{nodeid_to_num[x[1]]}\n" for x in networkx.to_edgelist(a_graph))
+        parsed_output = self._get_cached_parser().searchString(str_data)
+        # Fanmod produces different outputs depending on whether the random net population was produced, the
+        # statistics columns are only included if they are present in the output.
+        rows = self._get_enumeration(parsed_output)
+        return self._rows_to_columns(rows)
+
+
+class PyMotifCounterInputTransformerFanmod(PyMotifCounterInputTransformerBase):
+    _edge_format = "%d\t%d\n"
 
 
 class PyMotifCounterFanmod(PyMotifCounterBase):
@@ -5,13 +5,29 @@ Implements the mfinder concrete counter.
 :date: Nov 2021
 """
 
-import networkx
+import re
 import pyparsing
 import pandas
 from .abstractcounter import *
 
 
 class PyMotifCounterOutputTransformerMfinder(PyMotifCounterOutputTransformerBase):
+    _columns = {"motif_id": "int64",
+                "nreal": "int64",
+                "nrand_stats_m": "float64",
+                "nrand_stats_s": "float64",
+                "nreal_z_score": "float64",
+                "nreal_pval": "float64",
+                "creal_mili": "float64",
+                "uniq": "int64"}
+    _id_column = "motif_id"
+    _random_stats_columns = {"nreal": ("nrand_stats_m", "nrand_stats_s", "nreal_z_score", "nreal_pval")}
+    # One row of the "Full list of subgraphs size k ids:" table
+    _row_regex = re.compile(r"^[ \t]*({i})[ \t]+({i})[ \t]+({f})[ \t]*\+-[ \t]*({f})[ \t]+({f}|{i})[ \t]+({f})[ \t]+({f})"
+                            r"[ \t]+({i})[ \t]*$".format(i=PyMotifCounterOutputTransformerBase._int_pattern,
+                                                        f=PyMotifCounterOutputTransformerBase._float_pattern),
+                            flags=re.MULTILINE)
+
     @staticmethod
     def _get_parser():
         """
@@ -34,51 +50,34 @@ class PyMotifCounterOutputTransformerMfinder(PyMotifCounterOutputTransformerBase
         data_parsing = pyparsing.OneOrMore(row_data)("enumeration")
         return data_parsing
 
-    def __call__(self, str_data, a_ctx=None):
+    def _parse_fast(self, str_data):
         """
-        Transforms the raw string output from the mfinder process to a computable pandas DataFrame
-
-        :param str_data:
-        :type str_data:
-        :param a_ctx: Dictionary of context information from the subsequent execution steps
-        :type a_ctx: dict
-        :return: A DataFrame with all enumerated motifs according to mfinder's algorithm.
-        :rtype: pandas.DataFrame
+        Scans the "Full list of subgraphs size k ids:" section of mfinder's output with a regular expression.
+
+        :param str_data: The raw string output of the mfinder process
+        :type str_data: str
+        :return: A dictionary of column name to (string) values or None if the table could not be scanned.
+        :rtype: dict
         """
-        parsed_output = self._get_parser().searchString(str_data)
-        # TODO: LOW, Revise the parser so that it only has one root level.
-        # Notice here how the parser's row field names are propagated to the columns of the returned DataFrame
-        df_output = pandas.DataFrame(columns=list(parsed_output[0]["enumeration"][0].keys()), index=None)
-        for a_row_idx, a_row_data in enumerate(parsed_output[0]["enumeration"]):
-            # TODO: HIGH, The conversion can be performed more automatically through pandas rather than a loop
-            df_output.at[a_row_idx, "motif_id"] = a_row_data["motif_id"]
-            df_output.at[a_row_idx, "nreal"] = a_row_data["nreal"]
-            df_output.at[a_row_idx, "nrand_stats_m"] = a_row_data["nrand_stats_m"]
-            df_output.at[a_row_idx, "nrand_stats_s"] = a_row_data["nrand_stats_s"]
-            df_output.at[a_row_idx, "nreal_z_score"] = a_row_data["nreal_z_score"]
-            df_output.at[a_row_idx, "nreal_pval"] = a_row_data["nreal_pval"]
-            df_output.at[a_row_idx, "creal_mili"] = a_row_data["creal_mili"]
-            df_output.at[a_row_idx, "uniq"] = a_row_data["uniq"]
-        return df_output
+        return self._scan_table(str_data, self._row_regex, list(self._columns.keys()))
 
+    def _parse_grammar(self, str_data):
+        """
+        Parses the raw string output from the mfinder process with the pyparsing grammar.
 
-class PyMotifCounterInputTransformerMfinder(PyMotifCounterInputTransformerBase):
-    def __call__(self, a_graph):
+        :param str_data: The raw string output of the mfinder process
+        :type str_data: str
+        :return: A dictionary of column name to values for all enumerated motifs according to mfinder's algorithm.
+        :rtype: dict
+        :raises: PyMotifCounterError if the output does not contain the enumeration.
         """
-        Transforms a graph from a Networkx representation to a flat string.
+        parsed_output = self._get_cached_parser().searchString(str_data)
+        rows = self._get_enumeration(parsed_output)
+        return self._rows_to_columns(rows)
 
-        Notes:
-            * Usually, the flat string representation is in the form of an edgelist that conforms to whatever
-              format each process expects in its input.
 
-        :param a_graph: The Networkx graph of which we wish to enumerate motifs.
-        :return: A flat edge list with a format that depends on what each algorithms expects.
-        :rtype: str
-        """
-        # Obtain network representation
-        # First of all, encode the node ID to a number.
-        nodeid_to_num = dict(zip(a_graph.nodes(), range(1, a_graph.number_of_nodes()+1)))
-        return (f"{nodeid_to_num[x[0]]}\t{nodeid_to_num[x[1]]}\t1\n" for x in networkx.to_edgelist(a_graph))
+class PyMotifCounterInputTransformerMfinder(PyMotifCounterInputTransformerBase):
+    _edge_format = "%d\t%d\t1\n"
 
 
 class PyMotifCounterMfinder(PyMotifCounterBase):
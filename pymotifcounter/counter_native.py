@@ -0,0 +1,457 @@
+"""
+Implements counters that enumerate motifs in the Python process, without an external binary.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import time
+import math
+import asyncio
+import numpy
+from .abstractcounter import *
+from .validators import *
+from .counter_pgd import PyMotifCounterOutputTransformerPgd
+
+# scipy is an optional dependency that is only required by the native counters
+try:
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
+
+class PyMotifCounterOutputTransformerNative(PyMotifCounterOutputTransformerBase):
+    """
+    Converts the columns that a native counter computes to a DataFrame.
+    """
+    def _parse_fast(self, column_data):
+        return column_data
+
+    def _parse_grammar(self, column_data):
+        return column_data
+
+
+class PyMotifCounterNativeBase(PyMotifCounterBase):
+    """
+    A counter that enumerates motifs in the Python process, rather than by running a binary.
+
+    Notes:
+        * Native counters accept the same graphs as the counters of binaries (see
+          ``PyMotifCounterInputTransformerBase._get_edge_array()``) and identify motifs with the same ``motif_id``
+          encoding as mfinder (see ``util.adj_mat_to_motif_id()``).
+        * Concrete native counters implement ``_count_motifs()``, that enumerates the motifs of the sparse adjacency
+          matrix of a graph.
+        * Counts run in the calling thread (or in the default executor of the event loop, for ``count_async()``),
+          therefore ``timeout, kill_grace, salvage_partial`` do not apply and the ``process_spawn, process_exit``
+          hooks are not fired. The ``process_time`` of their stats is the time of the enumeration.
+        * Native counters require ``scipy`` (the ``sparse`` extra of pymotifcounter).
+    """
+    def __init__(self, output_transformer, parameters):
+        """
+        Initialises a native counter.
+
+        :param output_transformer: The transformer that converts the columns returned by ``_count_motifs()`` to
+                                   a DataFrame.
+        :type output_transformer: PyMotifCounterOutputTransformerNative
+        :param parameters: A list of ``PyMotifCounterParameter`` instances describing the parameters of the algorithm.
+        :type parameters: list
+        """
+        if scipy is None:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::Native counters require scipy.")
+
+        super().__init__(binary_location=None,
+                         input_parameter=PyMotifCounterParameterFilepath(name="native_in",
+                                                                         alias="native_in",
+                                                                         default_value="-",
+                                                                         is_required=False),
+                         output_parameter=PyMotifCounterParameterFilepath(name="native_out",
+                                                                          alias="native_out",
+                                                                          default_value="-",
+                                                                          is_required=False),
+                         input_transformer=PyMotifCounterInputTransformerBase(),
+                         output_transformer=output_transformer,
+                         parameters=parameters)
+
+    @staticmethod
+    def _get_adj_mat(edges, n_nodes, is_undirected=False):
+        """
+        Returns the sparse adjacency matrix of a graph.
+
+        Notes:
+            * Parallel edges are merged and self loops are removed.
+
+        :param edges: An ``(n_edges, 2)`` array of source and target node indices.
+        :type edges: numpy.ndarray
+        :param n_nodes: The number of nodes of the graph.
+        :type n_nodes: int
+        :param is_undirected: Whether edges are undirected, in which case the matrix is symmetric.
+        :type is_undirected: bool
+        :returns: An ``(n_nodes, n_nodes)`` matrix of 0 / 1 ``int64`` elements, with sorted indices.
+        :rtype: scipy.sparse.csr_array
+        """
+        edges = numpy.asarray(edges)
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        if is_undirected:
+            edges = numpy.concatenate([edges, edges[:, ::-1]])
+        adj_mat = scipy.sparse.csr_array((numpy.ones(len(edges), dtype=numpy.int64), (edges[:, 0], edges[:, 1])),
+                                         shape=(n_nodes, n_nodes))
+        adj_mat.sum_duplicates()
+        adj_mat.data[:] = 1
+        return adj_mat
+
+    def _count_motifs(self, adj_mat, ctx):
+        """
+        Enumerates the motifs of a graph.
+
+        :param adj_mat: The adjacency matrix of the graph, as returned by ``_get_adj_mat()``.
+        :type adj_mat: scipy.sparse.csr_array
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: A dictionary of column name to values, as expected by the output transformer.
+        :rtype: dict
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}::_count_motifs() is not implemented.")
+
+    def _is_undirected(self):
+        """
+        Returns whether the graphs of the counter are undirected (Default: ``is_undirected`` parameter, if any).
+        """
+        return "is_undirected" in self._parameters and self.get_parameter("is_undirected").value
+
+    def _setup_batch(self):
+        """
+        Validates the parameters of a batch of counts.
+
+        Notes:
+            * Native counters do not have temporary files or process parameters.
+
+        :returns: See ``PyMotifCounterBase._setup_batch()``
+        :rtype: dict
+        :raises: PyMotifCounterParameterError from the validation step.
+        """
+        self.validate_parameters()
+        return {"base_tmp_dir": None,
+                "base_cwd": None,
+                "base_input_file": None,
+                "base_output_file": None,
+                "base_timeout": self._timeout,
+                "base_parameters": []}
+
+    def _teardown_batch(self, batch_ctx):
+        pass
+
+    def _prepare_input(self, ctx):
+        """
+        Transforms the graph of a count to its sparse adjacency matrix (as ``base_transformed_graph``).
+
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: The context of the count, ready to be passed to ``_run()``.
+        :rtype: dict
+        """
+        a_graph = ctx["base_original_graph"]
+        if isinstance(a_graph, PyMotifCounterPreparedGraph):
+            if a_graph.graph is None:
+                raise PyMotifCounterError(f"{self.__class__.__name__}::The graph of the prepared graph is not "
+                                          f"available.")
+            a_graph = a_graph.graph
+        with ctx["base_stats"].timer("transform_time"):
+            edges, n_nodes = self._input_transformer._get_edge_array(a_graph)
+            ctx.update({"base_transformed_graph": self._get_adj_mat(edges, n_nodes, self._is_undirected())})
+        return self._before_run(ctx)
+
+    def _get_cache_key(self, ctx):
+        """
+        Returns the key that identifies the result of a count in a ``PyMotifCounterResultCache``.
+
+        Notes:
+            * The key is derived from the counter class, the value of each parameter and the adjacency matrix of the
+              graph.
+
+        :param ctx: The context of a count, as returned by ``_count_prepare()``.
+        :type ctx: dict
+        :rtype: str
+        """
+        adj_mat = ctx["base_transformed_graph"]
+        return PyMotifCounterResultCache.make_key(f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+                                                  "\0".join(f"{a_param._name}={a_param.value!r}" for a_param in
+                                                            sorted(set(self._parameters.values()),
+                                                                   key=lambda x: x._name)),
+                                                  str(adj_mat.shape),
+                                                  adj_mat.indptr.astype(numpy.int64).tobytes(),
+                                                  adj_mat.indices.astype(numpy.int64).tobytes())
+
+    def _run(self, ctx):
+        """
+        Enumerates the motifs of the graph of a count (see ``_count_motifs()``).
+
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: Updated context, **including** ``base_proc_response`` (the columns returned by
+                  ``_count_motifs()``).
+        :rtype: dict
+        """
+        start_time = time.perf_counter()
+        column_data = self._count_motifs(ctx["base_transformed_graph"], ctx)
+        ctx["base_stats"].process_time = time.perf_counter() - start_time
+        ctx["base_stats"].returncode = 0
+        ctx.update({"base_proc_response": column_data,
+                    "base_proc_error": "",
+                    "base_proc_returncode": 0,
+                    "base_timed_out": False})
+        return ctx
+
+    async def _run_async(self, ctx):
+        """
+        Enumerates the motifs of the graph of a count in the default executor of the running event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self._run, ctx)
+
+
+class PyMotifCounterOutputTransformerNativeTriads(PyMotifCounterOutputTransformerNative):
+    _columns = {"motif_id": "int64",
+                "nreal": "int64",
+                "creal_mili": "float64"}
+    _id_column = "motif_id"
+    _random_stats_columns = {"nreal": ("nrand_stats_m", "nrand_stats_s", "nreal_z_score", "nreal_pval")}
+
+
+class PyMotifCounterNativeTriads(PyMotifCounterNativeBase):
+    """
+    Counts the connected size 3 motifs (triads) of a graph with sparse matrix algebra, without an external binary.
+
+    Notes:
+        * Returns the count (``nreal``) and concentration per thousand (``creal_mili``) of each of the 13 directed
+          (or 2 undirected) connected triads, identified by their mfinder ``motif_id``. All triads are listed, even if
+          they do not occur in the graph.
+        * Each connected triad has at least one node that is adjacent to the other two. Triads that are not triangles
+          have exactly one such node and are counted from the number of pairs of neighbours of each node (by the
+          direction of their edges to it), less those pairs that are adjacent to each other. Triangles are counted by
+          the direction of the edges at each of their nodes, along with direct counts of transitive, cyclic and
+          mutual triangles.
+        * Parallel edges are merged and self loops are ignored.
+
+    This counter supports the following parameters:
+
+    :param motif_size: Motif size (only ``3``)
+    :type motif_size: Integer
+    :param is_undirected: Set if the input network is **not** directed. (Default ``False``)
+    :type is_undirected: Bool
+    """
+    # The mfinder motif id of each triad (by its name in the triad census, see ``networkx.triadic_census()``), which is
+    # the smallest id of any labelling of its nodes.
+    _triad_ids = {"021D": 6, "021C": 12, "111U": 14, "021U": 36, "030T": 38, "120U": 46, "111D": 74, "201": 78,
+                  "030C": 98, "120C": 102, "120D": 108, "210": 110, "300": 238}
+    _undirected_triad_ids = {"path": 78, "triangle": 238}
+
+    def __init__(self):
+        parameters = [PyMotifCounterParameterInt(name="motif_size",
+                                                 alias="motif_size",
+                                                 help_str="Motif size to search",
+                                                 default_value=3,
+                                                 validation_callbacks=(is_eq(3), )),
+                      PyMotifCounterParameterFlag(name="is_undirected",
+                                                  alias="is_undirected",
+                                                  help_str="Input network is a non-directed network",
+                                                  default_value=False,
+                                                  is_required=False)]
+        super().__init__(output_transformer=PyMotifCounterOutputTransformerNativeTriads(),
+                         parameters=parameters)
+
+    @staticmethod
+    def _count_undirected_triads(adj_mat):
+        """
+        Returns the number of open (path) and closed (triangle) triads of a symmetric adjacency matrix.
+        """
+        degree = adj_mat.sum(axis=1)
+        n_triangles = int((adj_mat @ adj_mat).multiply(adj_mat).sum()) // 6
+        return {"path": int((degree * (degree - 1) // 2).sum()) - 3 * n_triangles,
+                "triangle": n_triangles}
+
+    @staticmethod
+    def _count_directed_triads(adj_mat):
+        """
+        Returns the number of each connected triad of an adjacency matrix, by its name in the triad census.
+        """
+        adj_mat_t = adj_mat.T.tocsr()
+        # The mutual, outgoing and incoming edges of each node and the (undirected) skeleton of the graph
+        mutual = adj_mat.multiply(adj_mat_t).tocsr()
+        out_edges = (adj_mat - mutual).tocsr()
+        edges = {"m": mutual, "o": out_edges, "i": out_edges.T.tocsr()}
+        skeleton = (adj_mat + adj_mat_t - mutual).tocsr()
+        degree = {a_type: an_edges.sum(axis=1) for a_type, an_edges in edges.items()}
+
+        # The pairs of neighbours of each node by the type of their edges to it, that are adjacent (closed) or not
+        # (open) to each other.
+        closed, open_ = {}, {}
+        for a_type, another_type in [("o", "o"), ("i", "i"), ("m", "m"), ("o", "i"), ("m", "o"), ("m", "i")]:
+            n_closed = int((edges[a_type] @ skeleton).multiply(edges[another_type]).sum())
+            if a_type == another_type:
+                n_closed //= 2
+                n_pairs = int((degree[a_type] * (degree[a_type] - 1) // 2).sum())
+            else:
+                n_pairs = int((degree[a_type] * degree[another_type]).sum())
+            closed[a_type + another_type] = n_closed
+            open_[a_type + another_type] = n_pairs - n_closed
+
+        # Triangles
+        out_edges_2 = out_edges @ out_edges
+        n_030t = int(out_edges_2.multiply(out_edges).sum())
+        n_030c = int(out_edges_2.multiply(edges["i"]).sum()) // 3
+        n_300 = int((mutual @ mutual).multiply(mutual).sum()) // 6
+
+        # Each triangle is a closed pair of neighbours of each of its nodes. 120D / 120U / 120C triangles have a
+        # node whose edges to the others are both outgoing / incoming / one of each, that 030T / 030C ones also have.
+        return {"021D": open_["oo"], "021U": open_["ii"], "021C": open_["oi"], "111U": open_["mo"],
+                "111D": open_["mi"], "201": open_["mm"], "030T": n_030t, "030C": n_030c,
+                "120D": closed["oo"] - n_030t, "120U": closed["ii"] - n_030t,
+                "120C": closed["oi"] - n_030t - 3 * n_030c, "210": closed["mm"] - 3 * n_300, "300": n_300}
+
+    def _count_motifs(self, adj_mat, ctx):
+        """
+        Counts the connected triads of a graph.
+
+        :param adj_mat: See ``PyMotifCounterNativeBase._count_motifs()``
+        :type adj_mat: scipy.sparse.csr_array
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: The ``motif_id, nreal, creal_mili`` columns, in ascending order of ``motif_id``.
+        :rtype: dict
+        """
+        if self._is_undirected():
+            triad_counts, triad_ids = self._count_undirected_triads(adj_mat), self._undirected_triad_ids
+        else:
+            triad_counts, triad_ids = self._count_directed_triads(adj_mat), self._triad_ids
+        n_triads = sum(triad_counts.values())
+        nreal = [triad_counts[a_triad] for a_triad in triad_ids]
+        return {"motif_id": list(triad_ids.values()),
+                "nreal": nreal,
+                "creal_mili": [1000 * a_count / n_triads if n_triads > 0 else 0.0 for a_count in nreal]}
+
+
+class PyMotifCounterOutputTransformerNativeGraphlets(PyMotifCounterOutputTransformerNative):
+    _columns = PyMotifCounterOutputTransformerPgd._columns
+    _id_column = PyMotifCounterOutputTransformerPgd._id_column
+    _random_stats_columns = PyMotifCounterOutputTransformerPgd._random_stats_columns
+
+
+class PyMotifCounterNativeGraphlets(PyMotifCounterNativeBase):
+    """
+    Counts the undirected 2, 3 and 4 node graphlets of a graph combinatorially, without an external binary.
+
+    Notes:
+        * Returns the same ``motif_id, count`` DataFrame as ``PyMotifCounterPgd`` (the total count of each graphlet,
+          connected or not, in the same order).
+        * Edges are undirected and, as for pgd, nodes without any edges are not part of the graph. Parallel edges are
+          merged and self loops are ignored.
+        * Only triangles, 4-cliques and the common neighbours of pairs of nodes are counted directly (with sparse
+          matrix products). Every other graphlet is derived from these and the degrees of the nodes, by the
+          number of times that each graphlet occurs within the others. The memory that this requires grows with the
+          number of paths of length 2 of the graph.
+    """
+    # The graphlets in the order of pgd's output, by their names in it
+    _graphlet_names = ["total_2_1edge", "total_2_indep",
+                       "total_3_tris", "total_2_star", "total_3_1edge", "total_3_indep",
+                       "total_4_clique", "total_4_chordcycle", "total_4_tailed_tris", "total_4_cycle", "total_3_star",
+                       "total_4_path", "total_4_1edge", "total_4_2edge", "total_4_2star", "total_4_tri",
+                       "total_4_indep"]
+    # The number of edges whose triangles are enumerated at once, while counting 4-cliques
+    _block_size = 65536
+
+    def __init__(self):
+        super().__init__(output_transformer=PyMotifCounterOutputTransformerNativeGraphlets(),
+                         parameters=[])
+
+    def _is_undirected(self):
+        return True
+
+    def _count_cliques(self, upper_adj_mat):
+        """
+        Returns the number of 4-cliques of a graph, given the upper triangle of its adjacency matrix.
+
+        Notes:
+            * The triangles ``(u, v, w), u < v < w`` of each edge ``(u, v)`` are the common neighbours ``w > v`` of
+              its nodes and each of them is in as many 4-cliques as the common neighbours ``x > w`` of all three.
+        """
+        sources, targets = upper_adj_mat.nonzero()
+        n_cliques = 0
+        for block_start in range(0, len(sources), self._block_size):
+            block = slice(block_start, block_start + self._block_size)
+            triangles = upper_adj_mat[sources[block]].multiply(upper_adj_mat[targets[block]]).tocsr()
+            n_cliques += int((triangles @ upper_adj_mat).multiply(triangles).sum())
+        return n_cliques
+
+    def _count_motifs(self, adj_mat, ctx):
+        """
+        Counts the graphlets of a graph.
+
+        :param adj_mat: See ``PyMotifCounterNativeBase._count_motifs()``
+        :type adj_mat: scipy.sparse.csr_array
+        :param ctx: The context of the count.
+        :type ctx: dict
+        :returns: The ``motif_id, count`` columns.
+        :rtype: dict
+        """
+        degree = adj_mat.sum(axis=1)
+        n_nodes = int((degree > 0).sum())
+        upper_adj_mat = scipy.sparse.triu(adj_mat, k=1, format="csr")
+        sources, targets = upper_adj_mat.nonzero()
+        n_edges = len(sources)
+
+        # Common neighbours of each pair of nodes, triangles of each edge and of each node
+        common_neighbours = (adj_mat @ adj_mat).tocsr()
+        edge_triangles = numpy.asarray(common_neighbours[sources, targets]).ravel()
+        node_triangles = common_neighbours.multiply(adj_mat).sum(axis=1) // 2
+        common_neighbours.setdiag(0)
+        common_neighbours.eliminate_zeros()
+
+        n_triangles = int(edge_triangles.sum()) // 3
+        n_paths_2 = int((degree * (degree - 1) // 2).sum()) - 3 * n_triangles
+        n_cliques = self._count_cliques(upper_adj_mat)
+
+        # The number of (not necessarily induced) subgraphs of each connected 4 node graphlet
+        n_stars = int((degree * (degree - 1) * (degree - 2) // 6).sum())
+        n_paths_3 = int(((degree[sources] - 1) * (degree[targets] - 1)).sum()) - 3 * n_triangles
+        n_tailed_triangles = int((node_triangles * (degree - 2)).sum())
+        n_cycles = int((common_neighbours.data * (common_neighbours.data - 1) // 2).sum()) // 4
+        n_chordal_cycles = int((edge_triangles * (edge_triangles - 1) // 2).sum())
+
+        # Induced counts, less the subgraphs of each graphlet that are within denser graphlets
+        graphlets = {"total_4_clique": n_cliques}
+        graphlets["total_4_chordcycle"] = n_chordal_cycles - 6 * n_cliques
+        graphlets["total_4_cycle"] = n_cycles - graphlets["total_4_chordcycle"] - 3 * n_cliques
+        graphlets["total_4_tailed_tris"] = n_tailed_triangles - 4 * graphlets["total_4_chordcycle"] - 12 * n_cliques
+        graphlets["total_3_star"] = (n_stars - graphlets["total_4_tailed_tris"] - 2 * graphlets["total_4_chordcycle"] -
+                                     4 * n_cliques)
+        graphlets["total_4_path"] = (n_paths_3 - 2 * graphlets["total_4_tailed_tris"] - 4 * graphlets["total_4_cycle"] -
+                                     6 * graphlets["total_4_chordcycle"] - 12 * n_cliques)
+
+        # Graphlets that are not connected, from the subgraphs that they have in common with the connected ones
+        graphlets["total_4_tri"] = (n_triangles * (n_nodes - 3) - graphlets["total_4_tailed_tris"] -
+                                    2 * graphlets["total_4_chordcycle"] - 4 * n_cliques)
+        graphlets["total_4_2star"] = (n_paths_2 * (n_nodes - 3) - 3 * graphlets["total_3_star"] -
+                                      2 * graphlets["total_4_path"] - 4 * graphlets["total_4_cycle"] -
+                                      2 * graphlets["total_4_tailed_tris"] - 2 * graphlets["total_4_chordcycle"])
+        graphlets["total_4_2edge"] = (math.comb(n_edges, 2) - int((degree * (degree - 1) // 2).sum()) -
+                                      graphlets["total_4_path"] - 2 * graphlets["total_4_cycle"] -
+                                      graphlets["total_4_tailed_tris"] - 2 * graphlets["total_4_chordcycle"] -
+                                      3 * n_cliques)
+        # Each 4 node graphlet is in as many of the edge / node pair combinations as it has edges
+        graphlet_edges = {"total_4_2edge": 2, "total_4_2star": 2, "total_4_tri": 3, "total_3_star": 3,
+                          "total_4_path": 3, "total_4_cycle": 4, "total_4_tailed_tris": 4, "total_4_chordcycle": 5,
+                          "total_4_clique": 6}
+        graphlets["total_4_1edge"] = n_edges * math.comb(max(n_nodes - 2, 0), 2) - sum(
+            a_count * graphlets[a_graphlet] for a_graphlet, a_count in graphlet_edges.items())
+        graphlets["total_4_indep"] = math.comb(n_nodes, 4) - sum(graphlets.values())
+
+        graphlets["total_3_tris"] = n_triangles
+        graphlets["total_2_star"] = n_paths_2
+        graphlets["total_3_1edge"] = n_edges * max(n_nodes - 2, 0) - 2 * n_paths_2 - 3 * n_triangles
+        graphlets["total_3_indep"] = (math.comb(n_nodes, 3) - graphlets["total_3_1edge"] - n_paths_2 -
+                                      n_triangles)
+        graphlets["total_2_1edge"] = n_edges
+        graphlets["total_2_indep"] = math.comb(n_nodes, 2) - n_edges
+
+        return {"motif_id": [PyMotifCounterOutputTransformerPgd._graphlet_to_id[a_graphlet]
+                             for a_graphlet in self._graphlet_names],
+                "count": [graphlets[a_graphlet] for a_graphlet in self._graphlet_names]}
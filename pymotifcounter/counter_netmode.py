@@ -5,15 +5,39 @@ Implements the NetMODE concrete counter.
 :date: Nov 2021
 """
 
-import os
-import itertools
-import networkx
+import re
 import pyparsing
 import pandas
 from .abstractcounter import *
 
 
 class PyMotifCounterOutputTransformerNetMODE(PyMotifCounterOutputTransformerBase):
+    _columns = {"gID": "int64",
+                "freq": "int64",
+                "ave_rand_freq": "float64",
+                "conc": "float64",
+                "ave_rand_conc": "float64",
+                "f-ZScore": "float64",
+                "f-pValue": "float64",
+                "c-ZScore": "float64",
+                "c-pValue": "float64",
+                "ave_rand_freq_sd": "float64",
+                "ave_rand_conc_sd": "float64"}
+    _id_column = "gID"
+    _random_stats_columns = {"freq": ("ave_rand_freq", "ave_rand_freq_sd", "f-ZScore", "f-pValue"),
+                             "conc": ("ave_rand_conc", "ave_rand_conc_sd", "c-ZScore", "c-pValue")}
+    _header_regex = re.compile(r"\s*calc Z-Score")
+    # One line of the z-score table
+    _row_regex = re.compile(r"^[ \t]*gID:[ \t]*({i})[ \t]+freq:[ \t]*({i})"
+                            r"[ \t]+ave_rand_freq:[ \t]*({f})[ \t]*\(sd:[ \t]*({f})[ \t]*\)"
+                            r"[ \t]+conc:[ \t]*({f})"
+                            r"[ \t]+ave_rand_conc:[ \t]*({f})[ \t]*\(sd:[ \t]*({f})[ \t]*\)"
+                            r"[ \t]+f-ZScore:[ \t]*({f})[ \t]+f-pValue:[ \t]*({f})"
+                            r"[ \t]+c-ZScore:[ \t]*({f})[ \t]+c-pValue:[ \t]*({f})[ \t]*$".format(
+                                i=PyMotifCounterOutputTransformerBase._int_pattern,
+                                f=PyMotifCounterOutputTransformerBase._float_pattern),
+                            flags=re.MULTILINE)
+
     @staticmethod
     def _get_parser():
         """
@@ -42,58 +66,69 @@ class PyMotifCounterOutputTransformerNetMODE(PyMotifCounterOutputTransformerBase
         data_parsing = (pyparsing.Suppress(r"calc Z-Score") + pyparsing.ZeroOrMore(row_data))("zscore")
         return data_parsing
 
-    def __call__(self, str_data, ctx=None):
+    def _parse_fast(self, str_data):
+        """
+        Scans the output of NetMODE with a regular expression.
+
+        :param str_data: The raw string output of the NetMODE process
+        :type str_data: str
+        :returns: A dictionary of column name to (string) values or None if the output could not be scanned.
+        :rtype: dict
         """
-        Transforms the output of NetMODE to a computable form (pandas.DataFrame)
-
-        :param str_data:
-        :type str_data:
-        :param ctx:
-        :type ctx:
-        :returns:
-        :rtype:
+        header = self._header_regex.match(str_data)
+        if header is None:
+            return None
+        return self._scan_table(str_data[header.end():], self._row_regex,
+                                ["gID", "freq", "ave_rand_freq", "ave_rand_freq_sd", "conc", "ave_rand_conc",
+                                 "ave_rand_conc_sd", "f-ZScore", "f-pValue", "c-ZScore", "c-pValue"],
+                                anchored=True)
+
+    def _parse_grammar(self, str_data):
+        """
+        Parses the output of NetMODE with the pyparsing grammar.
+
+        :param str_data: The raw string output of the NetMODE process
+        :type str_data: str
+        :returns: A dictionary of column name to values for all enumerated motifs.
+        :rtype: dict
         """
         # Process the output (if succesful)
-        output_data = self._get_parser().parseString(str_data)
-        ret_dataframe = pandas.DataFrame(
-            columns=list(output_data["zscore"][0].keys()) + ["ave_rand_freq_sd", "ave_rand_conc_sd"], index=None)
-        for an_item_idx, an_item in enumerate(output_data["zscore"]):
-            ret_dataframe.at[an_item_idx, "gID"] = an_item["gID"]
-            ret_dataframe.at[an_item_idx, "freq"] = an_item["freq"]
-            ret_dataframe.at[an_item_idx, "conc"] = an_item["conc"]
-            ret_dataframe.at[an_item_idx, "f-ZScore"] = an_item["f-ZScore"]
-            ret_dataframe.at[an_item_idx, "f-pValue"] = an_item["f-pValue"]
-            ret_dataframe.at[an_item_idx, "c-ZScore"] = an_item["c-ZScore"]
-            ret_dataframe.at[an_item_idx, "c-pValue"] = an_item["c-pValue"]
-            ret_dataframe.at[an_item_idx, "ave_rand_freq"] = an_item["ave_rand_freq"]["ave_rand_freq"]
-            ret_dataframe.at[an_item_idx, "ave_rand_conc"] = an_item["ave_rand_conc"]["ave_rand_conc"]
-            ret_dataframe.at[an_item_idx, "ave_rand_freq_sd"] = an_item["ave_rand_freq"]["sd"]
-            ret_dataframe.at[an_item_idx, "ave_rand_conc_sd"] = an_item["ave_rand_conc"]["sd"]
-        return ret_dataframe
+        output_data = self._get_cached_parser().parseString(str_data)
+        rows = output_data["zscore"]
+        column_data = self._rows_to_columns(rows, ["gID", "freq", "conc", "f-ZScore", "f-pValue", "c-ZScore",
+                                                   "c-pValue"])
+        # The random graph statistics are grouped along with their standard deviation
+        column_data.update({"ave_rand_freq": [a_row["ave_rand_freq"]["ave_rand_freq"] for a_row in rows],
+                            "ave_rand_conc": [a_row["ave_rand_conc"]["ave_rand_conc"] for a_row in rows],
+                            "ave_rand_freq_sd": [a_row["ave_rand_freq"]["sd"] for a_row in rows],
+                            "ave_rand_conc_sd": [a_row["ave_rand_conc"]["sd"] for a_row in rows]})
+        return column_data
 
 
 class PyMotifCounterInputTransformerNetMODE(PyMotifCounterInputTransformerBase):
-    def __call__(self, a_graph):
+    _edge_format = "%d\t%d\n"
+
+    def _get_header(self, n_nodes):
         """
-        Transforms a networkx graph to a flat edge list representation.
+        Returns the number of nodes that NetMODE expects before the edge list.
 
-        :param a_graph: The networkx graph to convert
-        :type a_graph: networkx.Graph
-        :return: Flat edge list represetnation
+        :param n_nodes: The number of nodes of the graph to convert
+        :type n_nodes: int
         :rtype: str
         """
-        # Obtain network representation
-        # First of all, encode the node ID to a number. NetMODE works only with numeric nodes
-        nodeid_to_num = dict(zip(a_graph.nodes(), range(1, a_graph.number_of_nodes() + 1)))
-        return itertools.chain((f"{a_graph.number_of_nodes()+1}\n" for _ in [1]),
-                               (f"{nodeid_to_num[x[0]]}\t{nodeid_to_num[x[1]]}\n"
-                                for x in networkx.to_edgelist(a_graph)))
+        return f"{n_nodes+1}\n"
 
 
 class PyMotifCounterNetMODE(PyMotifCounterBase):
     """
     Concrete implementation of the NetMODE counter.
 
+    Notes:
+        * NetMODE writes the adjacency matrices of the motifs it enumerated to ``adjMat.txt`` in its working
+          directory. It is not read (the adjacency matrix of a motif follows from its ID) and it is removed along
+          with the private scratch directory that each batch of counts runs in (see
+          ``PyMotifCounterBase.scratch_dir``), so concurrent counts never share it.
+
     The following parameters are supported:
 
     :param k: k-node subgraphs ( 3<=k<=6) (Default ``3``)
@@ -161,21 +196,16 @@ class PyMotifCounterNetMODE(PyMotifCounterBase):
                          output_transformer=PyMotifCounterOutputTransformerNetMODE(),
                          parameters=netmode_parameters)
 
-    def _after_run(self, ctx):
+    def _get_process_threads(self):
+        """
+        Returns the number of threads NetMODE is set to use (``t``).
         """
-        Erases the intermediate adjacency matrix file that netmode creates.
+        return self.get_parameter("t").value
 
-        Notes:
-            * NetMODE creates an adjacency matrix file in the CWD with all
-              the adjacency matrices of the motifs it enumerated. This is
-              not strictly needed because the adjacency matrix can be inferred
-              by the motif's ID.
-
-        :param ctx: Context variable
-        :type ctx: dict
-        :return: Updated Context variable (no updates for NetMODE at this step)
-        :rtype: dict
+    def _set_process_threads(self, n_threads):
+        """
+        Limits the number of threads NetMODE uses (``t``), if it is set to use more than ``n_threads``.
         """
-        if os.path.exists("adjMat.txt"):
-            os.remove("adjMat.txt")
-        return ctx
+        if self.get_parameter("t").value > n_threads:
+            self.get_parameter("t").value = n_threads
+        return self
@@ -5,13 +5,40 @@ Implements the pgd concrete counter.
 :date: Nov 2021
 """
 
-import networkx
+import os
 import pyparsing
 import pandas
 from .abstractcounter import *
 
 
 class PyMotifCounterOutputTransformerPgd(PyMotifCounterOutputTransformerBase):
+    _columns = {"motif_id": "object",
+                "count": "int64"}
+    _id_column = "motif_id"
+    _random_stats_columns = {"count": ("rand_mean", "rand_sd", "z_score", "p_value")}
+    # Maps the name of each graphlet in pgd's output to its motif id. Notice the return type: (Motif_id, N_Nodes)
+    _graphlet_to_id = {"total_4_clique": "(31710, 4)",
+                       "total_4_chordcycle": "(23390, 4)",
+                       "total_4_tailed_tris": "(4958, 4)",
+                       "total_4_cycle": "(23130, 4)",
+                       "total_3_star": "(30856, 4)",
+                       "total_4_path": "(23112, 4)",
+
+                       "total_4_tri": "(22796, 4)",
+                       "total_4_2star": "(22536, 4)",
+                       "total_4_2edge": "(18450, 4)",
+                       "total_4_1edge": "(18432, 4)",
+                       "total_4_indep": "(0, 4)",
+
+                       "total_3_tris": "(238, 3)",
+                       "total_2_star": "(78, 3)",
+                       "total_3_1edge": "(160, 3)",
+                       "total_3_indep": "(0, 3)",
+
+                       "total_2_1edge": "(60, 2)",
+                       "total_2_indep": "(0, 2)",
+                       }
+
     @staticmethod
     def _get_parser():
         """
@@ -30,28 +57,8 @@ class PyMotifCounterOutputTransformerPgd(PyMotifCounterOutputTransformerBase):
         section_divide = pyparsing.Suppress(pyparsing.Literal("----------------------------------------"))
         # Parsing graphlet name as a generic identifier
         graphlet_name = pyparsing.Regex("[a-z_0-9]+")
-        # Then using this mapping to get its motif id. Notice the return type: (Motif_id, N_Nodes)
-        graphlet_to_id = {"total_4_clique": "(31710, 4)",
-                          "total_4_chordcycle": "(23390, 4)",
-                          "total_4_tailed_tris": "(4958, 4)",
-                          "total_4_cycle": "(23130, 4)",
-                          "total_3_star": "(30856, 4)",
-                          "total_4_path": "(23112, 4)",
-
-                          "total_4_tri": "(22796, 4)",
-                          "total_4_2star": "(22536, 4)",
-                          "total_4_2edge": "(18450, 4)",
-                          "total_4_1edge": "(18432, 4)",
-                          "total_4_indep": "(0, 4)",
-
-                          "total_3_tris": "(238, 3)",
-                          "total_2_star": "(78, 3)",
-                          "total_3_1edge": "(160, 3)",
-                          "total_3_indep": "(0, 3)",
-
-                          "total_2_1edge": "(60, 2)",
-                          "total_2_indep": "(0, 2)",
-                          }
+        # Then using this mapping to get its motif id.
+        graphlet_to_id = PyMotifCounterOutputTransformerPgd._graphlet_to_id
         # One result entry to be parsed is basically a key, value pair
         graphlet_count_entry = pyparsing.Group(graphlet_name("motif_id").setParseAction(lambda s, l, t: graphlet_to_id[t[0]]) +
                                                pyparsing.Suppress("=") +
@@ -65,45 +72,26 @@ class PyMotifCounterOutputTransformerPgd(PyMotifCounterOutputTransformerBase):
 
         return graphlet_counts("enumeration")
 
-    def __call__(self, str_data, a_ctx=None):
-        """
-        Transforms the raw string output from the pgd process to a computable pandas DataFrame
-
-        :param str_data:
-        :type str_data:
-        :param a_ctx: Dictionary of context information from the subsequent execution steps
-        :type a_ctx: dict
-        :return: A DataFrame with all enumerated graphlets according to pgd.
-        :rtype: pandas.DataFrame
+    def _parse_grammar(self, str_data):
         """
-        parsed_output = self._get_parser().searchString(str_data)
-        # TODO: LOW, Revise the parser so that it only has one root level.
-        # Notice here how the parser's row field names are propagated to the columns of the returned DataFrame
-        df_output = pandas.DataFrame(columns=list(parsed_output[0]["enumeration"][0].keys()), index=None)
-        for a_row_idx, a_row_data in enumerate(parsed_output[0]["enumeration"]):
-            # TODO: HIGH, The conversion can be performed more automatically through pandas rather than a loop
-            df_output.at[a_row_idx, "motif_id"] = a_row_data["motif_id"]
-            df_output.at[a_row_idx, "count"] = a_row_data["count"]
-        return df_output
+        Parses the raw string output from the pgd process with the ``pyparsing`` engine.
 
+        Notes:
+            * pgd's output is not tabular, therefore it is always handled by this engine.
 
-class PyMotifCounterInputTransformerPgd(PyMotifCounterInputTransformerBase):
-    def __call__(self, a_graph):
+        :param str_data: The data holding the information to parse
+        :type str_data: str
+        :returns: A dictionary of column name to values, for all enumerated graphlets according to pgd.
+        :rtype: dict
+        :raises: PyMotifCounterError if the output does not contain the enumeration.
         """
-        Transforms a graph from a Networkx representation to a flat string.
+        parsed_output = self._get_cached_parser().searchString(str_data)
+        rows = self._get_enumeration(parsed_output)
+        return self._rows_to_columns(rows)
 
-        Notes:
-            * Usually, the flat string representation is in the form of an edgelist that conforms to whatever
-              format each process expects in its input.
 
-        :param a_graph: The Networkx graph of which we wish to enumerate motifs.
-        :return: A flat edge list with a format that depends on what each algorithms expects.
-        :rtype: str
-        """
-        # Obtain network representation
-        # First of all, encode the node ID to a number.
-        nodeid_to_num = dict(zip(a_graph.nodes(), range(1, a_graph.number_of_nodes()+1)))
-        return (f"{nodeid_to_num[x[0]]}, {nodeid_to_num[x[1]]}\n" for x in networkx.to_edgelist(a_graph))
+class PyMotifCounterInputTransformerPgd(PyMotifCounterInputTransformerBase):
+    _edge_format = "%d, %d\n"
 
 
 class PyMotifCounterPgd(PyMotifCounterBase):
@@ -155,4 +143,21 @@ class PyMotifCounterPgd(PyMotifCounterBase):
                          output_transformer=PyMotifCounterOutputTransformerPgd(),
                          parameters=pgd_parameters)
 
+    def _get_process_threads(self):
+        """
+        Returns the number of workers pgd is set to use (``w``), ``max`` uses every available core.
+        """
+        n_workers = self.get_parameter("w").value
+        if n_workers == "max":
+            return os.cpu_count() or 1
+        return int(n_workers)
+
+    def _set_process_threads(self, n_threads):
+        """
+        Limits the number of workers pgd uses (``w``), if it is set to use more than ``n_threads``.
+        """
+        if self._get_process_threads() > n_threads:
+            self.get_parameter("w").value = str(n_threads)
+        return self
+
 
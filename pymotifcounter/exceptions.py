@@ -25,3 +25,17 @@ class PyMotifCounterError(PyMotifCounterException):
     Identifies errors originating from PyMotifCounterBase
     """
     pass
+
+
+class PyMotifCounterProcessError(PyMotifCounterError):
+    """
+    Identifies processes that exit with an error
+    """
+    pass
+
+
+class PyMotifCounterTimeoutError(PyMotifCounterError):
+    """
+    Identifies processes that do not complete within their timeout
+    """
+    pass
@@ -0,0 +1,209 @@
+"""
+Executors that run multiple motif counting processes in parallel.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import os
+import copy
+import threading
+import collections
+import concurrent.futures
+from .abstractcounter import *
+
+
+class PyMotifCounterParallelExecutor:
+    """
+    Runs the processes of a motif counter over a batch of graphs in parallel.
+
+    Notes:
+        * Each worker thread drives one external process at a time and owns a private copy of the counter (including
+          the temporary files of its io), so that up to ``n_workers`` processes are running at any given time.
+        * The processes of each worker run in the temporary directory of the worker, so that files that binaries
+          create in their working directory (e.g. NetMODE's ``adjMat.txt``) are not shared between workers.
+        * The number of graphs that are submitted but not yet returned is bounded by ``max_pending``, so that
+          arbitrarily long iterables of graphs can be processed in bounded memory.
+        * Counters whose binaries are themselves multi-threaded (e.g. pgd's ``w``, NetMODE's ``t``) share the
+          ``n_cores`` budget with the worker processes:
+            * If ``n_workers`` is not set, each process keeps its configured threads and as many processes as fit
+              in ``n_cores`` are run in parallel.
+            * If ``n_workers`` is set, the threads of each process are limited to ``n_cores // n_workers``.
+        * Each worker prepares its counter once (see ``PyMotifCounterBase._setup_batch()``) and re-uses it for every
+          graph it counts. Graphs that arrive one at a time (e.g. requests of a service) can be counted on the
+          workers via ``count()`` or ``submit()``, without the preparation of a one-shot count.
+        * Executors should be closed (or used as context managers) to remove the temporary files of their workers.
+
+    Example:
+        ::
+
+            with PyMotifCounterParallelExecutor(PyMotifCounterMfinder(), n_workers=4) as executor:
+                motif_counts = executor.count_many(graphs)
+                motif_count = executor.count(a_graph)
+    """
+    def __init__(self, counter, n_workers=None, n_cores=None, max_pending=None):
+        """
+        Initialises a parallel executor.
+
+        :param counter: The configured counter to run over each graph.
+        :type counter: PyMotifCounterBase
+        :param n_workers: The number of processes to run in parallel (Default: As many as fit in ``n_cores``)
+        :type n_workers: int
+        :param n_cores: The number of cores available to the executor (Default: ``os.cpu_count()``)
+        :type n_cores: int
+        :param max_pending: The maximum number of graphs that are submitted but not yet returned
+                            (Default: ``2 * n_workers``)
+        :type max_pending: int
+        :raises: PyMotifCounterParameterError if the parameters of the counter are invalid.
+        """
+        if not isinstance(counter, PyMotifCounterBase):
+            raise TypeError(f"counter should be PyMotifCounterBase, received {type(counter)}")
+
+        n_cores = n_cores or os.cpu_count() or 1
+        if n_cores < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::n_cores should be at least 1, received {n_cores}")
+
+        # Fail early rather than once per worker
+        counter.validate_parameters()
+
+        process_threads = counter._get_process_threads()
+        if n_workers is None:
+            n_workers = max(1, n_cores // process_threads)
+        if n_workers < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::n_workers should be at least 1, "
+                                      f"received {n_workers}")
+
+        max_pending = max_pending or 2 * n_workers
+        if max_pending < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::max_pending should be at least 1, "
+                                      f"received {max_pending}")
+
+        self._counter = counter
+        self._n_cores = n_cores
+        self._n_workers = n_workers
+        self._process_threads = min(process_threads, max(1, n_cores // n_workers))
+        self._max_pending = max_pending
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+        # The counter and batch context of each worker
+        self._workers = []
+
+    @property
+    def n_workers(self):
+        return self._n_workers
+
+    @property
+    def process_threads(self):
+        return self._process_threads
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _get_pool(self):
+        """
+        Returns the pool of worker threads, creating it if required.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._n_workers,
+                                                                   thread_name_prefix="pymotifcounter")
+            return self._pool
+
+    def _get_worker(self):
+        """
+        Returns the counter and batch context of the calling worker thread, creating them if required.
+        """
+        worker = getattr(self._local, "worker", None)
+        if worker is None:
+            a_counter = copy.deepcopy(self._counter)
+            a_counter._set_process_threads(self._process_threads)
+            worker = (a_counter, a_counter._setup_batch())
+            self._local.worker = worker
+            with self._pool_lock:
+                self._workers.append(worker)
+        return worker
+
+    def _count(self, a_graph, timeout=None):
+        """
+        Counts the motifs of one graph on the calling worker thread.
+        """
+        a_counter, batch_ctx = self._get_worker()
+        return a_counter._count(a_graph, batch_ctx, timeout)
+
+    def submit(self, a_graph, timeout=None):
+        """
+        Submits the motif count of one graph to the workers.
+
+        :param a_graph: The graph to enumerate motifs over (see ``PyMotifCounterBase.__call__()``)
+        :type a_graph: networkx.Graph
+        :param timeout: See ``PyMotifCounterBase.__call__()``
+        :type timeout: float
+        :returns: The future of the result of the count.
+        :rtype: concurrent.futures.Future
+        """
+        return self._get_pool().submit(self._count, a_graph, timeout)
+
+    def count(self, a_graph, timeout=None):
+        """
+        Counts the motifs of one graph on a worker, waiting for its result (see ``submit()``).
+
+        :returns: See ``PyMotifCounterBase.__call__()``
+        :rtype: pandas.DataFrame
+        :raises: As ``PyMotifCounterBase.__call__()``.
+        """
+        return self.submit(a_graph, timeout).result()
+
+    def close(self):
+        """
+        Waits for any running processes and removes the temporary files of all workers.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        with self._pool_lock:
+            workers, self._workers = self._workers, []
+        for a_counter, batch_ctx in workers:
+            a_counter._teardown_batch(batch_ctx)
+        # Worker threads are not re-used after a shutdown
+        self._local = threading.local()
+
+    def _count_many_iter(self, graphs):
+        """
+        Generator of the motif counts of a batch of graphs, in the order of the graphs (see ``count_many()``).
+        """
+        pool = self._get_pool()
+        pending = collections.deque()
+        try:
+            for a_graph_idx, a_graph in enumerate(graphs):
+                if len(pending) >= self._max_pending:
+                    a_pending_idx, a_future = pending.popleft()
+                    yield a_pending_idx, a_future.result()
+                pending.append((a_graph_idx, pool.submit(self._count, a_graph)))
+            while len(pending) > 0:
+                a_pending_idx, a_future = pending.popleft()
+                yield a_pending_idx, a_future.result()
+        finally:
+            for _, a_future in pending:
+                a_future.cancel()
+
+    def count_many(self, graphs, as_generator=False):
+        """
+        Initiates a motif count over each graph of an iterable of graphs, running counts in parallel.
+
+        :param graphs: An iterable of Networkx graphs to enumerate motifs over.
+        :type graphs: Iterable[networkx.Graph]
+        :param as_generator: Whether to return a generator of ``(graph_index, DataFrame)`` tuples, rather than a
+                             single DataFrame (Default: False)
+        :type as_generator: bool
+        :returns: See ``PyMotifCounterBase.count_many()``
+        :rtype: pandas.DataFrame
+        """
+        results = self._count_many_iter(graphs)
+        if as_generator:
+            return results
+        return PyMotifCounterBase._concat_results(results)
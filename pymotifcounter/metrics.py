@@ -0,0 +1,172 @@
+"""
+Aggregates the events of motif counts to metrics.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import threading
+import collections
+import urllib.request
+from .abstractcounter import *
+
+
+class PyMotifCounterMetricsCollector:
+    """
+    Aggregates the hook events of one or more counters to metrics in the Prometheus text exposition format.
+
+    Notes:
+        * The collector is a hook (see ``PyMotifCounterBase.add_hook()``) that ``register()`` adds to every event of
+          a counter.
+        * Metrics are labelled by ``backend`` (the counter class name) and are exported via ``render()`` (e.g. to be
+          served by an HTTP endpoint) or pushed to a collector via ``push()`` (e.g. a Prometheus Pushgateway or an
+          OpenTelemetry collector with a Prometheus receiver).
+        * The metrics are:
+            * ``<prefix>_runs_started_total``: Counts that started.
+            * ``<prefix>_runs_completed_total``: Counts that completed, by ``cached`` (whether their result came from
+              the cache).
+            * ``<prefix>_errors_total``: Counts that failed, by ``error`` (the exception class name).
+            * ``<prefix>_graph_edges_total``: Edges of the graphs of counts that started.
+            * ``<prefix>_processes_running``: Processes that are currently running.
+            * ``<prefix>_process_cpu_seconds_total``: User and system CPU time of processes.
+            * ``<prefix>_process_peak_rss_bytes``: The largest peak resident set size of any process.
+            * ``<prefix>_phase_seconds``: A summary of the time of each ``phase`` (``transform, io, process, parse,
+              total``) of completed counts.
+
+    Example:
+        ::
+
+            collector = PyMotifCounterMetricsCollector()
+            collector.register(a_counter)
+            ...
+            collector.push("http://localhost:9091/metrics/job/motifs")
+    """
+    _phases = ("transform", "io", "process", "parse", "total")
+
+    def __init__(self, prefix="pymotifcounter"):
+        """
+        Initialises a metrics collector.
+
+        :param prefix: The prefix of the name of each metric.
+        :type prefix: str
+        """
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        # metric name -> {tuple of (label, value) pairs -> value}
+        self._values = collections.defaultdict(lambda: collections.defaultdict(float))
+
+    def register(self, counter):
+        """
+        Adds the collector to every event of a counter.
+
+        :param counter: A counter whose counts are collected.
+        :type counter: PyMotifCounterBase
+        :returns: The collector
+        :rtype: PyMotifCounterMetricsCollector
+        """
+        for an_event in counter._hook_events:
+            counter.add_hook(an_event, self)
+        return self
+
+    def unregister(self, counter):
+        """
+        Removes the collector from every event of a counter.
+
+        :param counter: A counter that was registered via ``register()``.
+        :type counter: PyMotifCounterBase
+        :returns: The collector
+        :rtype: PyMotifCounterMetricsCollector
+        """
+        for an_event in counter._hook_events:
+            counter.remove_hook(an_event, self)
+        return self
+
+    def _add(self, metric, labels, value):
+        self._values[metric][tuple(labels.items())] += value
+
+    def __call__(self, event_info):
+        """
+        Updates the metrics with an event (see ``PyMotifCounterBase.add_hook()``).
+
+        :param event_info: The event.
+        :type event_info: dict
+        """
+        labels = {"backend": event_info["backend"]}
+        stats = event_info["stats"]
+        with self._lock:
+            if event_info["event"] == "run_start":
+                self._add("runs_started_total", labels, 1)
+                self._add("graph_edges_total", labels, event_info["n_edges"] or 0)
+            elif event_info["event"] == "process_spawn":
+                self._add("processes_running", labels, 1)
+            elif event_info["event"] == "process_exit":
+                self._add("processes_running", labels, -1)
+                if stats.cpu_user_time is not None:
+                    self._add("process_cpu_seconds_total", labels, stats.cpu_user_time + stats.cpu_system_time)
+                if stats.peak_rss is not None:
+                    peak_rss = self._values["process_peak_rss_bytes"]
+                    peak_rss[tuple(labels.items())] = max(peak_rss[tuple(labels.items())], stats.peak_rss)
+            elif event_info["event"] == "parse_complete":
+                self._add("runs_completed_total", dict(labels, cached=str(stats.cached).lower()), 1)
+                for a_phase in self._phases:
+                    phase_time = getattr(stats, f"{a_phase}_time")
+                    if phase_time is not None:
+                        self._add("phase_seconds_sum", dict(labels, phase=a_phase), phase_time)
+                        self._add("phase_seconds_count", dict(labels, phase=a_phase), 1)
+            elif event_info["event"] == "error":
+                self._add("errors_total", dict(labels, error=event_info["error"].__class__.__name__), 1)
+
+    @staticmethod
+    def _format_labels(labels):
+        """
+        Returns a set of labels in the exposition format, escaping their values.
+        """
+        formatted_labels = []
+        for a_label, a_value in labels:
+            a_value = a_value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+            formatted_labels.append(f"{a_label}=\"{a_value}\"")
+        return ",".join(formatted_labels)
+
+    def render(self):
+        """
+        Returns the metrics in the Prometheus text exposition format (version 0.0.4).
+
+        :rtype: str
+        """
+        metric_types = {"runs_started_total": "counter",
+                        "runs_completed_total": "counter",
+                        "errors_total": "counter",
+                        "graph_edges_total": "counter",
+                        "processes_running": "gauge",
+                        "process_cpu_seconds_total": "counter",
+                        "process_peak_rss_bytes": "gauge",
+                        "phase_seconds": "summary"}
+        lines = []
+        with self._lock:
+            for a_metric, a_type in metric_types.items():
+                samples = [a_metric] if a_type != "summary" else [f"{a_metric}_sum", f"{a_metric}_count"]
+                if not any(a_sample in self._values for a_sample in samples):
+                    continue
+                lines.append(f"# TYPE {self._prefix}_{a_metric} {a_type}")
+                for a_sample in samples:
+                    for labels, a_value in sorted(self._values[a_sample].items()):
+                        lines.append(f"{self._prefix}_{a_sample}{{{self._format_labels(labels)}}} {a_value!r}")
+        return "".join(f"{a_line}\n" for a_line in lines)
+
+    def push(self, url, timeout=10):
+        """
+        Sends the metrics to a collector, via an HTTP PUT request of their exposition format.
+
+        :param url: The URL of the collector (e.g. ``http://localhost:9091/metrics/job/<job name>`` for a Prometheus
+                    Pushgateway).
+        :type url: str
+        :param timeout: The maximum number of seconds to wait for the collector to respond.
+        :type timeout: float
+        :returns: The HTTP status of the response.
+        :rtype: int
+        :raises: urllib.error.URLError if the collector can not be reached or rejects the metrics.
+        """
+        request = urllib.request.Request(url, data=self.render().encode(), method="PUT",
+                                         headers={"Content-Type": "text/plain; version=0.0.4"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status
@@ -0,0 +1,455 @@
+"""
+Degree preserving random networks and the statistics of motif counts over them.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import os
+import copy
+import statistics
+import collections
+import concurrent.futures
+import numpy
+import pandas
+from .abstractcounter import *
+from .executors import PyMotifCounterParallelExecutor
+
+
+def _switch_edges(sources, targets, edge_set, is_undirected, keep_reciprocity, n_switches, rng):
+    """
+    Switches the endpoints of random pairs of edges, in place.
+
+    Notes:
+        * A pair of edges ``(a, b), (c, d)`` becomes ``(a, d), (c, b)``, unless that would create a self loop or an
+          edge that already exists. Undirected edges are also switched to ``(a, c), (d, b)``, by chance.
+        * ``edge_set`` contains every directed edge of the graph (both directions of undirected edges) and is
+          updated with each switch.
+        * If ``keep_reciprocity`` is set, no edge is switched to the reverse of an existing edge, so that the
+          (reciprocal) edges of each node in both directions are preserved.
+
+    :param sources: The source node of each edge.
+    :type sources: list
+    :param targets: The target node of each edge.
+    :type targets: list
+    :param edge_set: The ``(source, target)`` tuple of each edge of the graph.
+    :type edge_set: set
+    :param is_undirected: Whether the edges are undirected.
+    :type is_undirected: bool
+    :param keep_reciprocity: Whether edges must not be switched to the reverse of existing edges.
+    :type keep_reciprocity: bool
+    :param n_switches: The number of switches to attempt per edge.
+    :type n_switches: int
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+    """
+    n_edges = len(sources)
+    if n_edges < 2:
+        return
+    n_attempts = n_switches * n_edges
+    check_reverse = is_undirected or keep_reciprocity
+    for i, j, flip in zip(rng.integers(n_edges, size=n_attempts).tolist(),
+                          rng.integers(n_edges, size=n_attempts).tolist(),
+                          (rng.random(n_attempts) < 0.5).tolist()):
+        a, b, c, d = sources[i], targets[i], sources[j], targets[j]
+        if is_undirected and flip:
+            c, d = d, c
+        if a == d or c == b or (a, d) in edge_set or (c, b) in edge_set or \
+                (check_reverse and ((d, a) in edge_set or (b, c) in edge_set)):
+            continue
+        edge_set.difference_update(((a, b), (sources[j], targets[j])))
+        edge_set.update(((a, d), (c, b)))
+        if is_undirected:
+            edge_set.difference_update(((b, a), (targets[j], sources[j])))
+            edge_set.update(((d, a), (b, c)))
+        sources[j], targets[j] = c, b
+        targets[i] = d
+
+
+def _randomise_edges(edges, is_undirected, bidirectional, n_switches, seed):
+    """
+    Returns a degree preserving random network of a graph (see ``PyMotifCounterNullModel.randomise()``).
+
+    :param edges: An ``(n_edges, 2)`` array of source and target node indices.
+    :type edges: numpy.ndarray
+    :param is_undirected: Whether the edges are undirected.
+    :type is_undirected: bool
+    :param bidirectional: The policy of bidirectional edges, see ``PyMotifCounterNullModel``.
+    :type bidirectional: str
+    :param n_switches: The number of switches to attempt per edge.
+    :type n_switches: int
+    :param seed: The seed of the random number generator.
+    :type seed: numpy.random.SeedSequence
+    :returns: An ``(n_edges, 2)`` array of source and target node indices.
+    :rtype: numpy.ndarray
+    """
+    rng = numpy.random.default_rng(seed)
+    edges = numpy.asarray(edges, dtype=numpy.int64)
+    # Self loops are kept as they are
+    self_loops = edges[edges[:, 0] == edges[:, 1]]
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    if is_undirected:
+        edges = numpy.unique(numpy.sort(edges, axis=1), axis=0)
+        edge_groups = [(edges, True)]
+        edge_set = set(zip(edges[:, 0].tolist(), edges[:, 1].tolist())) | \
+            set(zip(edges[:, 1].tolist(), edges[:, 0].tolist()))
+    else:
+        edges = numpy.unique(edges, axis=0)
+        edge_set = set(zip(edges[:, 0].tolist(), edges[:, 1].tolist()))
+        is_bidirectional = numpy.fromiter(((b, a) in edge_set for a, b in edges.tolist()), dtype=bool,
+                                          count=len(edges))
+        if bidirectional == "no_regard":
+            edge_groups = [(edges, False)]
+        elif bidirectional == "fixed":
+            edge_groups = [(edges[~is_bidirectional], False)]
+        else:
+            # Bidirectional edges are switched with each other, as undirected edges
+            edge_groups = [(edges[~is_bidirectional], False),
+                           (edges[is_bidirectional & (edges[:, 0] < edges[:, 1])], True)]
+
+    random_edges = [self_loops]
+    for an_edges, is_group_undirected in edge_groups:
+        sources, targets = an_edges[:, 0].tolist(), an_edges[:, 1].tolist()
+        _switch_edges(sources, targets, edge_set, is_group_undirected, bidirectional != "no_regard", n_switches, rng)
+        random_edges.append(numpy.column_stack((sources, targets)).astype(numpy.int64).reshape(-1, 2))
+        if is_group_undirected and not is_undirected:
+            random_edges.append(random_edges[-1][:, ::-1])
+    if bidirectional == "fixed" and not is_undirected:
+        random_edges.append(edges[is_bidirectional])
+    return numpy.concatenate(random_edges)
+
+
+class _PyMotifCounterRandomStats:
+    """
+    Running mean, variance and exceedance of the counts of each motif over random networks.
+
+    Notes:
+        * Counts are added one random network at a time (Welford's algorithm). Motifs that do not occur in a random
+          network are counted as 0.
+    """
+    def __init__(self, real_counts):
+        """
+        :param real_counts: The counts of each motif (index) of the graph.
+        :type real_counts: pandas.Series
+        """
+        self.real_counts = real_counts.astype("float64")
+        self.n = 0
+        self.mean = pandas.Series(0.0, index=real_counts.index)
+        self.m2 = pandas.Series(0.0, index=real_counts.index)
+        self.n_exceeding = pandas.Series(0, index=real_counts.index)
+
+    def add(self, counts):
+        """
+        Adds the counts of a random network.
+
+        :param counts: The counts of each motif (index) of a random network.
+        :type counts: pandas.Series
+        """
+        new_motifs = counts.index.difference(self.mean.index)
+        if len(new_motifs) > 0:
+            self.real_counts = pandas.concat([self.real_counts, pandas.Series(0.0, index=new_motifs)])
+            self.mean = pandas.concat([self.mean, pandas.Series(0.0, index=new_motifs)])
+            self.m2 = pandas.concat([self.m2, pandas.Series(0.0, index=new_motifs)])
+            # Motifs that do not occur in the graph are exceeded by the counts (0) of every previous random network
+            self.n_exceeding = pandas.concat([self.n_exceeding, pandas.Series(self.n, index=new_motifs)])
+        counts = counts.astype("float64").reindex(self.mean.index, fill_value=0.0)
+        self.n += 1
+        delta = counts - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (counts - self.mean)
+        self.n_exceeding += (counts >= self.real_counts).astype(int)
+
+    @property
+    def sd(self):
+        return (self.m2 / self.n) ** 0.5 if self.n > 0 else self.m2 * numpy.nan
+
+    @property
+    def z_score(self):
+        sd = self.sd
+        return ((self.real_counts - self.mean) / sd).where(sd > 0)
+
+    @property
+    def p_value(self):
+        return self.n_exceeding / self.n if self.n > 0 else self.mean * numpy.nan
+
+    def z_score_error(self, quantile):
+        """
+        Returns the half width of the confidence interval of the z-score of each motif.
+
+        Notes:
+            * The standard error of a z-score estimated from ``n`` random networks is ``sqrt((1 + z^2 / 2) / n)``
+              (for normally distributed counts). The z-score of motifs whose counts do not vary is not defined and
+              neither is its error (NaN).
+
+        :param quantile: The quantile of the standard normal distribution at the confidence level (e.g. 1.96).
+        :type quantile: float
+        :rtype: pandas.Series
+        """
+        return quantile * ((1 + self.z_score ** 2 / 2) / self.n) ** 0.5
+
+
+class PyMotifCounterNullModel:
+    """
+    Generates degree preserving random networks of graphs and the statistics of motif counts over them.
+
+    Notes:
+        * Random networks are generated by switching the endpoints of random pairs of edges (``n_switches`` attempts
+          per edge), which preserves the in- and out-degree (or degree) of each node.
+        * The bidirectional (reciprocal) edges of directed graphs are randomised by one of the policies of NetMODE:
+            * ``fixed``: Bidirectional edges are not switched (NetMODE's ``0``).
+            * ``no_regard``: Bidirectional edges are switched as two unrelated edges, so that the number of
+              bidirectional edges may change (NetMODE's ``1``).
+            * ``local_constant``: Bidirectional edges are switched with each other, so that the number of
+              bidirectional edges of each node is preserved (NetMODE's ``3``, Default).
+        * Random networks are generated in parallel by ``n_workers`` processes and counted in parallel by a
+          ``PyMotifCounterParallelExecutor``, with the random network counts of the counter (e.g. ``n_random``) set
+          to 0. Each random network has its own seed, derived from ``seed``, so that the ensemble does not depend on
+          the number of workers.
+        * Counts can stop early, once the z-score of every motif is known within a ``tolerance`` (see
+          ``count()``). Random networks are then counted in batches, until the confidence interval of each z-score
+          is narrower than ``2 * tolerance`` or ``n_random`` random networks are counted.
+        * The statistics of the counts of each motif over the random networks are set to the columns of the
+          result of the counter that hold them (e.g. ``nrand_stats_m``, ``Mean_Freq``, ``ave_rand_freq`` ...), or
+          are added to it, see ``PyMotifCounterOutputTransformerBase._random_stats_columns``:
+            * The mean and standard deviation of the counts.
+            * The z-score of the count of the graph (NaN if the standard deviation is 0).
+            * The p-value: The fraction of the random networks in which the motif occurs at least as many times as
+              in the graph.
+
+    Example:
+        ::
+
+            null_model = PyMotifCounterNullModel(seed=42)
+            motif_counts = null_model.count(PyMotifCounterMfinder(), a_graph, n_random=1000)
+    """
+    _bidirectional_policies = ("fixed", "no_regard", "local_constant")
+
+    def __init__(self, n_switches=10, bidirectional="local_constant", n_workers=None, seed=None):
+        """
+        Initialises a null model.
+
+        :param n_switches: The number of switches to attempt per edge of each random network.
+        :type n_switches: int
+        :param bidirectional: The policy of bidirectional edges, one of ``fixed, no_regard, local_constant``.
+        :type bidirectional: str
+        :param n_workers: The number of processes that generate random networks (Default: ``os.cpu_count()``)
+        :type n_workers: int
+        :param seed: The seed of the random networks (Default: Random)
+        :type seed: int
+        """
+        if n_switches < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::n_switches should be at least 1, "
+                                      f"received {n_switches}")
+        if bidirectional not in self._bidirectional_policies:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::bidirectional should be one of "
+                                      f"{', '.join(self._bidirectional_policies)}, received {bidirectional}")
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::n_workers should be at least 1, "
+                                      f"received {n_workers}")
+        self._n_switches = n_switches
+        self._bidirectional = bidirectional
+        self._n_workers = n_workers
+        self._seed_sequence = numpy.random.SeedSequence(seed)
+
+    @staticmethod
+    def _is_undirected(a_graph, is_undirected):
+        """
+        Returns whether a graph is undirected, if that is not set (Default: Whether a ``networkx`` graph is not
+        directed, otherwise False).
+        """
+        if is_undirected is not None:
+            return is_undirected
+        return hasattr(a_graph, "is_directed") and not a_graph.is_directed()
+
+    def randomise(self, a_graph, n_random, is_undirected=None):
+        """
+        Generates degree preserving random networks of a graph, in parallel.
+
+        :param a_graph: The graph (see ``PyMotifCounterInputTransformerBase._get_edge_array()`` for the supported
+                        types).
+        :type a_graph: <<networkx.Graph>>, numpy.ndarray, scipy.sparse.sparray, pandas.DataFrame, str
+        :param n_random: The number of random networks.
+        :type n_random: int
+        :param is_undirected: Whether the edges of the graph are undirected (Default: See ``_is_undirected()``)
+        :type is_undirected: bool
+        :returns: A generator of the ``(n_edges, 2)`` array of node indices of each random network.
+        """
+        edges, _ = PyMotifCounterInputTransformerBase()._get_edge_array(a_graph)
+        return self._randomise_iter(numpy.asarray(edges), self._seed_sequence.spawn(n_random),
+                                    self._is_undirected(a_graph, is_undirected))
+
+    def _get_pool(self):
+        """
+        Returns a pool of processes that generate random networks, or None if they are generated in this process.
+        """
+        return concurrent.futures.ProcessPoolExecutor(max_workers=self._n_workers) if self._n_workers > 1 else None
+
+    def _randomise_iter(self, edges, seeds, is_undirected, pool=None):
+        """
+        Generator of the random network of each seed (see ``randomise()``).
+
+        Notes:
+            * If a pool is not given, one is created for the random networks of the generator.
+        """
+        if pool is None and self._n_workers > 1:
+            with self._get_pool() as pool:
+                yield from self._randomise_iter(edges, seeds, is_undirected, pool)
+            return
+        if pool is None:
+            for a_seed in seeds:
+                yield _randomise_edges(edges, is_undirected, self._bidirectional, self._n_switches, a_seed)
+            return
+        pending = collections.deque()
+        try:
+            for a_seed in seeds:
+                if len(pending) >= 2 * self._n_workers:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(_randomise_edges, edges, is_undirected, self._bidirectional,
+                                           self._n_switches, a_seed))
+            while len(pending) > 0:
+                yield pending.popleft().result()
+        finally:
+            for a_future in pending:
+                a_future.cancel()
+
+    @staticmethod
+    def _get_counter(counter):
+        """
+        Returns a copy of a counter that does not count random networks itself.
+        """
+        output_transformer = counter._output_transformer
+        if output_transformer._id_column is None or len(output_transformer._random_stats_columns) == 0:
+            raise PyMotifCounterError(f"{output_transformer.__class__.__name__}::Does not define the columns of "
+                                      f"random network statistics.")
+        counter = copy.deepcopy(counter)
+        if "n_random" in counter._parameters:
+            counter.get_parameter("n_random").value = 0
+        return counter
+
+    def _random_stats_to_result(self, result, random_stats, counter):
+        """
+        Adds the statistics of random networks to the result of the graph.
+
+        :param result: The result of the graph.
+        :type result: pandas.DataFrame
+        :param random_stats: The statistics of each column of counts.
+        :type random_stats: dict
+        :param counter: The counter of the result.
+        :type counter: PyMotifCounterBase
+        :rtype: pandas.DataFrame
+        """
+        output_transformer = counter._output_transformer
+        id_column = output_transformer._id_column
+        columns = list(result.columns)
+        result = result.set_index(id_column)
+        # Motifs that only occur in random networks do not occur in the graph
+        all_motifs = result.index.append(next(iter(random_stats.values())).mean.index.difference(result.index))
+        result = result.reindex(pandas.Index(all_motifs, name=id_column), fill_value=0)
+        for count_column, stats_columns in output_transformer._random_stats_columns.items():
+            stats = random_stats[count_column]
+            for a_column, a_value in zip(stats_columns, [stats.mean, stats.sd, stats.z_score, stats.p_value]):
+                result[a_column] = a_value.reindex(result.index).astype("float64")
+        result = result.reset_index()
+        # Columns of statistics that the counter does not report are added after its own columns
+        return result[columns + [a_column for a_column in result.columns if a_column not in columns]]
+
+    def count(self, counter, a_graph, n_random, is_undirected=None, tolerance=None, batch_size=50, confidence=0.95):
+        """
+        Counts the motifs of a graph and of an ensemble of its random networks.
+
+        Notes:
+            * If a ``tolerance`` is set, random networks are counted in batches of ``batch_size`` and the count stops
+              after the first batch at which the half width of the confidence interval of the z-score of every motif
+              is less than ``tolerance`` (see ``_PyMotifCounterRandomStats.z_score_error()``). Motifs whose z-score is
+              not defined (their counts do not vary) do not delay it.
+            * The ensemble of a count that stops early is the same as the first random networks of a count of the
+              same seed that does not.
+
+        :param counter: The configured counter.
+        :type counter: PyMotifCounterBase
+        :param a_graph: The graph (see ``randomise()``)
+        :type a_graph: <<networkx.Graph>>, numpy.ndarray, scipy.sparse.sparray, pandas.DataFrame, str
+        :param n_random: The number of random networks (the largest number, if a ``tolerance`` is set).
+        :type n_random: int
+        :param is_undirected: Whether the edges of the graph are undirected (Default: See ``_is_undirected()``)
+        :type is_undirected: bool
+        :param tolerance: The largest half width of the confidence interval of a z-score at which the count stops
+                          (Default: None, all ``n_random`` random networks are counted)
+        :type tolerance: float
+        :param batch_size: The number of random networks between checks of the z-scores, if a ``tolerance`` is set.
+        :type batch_size: int
+        :param confidence: The confidence level of the confidence intervals of z-scores.
+        :type confidence: float
+        :returns: The result of the counter, with the statistics of the random networks in its columns. Its
+                  ``attrs["n_random"]`` is the number of random networks that were counted and
+                  ``attrs["converged"]`` whether every z-score is within the tolerance (None without a tolerance).
+        :rtype: pandas.DataFrame
+        :raises: PyMotifCounterError if the counter does not define the columns of random network statistics or the
+                 parameters of the stopping rule are invalid.
+        """
+        if tolerance is not None and tolerance <= 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::tolerance should be greater than 0, received "
+                                      f"{tolerance}")
+        if batch_size < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::batch_size should be at least 1, received "
+                                      f"{batch_size}")
+        if not 0 < confidence < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::confidence should be within (0, 1), received "
+                                      f"{confidence}")
+        counter = self._get_counter(counter)
+        edges, _ = counter._input_transformer._get_edge_array(a_graph)
+        is_undirected = self._is_undirected(a_graph, is_undirected)
+        result = counter(a_graph)
+        random_stats = self._get_random_stats(result, counter)
+        quantile = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+
+        converged = None
+        pool = self._get_pool()
+        try:
+            with PyMotifCounterParallelExecutor(counter, n_workers=self._n_workers) as executor:
+                n_counted = 0
+                while n_counted < n_random and not converged:
+                    n_batch = n_random - n_counted if tolerance is None else min(batch_size, n_random - n_counted)
+                    random_networks = self._randomise_iter(numpy.asarray(edges), self._seed_sequence.spawn(n_batch),
+                                                           is_undirected, pool)
+                    for _, a_random_result in executor.count_many(random_networks, as_generator=True):
+                        self._add_random_result(random_stats, a_random_result, counter)
+                    n_counted += n_batch
+                    if tolerance is not None:
+                        converged = all((stats.z_score_error(quantile).dropna() < tolerance).all()
+                                        for stats in random_stats.values())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        result = self._finalise(result, random_stats, counter)
+        result.attrs["converged"] = converged
+        return result
+
+    @staticmethod
+    def _get_random_stats(result, counter):
+        """
+        Returns the statistics of each column of counts, before any random networks.
+        """
+        output_transformer = counter._output_transformer
+        result = result.set_index(output_transformer._id_column)
+        return {a_column: _PyMotifCounterRandomStats(result[a_column])
+                for a_column in output_transformer._random_stats_columns}
+
+    @staticmethod
+    def _add_random_result(random_stats, a_random_result, counter):
+        """
+        Adds the counts of a random network to the statistics of each column of counts.
+        """
+        a_random_result = a_random_result.set_index(counter._output_transformer._id_column)
+        for a_column, stats in random_stats.items():
+            stats.add(a_random_result[a_column])
+
+    def _finalise(self, result, random_stats, counter):
+        """
+        Returns the result of the graph with the statistics of the random networks.
+        """
+        run_stats = result.attrs.get("run_stats")
+        result = self._random_stats_to_result(result, random_stats, counter)
+        result.attrs = {"run_stats": run_stats, "n_random": next(iter(random_stats.values())).n}
+        return result
@@ -179,17 +179,25 @@ class PyMotifCounterParameterBase:
         """
         return self._check_value(self.value)
 
-    def get_parameter_form(self):
+    def get_parameter_form(self, a_value=None):
         """
         Returns the parameter in the right representation expected by ``subprocess.popen``
 
+        :param a_value: A value to use in place of the current value of the parameter, without modifying the
+                        parameter (Default: None, the current value).
+        :type a_value: Any
         :return: An ``n`` element list depending on the parameter type.
         :rtype: list
         """
+        if a_value is None:
+            a_value = self.value
+        else:
+            self._check_value(a_value)
+
         if self._pos is not None:
-            return [str(self.value), ]
+            return [str(a_value), ]
         else:
-            return [f"-{self._name}", str(self.value)]
+            return [f"-{self._name}", str(a_value)]
 
 
 class PyMotifCounterParameterFlag(PyMotifCounterParameterBase):
@@ -208,8 +216,13 @@ class PyMotifCounterParameterFlag(PyMotifCounterParameterBase):
                  pos=None):
         super().__init__(name, is_required, default_value, (of_type(bool), ), alias=alias, help_str=help_str, pos=pos)
 
-    def get_parameter_form(self):
-        if self._value or self._default_value:
+    def get_parameter_form(self, a_value=None):
+        if a_value is None:
+            a_value = self._value or self._default_value
+        else:
+            self._check_value(a_value)
+
+        if a_value:
             return [f"-{self._name}", ]
         else:
             return []
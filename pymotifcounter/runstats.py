@@ -0,0 +1,108 @@
+"""
+Timings and resource usage of motif counts.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import sys
+import time
+import contextlib
+
+
+class PyMotifCounterRunStats:
+    """
+    Records the time that one motif count spends in each of its phases and the resources used by its process.
+
+    Notes:
+        * Times are wall-clock seconds:
+            * ``transform_time``: Transforming the graph to the input representation of the process.
+            * ``io_time``: Writing the input file and reading the output file of the process (or reading the file of
+              a prepared graph).
+            * ``process_time``: Running the process, from its start until it is reaped.
+            * ``parse_time``: Transforming the output of the process to a DataFrame.
+            * ``total_time``: The whole count, including any of its phases that are not listed above.
+        * Input that is streamed to the stdin of a process is transformed while the process runs, therefore
+          ``transform_time`` overlaps with ``process_time`` in that case.
+        * ``cpu_user_time, cpu_system_time`` (seconds) and ``peak_rss`` (bytes) are those of the process, as reported
+          by ``os.wait4()``. They are None for counts whose results come from the cache and for asynchronous counts
+          (whose processes are reaped by the event loop).
+        * On Linux, ``peak_rss`` is at least the resident size of the Python process that started the process,
+          because the high-water mark of a process is carried across ``exec()``. It is therefore meaningful for
+          processes that outgrow their parent.
+        * The stats of a count are available as ``attrs["run_stats"]`` of its result.
+    """
+    def __init__(self):
+        self.transform_time = 0.0
+        self.io_time = 0.0
+        self.process_time = None
+        self.parse_time = 0.0
+        self.total_time = None
+        self.cpu_user_time = None
+        self.cpu_system_time = None
+        self.peak_rss = None
+        self.returncode = None
+        self.timed_out = False
+        self.cached = False
+        self._start_time = time.perf_counter()
+
+    @contextlib.contextmanager
+    def timer(self, phase):
+        """
+        Adds the time spent in its context to a given phase.
+
+        :param phase: The name of the phase attribute (e.g. ``io_time``).
+        :type phase: str
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, phase, (getattr(self, phase) or 0.0) + time.perf_counter() - start_time)
+
+    def time_iter(self, an_iterable, phase):
+        """
+        Generator of the items of an iterable, that adds the time spent producing them to a given phase.
+
+        :param an_iterable: Any iterable (e.g. the output of an input transformer).
+        :type an_iterable: Iterable
+        :param phase: The name of the phase attribute (e.g. ``transform_time``).
+        :type phase: str
+        """
+        an_iterator = iter(an_iterable)
+        while True:
+            with self.timer(phase):
+                try:
+                    an_item = next(an_iterator)
+                except StopIteration:
+                    return
+            yield an_item
+
+    def set_rusage(self, rusage):
+        """
+        Records the resource usage of a process.
+
+        :param rusage: As returned by ``os.wait4()``.
+        :type rusage: resource.struct_rusage
+        """
+        self.cpu_user_time = rusage.ru_utime
+        self.cpu_system_time = rusage.ru_stime
+        # ru_maxrss is in kilobytes, except on macOS
+        self.peak_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+    def stop(self):
+        """
+        Marks the end of the count.
+        """
+        self.total_time = time.perf_counter() - self._start_time
+
+    def as_dict(self):
+        """
+        Returns the stats as a dictionary.
+
+        :rtype: dict
+        """
+        return {a_key: a_value for a_key, a_value in vars(self).items() if not a_key.startswith("_")}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())})"
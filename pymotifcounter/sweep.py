@@ -0,0 +1,172 @@
+"""
+Runs motif counts over a grid of parameter values.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+
+import os
+import copy
+import itertools
+import concurrent.futures
+import pandas
+from .abstractcounter import *
+
+
+class PyMotifCounterSweep:
+    """
+    Runs the motif counts of one or more counters over a grid of parameter values and one or more graphs.
+
+    Notes:
+        * The grid maps parameter names or aliases (e.g. ``motif_size``, ``n_random``) to the values that they should
+          take. Each counter runs once for each combination of the values of the parameters that it defines and each
+          graph. Parameters of the grid that a counter does not define are not varied (and are reported as None) in
+          its runs.
+        * Runs are scheduled in parallel, in ascending order of their estimated cost, so that long runs do not hold
+          back the short ones. The default estimate grows with the size of the graph, the motif size and the number
+          of random networks.
+        * Each graph is transformed once per input format and shared by all runs over it (see
+          ``PyMotifCounterPreparedGraph``).
+        * As with ``PyMotifCounterParallelExecutor``, the number of parallel runs is limited so that the threads of
+          multi-threaded binaries do not oversubscribe ``n_cores``.
+
+    Example:
+        ::
+
+            sweep = PyMotifCounterSweep({"mfinder": PyMotifCounterMfinder(), "fanmod": PyMotifCounterFanmod()},
+                                        {"motif_size": [3, 4], "n_random": [0, 100]})
+            motif_counts = sweep([a_graph, another_graph])
+    """
+    def __init__(self, counters, grid, n_workers=None, n_cores=None, estimate=None):
+        """
+        Initialises a parameter sweep.
+
+        :param counters: A counter or a dictionary of backend names to counters.
+        :type counters: PyMotifCounterBase, dict
+        :param grid: A dictionary of parameter names or aliases to lists of values.
+        :type grid: dict
+        :param n_workers: The number of runs to execute in parallel (Default: As many as fit in ``n_cores``)
+        :type n_workers: int
+        :param n_cores: The number of cores available to the sweep (Default: ``os.cpu_count()``)
+        :type n_cores: int
+        :param estimate: A callable ``(counter, graph) -> float`` that estimates the cost of a run (Default:
+                         ``estimate_cost()``)
+        :type estimate: callable
+        :raises: PyMotifCounterParameterError if any value of the grid is invalid for its parameter.
+        """
+        if isinstance(counters, PyMotifCounterBase):
+            counters = {counters.__class__.__name__: counters}
+        if len(counters) == 0:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::At least one counter is required.")
+        for a_counter in counters.values():
+            if not isinstance(a_counter, PyMotifCounterBase):
+                raise TypeError(f"counters should be PyMotifCounterBase, received {type(a_counter)}")
+
+        # Validate each value of the grid, for each counter that defines its parameter
+        for a_param_name, param_values in grid.items():
+            if len(param_values) == 0:
+                raise PyMotifCounterError(f"{self.__class__.__name__}::Parameter {a_param_name} has no values.")
+            for a_counter in counters.values():
+                if a_param_name in a_counter._parameters:
+                    for a_value in param_values:
+                        a_counter.get_parameter(a_param_name)._check_value(a_value)
+
+        n_cores = n_cores or os.cpu_count() or 1
+        if n_workers is None:
+            n_workers = max(1, n_cores // max(a_counter._get_process_threads() for a_counter in counters.values()))
+        if n_workers < 1:
+            raise PyMotifCounterError(f"{self.__class__.__name__}::n_workers should be at least 1, "
+                                      f"received {n_workers}")
+
+        self._counters = counters
+        self._grid = grid
+        self._n_workers = n_workers
+        self._process_threads = max(1, n_cores // n_workers)
+        self._estimate = estimate or self.estimate_cost
+
+    @property
+    def n_workers(self):
+        return self._n_workers
+
+    @classmethod
+    def estimate_cost(cls, counter, a_graph):
+        """
+        Returns a rough estimate of the relative cost of a run.
+
+        Notes:
+            * The cost is taken to be proportional to the number of edges (see ``PyMotifCounterBase.get_graph_size()``)
+              and to the number of networks that are enumerated (the graph and its random networks) and to grow
+              fourfold with each unit of motif size.
+
+        :param counter: A counter whose parameters are set for the run.
+        :type counter: PyMotifCounterBase
+        :param a_graph: The graph of the run.
+        :rtype: float
+        """
+        motif_size = counter.get_parameter("motif_size").value if "motif_size" in counter._parameters else 3
+        n_random = counter.get_parameter("n_random").value if "n_random" in counter._parameters else 0
+        n_edges = PyMotifCounterBase.get_graph_size(a_graph)[1] or 0
+        return float(n_edges + 1) * 4 ** (motif_size - 3) * (n_random + 1)
+
+    def _get_runs(self, prepared_graphs):
+        """
+        Returns the description of each run of the sweep, in the order of the grid.
+
+        :returns: A list of ``(run labels, counter, prepared graph)`` tuples, where the run labels are the backend
+                  name, the graph index and the value of each parameter of the grid.
+        :rtype: list
+        """
+        runs = []
+        for a_backend, a_counter in self._counters.items():
+            counter_params = [a_param_name for a_param_name in self._grid if a_param_name in a_counter._parameters]
+            for param_values in itertools.product(*[self._grid[a_param_name] for a_param_name in counter_params]):
+                run_counter = copy.deepcopy(a_counter)
+                run_counter._set_process_threads(self._process_threads)
+                for a_param_name, a_value in zip(counter_params, param_values):
+                    run_counter.get_parameter(a_param_name).value = a_value
+                run_params = dict(zip(counter_params, param_values))
+                for a_graph_idx, a_graph in enumerate(prepared_graphs):
+                    runs.append(((a_backend, a_graph_idx) + tuple(run_params.get(a_param_name)
+                                                                  for a_param_name in self._grid),
+                                 run_counter,
+                                 a_graph))
+        return runs
+
+    def __call__(self, graphs):
+        """
+        Runs the sweep.
+
+        :param graphs: A graph or a list of graphs (of any type that counters accept).
+        :type graphs: list
+        :returns: A DataFrame of the results of all runs, indexed by ``backend, graph_index`` and the parameters of
+                  the grid (in the order of the grid, followed by the rows of each result). Its ``attrs["run_stats"]``
+                  maps the labels of each run to its ``PyMotifCounterRunStats``.
+        :rtype: pandas.DataFrame
+        """
+        if not isinstance(graphs, (list, tuple)):
+            graphs = [graphs]
+
+        # Graphs that are already prepared are left to the caller to close
+        prepared_graphs = [a_graph if isinstance(a_graph, PyMotifCounterPreparedGraph)
+                           else PyMotifCounterPreparedGraph(a_graph) for a_graph in graphs]
+        try:
+            runs = self._get_runs(prepared_graphs)
+            run_order = sorted(range(len(runs)), key=lambda k: self._estimate(runs[k][1], runs[k][2]))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._n_workers,
+                                                       thread_name_prefix="pymotifcounter") as executor:
+                futures = {k: executor.submit(runs[k][1], runs[k][2]) for k in run_order}
+                results = [(runs[k][0], futures[k].result()) for k in range(len(runs))]
+        finally:
+            for a_prepared_graph, a_graph in zip(prepared_graphs, graphs):
+                if a_prepared_graph is not a_graph:
+                    a_prepared_graph.close()
+
+        index_names = ["backend", "graph_index"] + list(self._grid)
+        all_results = []
+        for run_labels, a_result in results:
+            a_result.index = pandas.MultiIndex.from_tuples([run_labels] * len(a_result), names=index_names)
+            all_results.append(a_result)
+        all_results = pandas.concat(all_results)
+        all_results.attrs = {"run_stats": {run_labels: a_result.attrs.get("run_stats")
+                                           for run_labels, a_result in results}}
+        return all_results
@@ -4,7 +4,9 @@ PyMotifCounter utility functions.
 :author: Athanasios Anastasiou
 :date: Nov 2021
 """
+import os
 import numpy
+from .exceptions import *
 
 
 def adj_mat_to_motif_id(adj_mat):
@@ -61,3 +63,39 @@ def motif_id_to_adj_mat(a_motif_id, motif_size):
     return numpy.array(adj_mat)
     
 
+def load_edge_file(file_path, dtype="int32"):
+    """
+    Memory maps an on-disk array of edges, so that it can be counted without loading it in memory.
+
+    Notes:
+        * ``.npy`` files are mapped with the data type and shape they were saved with. Any other file is assumed to
+          hold raw, native byte order, integers of ``dtype``, as consecutive ``source, target`` pairs of node indices
+          (e.g. as written by ``numpy.ndarray.tofile()``).
+        * The returned array can be passed to any counter in place of a graph (see
+          ``PyMotifCounterInputTransformerBase._get_edge_array()``). Its edges are read from the disk in blocks, as
+          they are written to the input of the process.
+
+    :param file_path: The path of the edge file.
+    :type file_path: str
+    :param dtype: The integer data type of raw edge files (Default: int32).
+    :type dtype: str
+    :returns: A read-only ``(n_edges, 2)`` array of node indices.
+    :rtype: numpy.memmap
+    :raises: PyMotifCounterError if the file does not hold an array of edges.
+    """
+    file_path = os.fspath(file_path)
+    if file_path.endswith(".npy"):
+        edges = numpy.load(file_path, mmap_mode="r")
+    else:
+        dtype = numpy.dtype(dtype)
+        if os.path.getsize(file_path) % (2 * dtype.itemsize) != 0:
+            raise PyMotifCounterError(f"load_edge_file::The size of {file_path} is not a multiple of the size of a {dtype} edge.")
+        if os.path.getsize(file_path) == 0:
+            # Empty files can not be memory mapped
+            return numpy.empty((0, 2), dtype=dtype)
+        edges = numpy.memmap(file_path, dtype=dtype, mode="r").reshape(-1, 2)
+
+    if edges.ndim != 2 or edges.shape[1] != 2 or not numpy.issubdtype(edges.dtype, numpy.integer):
+        raise PyMotifCounterError(f"load_edge_file::{file_path} should hold an (n_edges, 2) integer array, found "
+                                  f"{edges.shape} {edges.dtype} array.")
+    return edges
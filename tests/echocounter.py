@@ -0,0 +1,130 @@
+"""
+A motif counter that can be used to test the full round trip of a count without any motif counting binaries.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import itertools
+from pymotifcounter.abstractcounter import (PyMotifCounterBase,
+                                            PyMotifCounterInputTransformerBase,
+                                            PyMotifCounterOutputTransformerBase)
+from pymotifcounter.parameters import PyMotifCounterParameterFilepath, PyMotifCounterParameterInt
+from pymotifcounter.counter_fanmod import PyMotifCounterInputTransformerFanmod
+
+
+class EchoOutputTransformer(PyMotifCounterOutputTransformerBase):
+    """
+    Parses an edge list back to a DataFrame.
+    """
+    _columns = {"source": "int64",
+                "target": "int64"}
+
+    def _parse_grammar(self, str_data):
+        rows = [a_line.split("\t") for a_line in str_data.splitlines() if a_line.strip() != ""]
+        return {"source": [int(a_row[0]) for a_row in rows],
+                "target": [int(a_row[1]) for a_row in rows]}
+
+
+class EchoCounter(PyMotifCounterBase):
+    """
+    A counter whose "binary" (``cat``) returns the edge list it was given, so that the full round trip of a count can
+    be tested without any motif counting binaries.
+    """
+    def __init__(self):
+        super().__init__(binary_location="cat",
+                         input_parameter=PyMotifCounterParameterFilepath("i", alias="echo_in", exists=True, pos=0),
+                         output_parameter=PyMotifCounterParameterFilepath("o", alias="echo_out", default_value="-",
+                                                                          is_required=False),
+                         input_transformer=PyMotifCounterInputTransformerFanmod(),
+                         output_transformer=EchoOutputTransformer(),
+                         parameters=[])
+
+
+class SleepInputTransformer(PyMotifCounterInputTransformerBase):
+    """
+    Ignores the graph and produces a shell script that records its PID in ``pid_file`` and then sleeps.
+    """
+    def __init__(self, seconds, pid_file):
+        self._seconds = seconds
+        self._pid_file = pid_file
+
+    def __call__(self, a_graph):
+        return (a_line for a_line in [f"echo $$ > {self._pid_file}\n", f"exec sleep {self._seconds}\n"])
+
+
+class SleepCounter(PyMotifCounterBase):
+    """
+    A counter whose "binary" (``sh``) sleeps for a given number of seconds, to test timeouts and cancellation.
+    """
+    def __init__(self, seconds, pid_file):
+        super().__init__(binary_location="sh",
+                         input_parameter=PyMotifCounterParameterFilepath("i", alias="sleep_in", exists=True, pos=0),
+                         output_parameter=PyMotifCounterParameterFilepath("o", alias="sleep_out", default_value="-",
+                                                                          is_required=False),
+                         input_transformer=SleepInputTransformer(seconds, pid_file),
+                         output_transformer=EchoOutputTransformer(),
+                         parameters=[])
+
+
+class ScriptInputTransformer(PyMotifCounterInputTransformerBase):
+    """
+    Ignores the graph and produces a given shell script.
+    """
+    def __init__(self, script):
+        self._script = script
+
+    def __call__(self, a_graph):
+        return (a_line for a_line in [self._script])
+
+
+class ScriptCounter(PyMotifCounterBase):
+    """
+    A counter whose "binary" (``sh``) runs a given shell script, to test how the output and the exit status of a
+    process are handled.
+    """
+    def __init__(self, script):
+        super().__init__(binary_location="sh",
+                         input_parameter=PyMotifCounterParameterFilepath("i", alias="script_in", exists=True, pos=0),
+                         output_parameter=PyMotifCounterParameterFilepath("o", alias="script_out", default_value="-",
+                                                                          is_required=False),
+                         input_transformer=ScriptInputTransformer(script),
+                         output_transformer=EchoOutputTransformer(),
+                         parameters=[])
+
+
+class StdinEchoCounter(PyMotifCounterBase):
+    """
+    An echo counter that reads its input from stdin, like NetMODE.
+    """
+    def __init__(self, binary_location="cat"):
+        super().__init__(binary_location=binary_location,
+                         input_parameter=PyMotifCounterParameterFilepath("i", alias="echo_in", default_value="-",
+                                                                         is_required=False),
+                         output_parameter=PyMotifCounterParameterFilepath("o", alias="echo_out", default_value="-",
+                                                                          is_required=False),
+                         input_transformer=PyMotifCounterInputTransformerFanmod(),
+                         output_transformer=EchoOutputTransformer(),
+                         parameters=[])
+
+
+class ParamEchoInputTransformer(PyMotifCounterInputTransformerFanmod):
+    """
+    Produces a shell script that prints the edge list of the graph followed by its two positional arguments.
+    """
+    def __call__(self, a_graph):
+        return itertools.chain(["cat <<'EOF'\n"], super().__call__(a_graph), ["EOF\n", "echo \"$1\t$2\"\n"])
+
+
+class ParamEchoCounter(PyMotifCounterBase):
+    """
+    An echo counter with ``motif_size, n_random`` parameters, whose values are appended to the edge list it returns.
+    """
+    def __init__(self):
+        super().__init__(binary_location="sh",
+                         input_parameter=PyMotifCounterParameterFilepath("i", alias="echo_in", exists=True, pos=0),
+                         output_parameter=PyMotifCounterParameterFilepath("o", alias="echo_out", default_value="-",
+                                                                          is_required=False),
+                         input_transformer=ParamEchoInputTransformer(),
+                         output_transformer=EchoOutputTransformer(),
+                         parameters=[PyMotifCounterParameterInt("s", alias="motif_size", default_value=3, pos=1),
+                                     PyMotifCounterParameterInt("r", alias="n_random", default_value=0, pos=2)])
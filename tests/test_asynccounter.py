@@ -0,0 +1,67 @@
+"""
+Ensures the functionality of the asyncio interface of PyMotifCounterBase.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import os
+import time
+import asyncio
+import networkx
+import pytest
+from pymotifcounter.exceptions import PyMotifCounterError
+from echocounter import EchoCounter, SleepCounter
+
+
+def process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_count_async():
+    """
+    Ensures that concurrent asynchronous counts on the same counter return the same results as synchronous ones.
+    """
+    graphs = [networkx.gnp_random_graph(15, 0.2, directed=True, seed=k) for k in range(10)]
+    counter = EchoCounter()
+
+    async def count_all():
+        return await asyncio.gather(*[counter.count_async(a_graph) for a_graph in graphs])
+
+    for a_result, a_graph in zip(asyncio.run(count_all()), graphs):
+        assert a_result.equals(counter(a_graph))
+
+
+def test_count_async_timeout(tmp_path):
+    """
+    Ensures that a count that times out raises an error and that its process is killed.
+    """
+    pid_file = tmp_path / "pid"
+    counter = SleepCounter(30, pid_file)
+    start_time = time.monotonic()
+    with pytest.raises(PyMotifCounterError):
+        asyncio.run(counter.count_async(networkx.path_graph(3), timeout=0.5))
+    assert time.monotonic() - start_time < 10
+    assert not process_exists(int(pid_file.read_text()))
+
+
+def test_count_async_cancel(tmp_path):
+    """
+    Ensures that cancelling a count kills its process.
+    """
+    pid_file = tmp_path / "pid"
+    counter = SleepCounter(30, pid_file)
+
+    async def count_and_cancel():
+        a_task = asyncio.create_task(counter.count_async(networkx.path_graph(3), timeout=None))
+        while not pid_file.exists() or pid_file.read_text() == "":
+            await asyncio.sleep(0.05)
+        a_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await a_task
+
+    asyncio.run(count_and_cancel())
+    assert not process_exists(int(pid_file.read_text()))
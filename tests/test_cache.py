@@ -0,0 +1,133 @@
+"""
+Ensures the functionality of the result cache.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import copy
+import networkx
+import pytest
+from pymotifcounter.cache import PyMotifCounterResultCache
+from pymotifcounter.exceptions import PyMotifCounterError
+from echocounter import EchoCounter, StdinEchoCounter
+
+
+class CountingEchoCounter(EchoCounter):
+    """
+    An echo counter that counts the number of times its process runs.
+    """
+    def __init__(self):
+        super().__init__()
+        self.n_runs = 0
+
+    def _run(self, ctx):
+        self.n_runs += 1
+        return super()._run(ctx)
+
+
+def test_memory_cache():
+    """
+    Ensures that repeated counts of the same graph are served from the cache.
+    """
+    counter = CountingEchoCounter()
+    counter.cache = PyMotifCounterResultCache()
+    a_graph = networkx.gnp_random_graph(20, 0.2, directed=True, seed=0)
+    first_result = counter(a_graph)
+    # Changes to a returned result do not affect the cached one
+    first_result.insert(0, "graph_index", 0)
+    assert counter(a_graph).equals(first_result.drop(columns="graph_index"))
+    assert counter.n_runs == 1
+
+    # A copy of the graph
+    counter(networkx.DiGraph(a_graph))
+    assert counter.n_runs == 1
+
+    counter(networkx.gnp_random_graph(20, 0.2, directed=True, seed=1))
+    assert counter.n_runs == 2
+    stats = counter.cache.stats
+    assert (stats["hits"], stats["misses"], stats["memory_items"]) == (2, 2, 2)
+
+
+def test_streamed_input_cache():
+    """
+    Ensures that a streamed input is still streamed to the process when a cache is attached to the counter.
+    """
+    counter = StdinEchoCounter()
+    counter.cache = PyMotifCounterResultCache()
+    inputs = []
+    run = counter._run
+    counter._run = lambda ctx: inputs.append(ctx["base_transformed_graph"]) or run(ctx)
+    a_graph = networkx.gnp_random_graph(300, 0.05, directed=True, seed=0)
+    expected = StdinEchoCounter()(a_graph)
+    assert counter(a_graph).equals(expected)
+    assert counter(a_graph).equals(expected)
+    assert len(inputs) == 1 and not isinstance(inputs[0], str)
+    assert counter.cache.stats["hits"] == 1
+
+
+def test_cache_key():
+    """
+    Ensures that results are keyed by the counter as well as by the graph.
+    """
+    a_cache = PyMotifCounterResultCache()
+    a_graph = networkx.path_graph(4, create_using=networkx.DiGraph)
+    for a_counter in [CountingEchoCounter(), CountingEchoCounter()]:
+        a_counter.cache = a_cache
+        a_counter(a_graph)
+    # Counters of the same configuration share their results, regardless of their temporary files
+    assert a_cache.stats["hits"] == 1
+    assert PyMotifCounterResultCache.make_key("ab", "c") != PyMotifCounterResultCache.make_key("a", "bc")
+
+
+def test_disk_cache(tmp_path):
+    """
+    Ensures that results persist on the disk across caches and that they are promoted to memory.
+    """
+    disk_path = str(tmp_path / "cache.sqlite")
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 6)]
+    counter = CountingEchoCounter()
+    counter.cache = PyMotifCounterResultCache(disk_path=disk_path)
+    expected = counter.count_many(graphs)
+
+    counter.cache = PyMotifCounterResultCache(disk_path=disk_path)
+    assert counter.count_many(graphs).equals(expected)
+    assert counter.count_many(graphs).equals(expected)
+    assert counter.n_runs == 4
+    stats = counter.cache.stats
+    assert (stats["disk_hits"], stats["memory_hits"], stats["disk_items"]) == (4, 4, 4)
+
+    counter.cache.clear()
+    assert counter.cache.stats["disk_items"] == 0
+
+
+def test_cache_eviction(tmp_path):
+    """
+    Ensures that each tier evicts its least recently used results to remain within its size.
+    """
+    a_cache = PyMotifCounterResultCache(max_memory_bytes=2500, disk_path=str(tmp_path / "cache.sqlite"),
+                                        max_disk_bytes=2500)
+    for k in range(10):
+        a_cache.put(str(k), list(range(100 * k, 100 * k + 100)))
+    stats = a_cache.stats
+    assert 0 < stats["memory_bytes"] <= 2500 and 0 < stats["disk_bytes"] <= 2500
+    assert stats["memory_evictions"] == 10 - stats["memory_items"]
+    assert stats["disk_evictions"] == 10 - stats["disk_items"]
+    assert a_cache.get("9") == list(range(900, 1000))
+    assert a_cache.get("0") is None
+
+    with pytest.raises(PyMotifCounterError):
+        PyMotifCounterResultCache(max_memory_bytes=-1)
+
+
+def test_cache_deepcopy():
+    """
+    Ensures that copies of a counter share its cache but not its parameters.
+    """
+    counter = CountingEchoCounter()
+    counter.cache = PyMotifCounterResultCache()
+    a_copy = copy.deepcopy(counter)
+    assert a_copy.cache is counter.cache
+    assert a_copy.in_param is not counter.in_param
+    a_graph = networkx.path_graph(4, create_using=networkx.DiGraph)
+    counter(a_graph)
+    assert a_copy(a_graph).equals(counter(a_graph)) and a_copy.n_runs == 0
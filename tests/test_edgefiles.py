@@ -0,0 +1,65 @@
+"""
+Ensures that counters can stream their input from on-disk edge files.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import numpy
+import networkx
+import pytest
+from pymotifcounter.util import load_edge_file
+from pymotifcounter.exceptions import PyMotifCounterError
+from pymotifcounter.concretecounters import PyMotifCounterInputTransformerNetMODE
+from echocounter import EchoCounter, StdinEchoCounter
+
+
+@pytest.fixture(scope="module")
+def edges():
+    return numpy.array(networkx.gnm_random_graph(5000, 50000, directed=True, seed=0).edges(), dtype=numpy.int32)
+
+
+def test_load_edge_file(tmp_path, edges):
+    """
+    Ensures that .npy and raw edge files are memory mapped rather than loaded.
+    """
+    numpy.save(tmp_path / "edges.npy", edges)
+    edges.tofile(tmp_path / "edges.bin")
+    edges.astype(numpy.int64).tofile(tmp_path / "edges64.bin")
+    for an_edge_file in [load_edge_file(tmp_path / "edges.npy"),
+                         load_edge_file(str(tmp_path / "edges.bin")),
+                         load_edge_file(tmp_path / "edges64.bin", dtype="int64")]:
+        assert isinstance(an_edge_file, numpy.memmap)
+        assert numpy.array_equal(an_edge_file, edges)
+
+    (tmp_path / "empty.bin").write_bytes(b"")
+    assert load_edge_file(tmp_path / "empty.bin").shape == (0, 2)
+
+    (tmp_path / "odd.bin").write_bytes(b"\0" * 12)
+    with pytest.raises(PyMotifCounterError):
+        load_edge_file(tmp_path / "odd.bin")
+    numpy.save(tmp_path / "floats.npy", edges.astype(float))
+    with pytest.raises(PyMotifCounterError):
+        load_edge_file(tmp_path / "floats.npy")
+
+
+def test_count_edge_file(tmp_path, edges):
+    """
+    Ensures that counts over edge files, via a temporary input file or stdin, are the same as over the edges in memory.
+    """
+    numpy.save(tmp_path / "edges.npy", edges)
+    edges.tofile(tmp_path / "edges.bin")
+    for counter in [EchoCounter(), StdinEchoCounter()]:
+        expected = counter(edges)
+        assert len(expected) == len(edges)
+        assert counter(tmp_path / "edges.npy").equals(expected)
+        assert counter(str(tmp_path / "edges.bin")).equals(expected)
+
+
+def test_edge_file_header(tmp_path, edges):
+    """
+    Ensures that the number of nodes of an edge file is determined across all of its blocks.
+    """
+    numpy.save(tmp_path / "edges.npy", edges)
+    a_transformer = PyMotifCounterInputTransformerNetMODE()
+    a_transformer._block_size = 100
+    assert next(iter(a_transformer(tmp_path / "edges.npy"))) == f"{int(edges.max()) + 2}\n"
@@ -0,0 +1,92 @@
+"""
+Ensures the functionality of the ESU / RAND-ESU counter.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import shutil
+import itertools
+import collections
+import numpy
+import networkx
+import pytest
+from pymotifcounter.util import adj_mat_to_motif_id
+from pymotifcounter.exceptions import PyMotifCounterParameterError
+from pymotifcounter.concretecounters import PyMotifCounterEsu, PyMotifCounterNativeTriads, PyMotifCounterMfinder
+
+
+def get_counter(motif_size, **parameters):
+    counter = PyMotifCounterEsu()
+    counter.get_parameter("motif_size").value = motif_size
+    for a_name, a_value in parameters.items():
+        counter.get_parameter(a_name).value = a_value
+    return counter
+
+
+@pytest.mark.parametrize("motif_size, is_undirected", [(3, False), (4, False), (5, True), (6, True)])
+def test_esu_enumeration(motif_size, is_undirected):
+    """
+    Ensures that ESU counts every connected subgraph once, by the smallest motif id of any labelling of its nodes.
+    """
+    a_graph = networkx.gnp_random_graph(11, 0.25, directed=not is_undirected, seed=motif_size)
+    expected = collections.Counter()
+    for some_nodes in itertools.combinations(a_graph.nodes(), motif_size):
+        subgraph = a_graph.subgraph(some_nodes)
+        if networkx.is_connected(subgraph.to_undirected(as_view=True)):
+            adj_mat = networkx.to_numpy_array(subgraph, dtype=int)
+            expected[min(adj_mat_to_motif_id(adj_mat[numpy.ix_(p, p)])
+                         for p in itertools.permutations(range(motif_size)))] += 1
+
+    result = get_counter(motif_size, is_undirected=is_undirected)(a_graph)
+    assert dict(zip(result["motif_id"], result["nsampled"])) == expected
+    assert (result["nreal"] == result["nsampled"]).all()
+    assert list(result["motif_id"]) == sorted(expected)
+
+
+def test_esu_triads():
+    """
+    Ensures that size 3 subgraphs agree with the triad counter.
+    """
+    a_graph = networkx.gnp_random_graph(80, 0.05, directed=True, seed=0)
+    result = get_counter(3)(a_graph)
+    triads = PyMotifCounterNativeTriads()(a_graph)
+    assert dict(zip(result["motif_id"], result["nreal"])) == \
+        {a_motif_id: a_count for a_motif_id, a_count in zip(triads["motif_id"], triads["nreal"]) if a_count > 0}
+
+
+def test_rand_esu():
+    """
+    Ensures that RAND-ESU samples subgraphs with the product of the probabilities of each depth.
+    """
+    a_graph = networkx.gnp_random_graph(150, 0.04, directed=True, seed=0)
+    expected = get_counter(4)(a_graph)
+    assert get_counter(4, sampling_probabilities="1,1,1,1")(a_graph).equals(expected)
+
+    sampled = get_counter(4, sampling_probabilities="1,1,0.5,0.5", random_seed=1)(a_graph)
+    assert sampled["nsampled"].sum() < expected["nsampled"].sum()
+    assert (sampled["nreal"] == 4 * sampled["nsampled"]).all()
+    assert sampled["nreal"].sum() == pytest.approx(expected["nreal"].sum(), rel=0.1)
+    # Samples are reproducible by their seed
+    assert get_counter(4, sampling_probabilities="1,1,0.5,0.5", random_seed=1)(a_graph).equals(sampled)
+
+    with pytest.raises(PyMotifCounterParameterError):
+        get_counter(4, sampling_probabilities="1,0.5")(a_graph)
+    with pytest.raises(PyMotifCounterParameterError):
+        get_counter(4).get_parameter("sampling_probabilities").value = "1,1,1.5,1"
+    with pytest.raises(PyMotifCounterParameterError):
+        get_counter(7)
+
+
+@pytest.mark.skipif(shutil.which("mfinder") is None, reason="mfinder is not installed")
+def test_esu_mfinder_parity():
+    """
+    Ensures that the size 4 subgraph counts agree with those of mfinder.
+    """
+    a_graph = networkx.gnp_random_graph(60, 0.06, directed=True, seed=0)
+    mfinder_counter = PyMotifCounterMfinder()
+    mfinder_counter.get_parameter("motif_size").value = 4
+    mfinder_result = mfinder_counter(a_graph)
+    result = get_counter(4)(a_graph)
+    assert dict(zip(result["motif_id"], result["nreal"])) == \
+        {a_motif_id: a_count for a_motif_id, a_count in zip(mfinder_result["motif_id"], mfinder_result["nreal"])
+         if a_count > 0}
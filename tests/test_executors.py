@@ -0,0 +1,113 @@
+"""
+Ensures the functionality of the parallel executors.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import os
+import shutil
+import networkx
+import pytest
+from pymotifcounter.executors import PyMotifCounterParallelExecutor
+from pymotifcounter.exceptions import PyMotifCounterError, PyMotifCounterProcessError
+from pymotifcounter.concretecounters import PyMotifCounterNetMODE
+from echocounter import EchoCounter, ScriptCounter
+
+
+class ThreadedEchoCounter(EchoCounter):
+    """
+    An echo counter that declares a number of threads per process, like NetMODE's ``t``.
+
+    Notes:
+        * The number of threads is not passed to ``cat``.
+    """
+    def __init__(self, n_threads):
+        super().__init__()
+        self.n_threads = n_threads
+
+    def _get_process_threads(self):
+        return self.n_threads
+
+    def _set_process_threads(self, n_threads):
+        self.n_threads = min(self.n_threads, n_threads)
+        return self
+
+
+def test_parallel_count_many():
+    """
+    Ensures that a parallel batch count returns the same results, in the same order, as a serial one.
+    """
+    graphs = [networkx.gnp_random_graph(20, 0.2, directed=True, seed=k) for k in range(40)]
+    counter = EchoCounter()
+    with PyMotifCounterParallelExecutor(counter, n_workers=4, max_pending=6) as executor:
+        parallel_results = executor.count_many(graphs)
+        tmp_dirs = [a_worker[1]["base_tmp_dir"] for a_worker in executor._workers]
+        assert all(map(os.path.isdir, tmp_dirs))
+        assert all(a_worker[1]["base_cwd"] == a_tmp_dir for a_worker, a_tmp_dir in zip(executor._workers, tmp_dirs))
+    assert parallel_results.equals(counter.count_many(graphs))
+    # Closing the executor removes the temporary files of its workers.
+    assert not any(map(os.path.exists, tmp_dirs))
+
+
+def test_parallel_count_many_generator():
+    """
+    Ensures that a parallel batch count can be consumed lazily.
+    """
+    graphs = (networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 12))
+    with PyMotifCounterParallelExecutor(EchoCounter(), n_workers=3, max_pending=2) as executor:
+        results = list(executor.count_many(graphs, as_generator=True))
+    assert [a_graph_idx for a_graph_idx, _ in results] == list(range(10))
+    assert [len(a_result) for _, a_result in results] == list(range(1, 11))
+
+
+@pytest.mark.skipif(shutil.which("NetMODE") is None, reason="NetMODE is not installed")
+def test_parallel_netmode():
+    """
+    Ensures that parallel NetMODE processes do not share the adjacency matrix file they create in their CWD.
+    """
+    graphs = [networkx.gnp_random_graph(12, 0.3, directed=True, seed=k) for k in range(8)]
+    counter = PyMotifCounterNetMODE()
+    with PyMotifCounterParallelExecutor(counter, n_workers=4) as executor:
+        parallel_results = executor.count_many(graphs)
+    assert parallel_results.equals(counter.count_many(graphs))
+    assert not os.path.exists("adjMat.txt")
+
+
+def test_core_budget():
+    """
+    Ensures that the parallelism of the executor and of multi-threaded processes do not oversubscribe the cores.
+    """
+    executor = PyMotifCounterParallelExecutor(ThreadedEchoCounter(4), n_cores=16)
+    assert (executor.n_workers, executor.process_threads) == (4, 4)
+
+    executor = PyMotifCounterParallelExecutor(ThreadedEchoCounter(4), n_workers=8, n_cores=16)
+    assert (executor.n_workers, executor.process_threads) == (8, 2)
+
+    counter = ThreadedEchoCounter(4)
+    with PyMotifCounterParallelExecutor(counter, n_workers=8, n_cores=16) as executor:
+        executor.count_many([networkx.path_graph(3)])
+        assert executor._workers[0][0].n_threads == 2
+    # The counter that was handed to the executor remains as configured.
+    assert counter.n_threads == 4
+
+    with pytest.raises(PyMotifCounterError):
+        PyMotifCounterParallelExecutor(EchoCounter(), n_workers=0)
+
+
+def test_parallel_count():
+    """
+    Ensures that single graphs are counted on the workers, which are prepared once, and that their errors are raised.
+    """
+    graphs = [networkx.gnp_random_graph(20, 0.2, directed=True, seed=k) for k in range(6)]
+    counter = EchoCounter()
+    with PyMotifCounterParallelExecutor(counter, n_workers=2) as executor:
+        assert all(executor.count(a_graph).equals(counter(a_graph)) for a_graph in graphs)
+        futures = [executor.submit(a_graph) for a_graph in graphs]
+        assert all(a_future.result().equals(counter(a_graph)) for a_future, a_graph in zip(futures, graphs))
+        assert len(executor._workers) <= 2
+        tmp_dirs = [a_worker[1]["base_tmp_dir"] for a_worker in executor._workers]
+    assert not any(map(os.path.exists, tmp_dirs))
+
+    with PyMotifCounterParallelExecutor(ScriptCounter("exit 3\n"), n_workers=1) as executor:
+        with pytest.raises(PyMotifCounterProcessError):
+            executor.count(graphs[0])
@@ -0,0 +1,120 @@
+"""
+Ensures the functionality of the hooks of counters and of the metrics collector.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import copy
+import threading
+import http.server
+import networkx
+import numpy
+import pytest
+from pymotifcounter.exceptions import PyMotifCounterError, PyMotifCounterProcessError
+from pymotifcounter.cache import PyMotifCounterResultCache
+from pymotifcounter.metrics import PyMotifCounterMetricsCollector
+from echocounter import EchoCounter, ParamEchoCounter, ScriptCounter
+
+
+def record_events(counter):
+    """
+    Registers a hook on every event of a counter and returns the list that the events are appended to.
+    """
+    events = []
+    for an_event in counter._hook_events:
+        counter.add_hook(an_event, events.append)
+    return events
+
+
+def test_hooks():
+    """
+    Ensures that hooks are called on each event of a count, with the information of the count.
+    """
+    counter = ParamEchoCounter()
+    counter.get_parameter("n_random").value = 10
+    events = record_events(counter)
+    a_result = counter(networkx.path_graph(5, create_using=networkx.DiGraph))
+    assert [an_event["event"] for an_event in events] == ["run_start", "process_spawn", "process_exit",
+                                                          "parse_complete"]
+    assert all((an_event["backend"], an_event["n_nodes"], an_event["n_edges"]) == ("ParamEchoCounter", 5, 4)
+               for an_event in events)
+    assert events[0]["parameters"] == {"motif_size": 3, "n_random": 10}
+    assert events[1]["pid"] > 0 and events[2]["returncode"] == 0
+    assert events[3]["result"] is a_result and events[3]["stats"].total_time > 0
+
+    # Graph sizes of graphs that are not networkx graphs
+    events.clear()
+    counter(numpy.array([[0, 1], [1, 6]]))
+    assert (events[0]["n_nodes"], events[0]["n_edges"]) == (7, 2)
+
+    # Cached results and copies of the counter
+    events.clear()
+    counter.cache = PyMotifCounterResultCache()
+    copy.deepcopy(counter)(networkx.path_graph(3))
+    counter(networkx.path_graph(3))
+    assert [an_event["event"] for an_event in events][-2:] == ["run_start", "parse_complete"]
+    assert events[-1]["stats"].cached
+
+    counter.remove_hook("run_start", events.append)
+    with pytest.raises(PyMotifCounterError):
+        counter.remove_hook("run_start", events.append)
+    with pytest.raises(PyMotifCounterError):
+        counter.add_hook("run_end", events.append)
+
+
+def test_hook_errors():
+    """
+    Ensures that failed counts fire an error event and that failing hooks do not interrupt counts.
+    """
+    counter = ScriptCounter("exit 1\n")
+    events = record_events(counter)
+    with pytest.raises(PyMotifCounterProcessError):
+        counter(networkx.path_graph(3))
+    assert events[-1]["event"] == "error" and isinstance(events[-1]["error"], PyMotifCounterProcessError)
+
+    def failing_hook(event_info):
+        raise ValueError("Failing hook")
+
+    counter = EchoCounter()
+    counter.add_hook("run_start", failing_hook)
+    with pytest.warns(RuntimeWarning, match="Failing hook"):
+        assert len(counter(networkx.path_graph(3, create_using=networkx.DiGraph))) == 2
+
+
+def test_metrics_collector():
+    """
+    Ensures that the metrics collector aggregates the events of counts and that it can push them to a collector.
+    """
+    counter = EchoCounter()
+    collector = PyMotifCounterMetricsCollector().register(counter)
+    counter.count_many([networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 6)])
+    metrics = collector.render()
+    assert "# TYPE pymotifcounter_runs_started_total counter\n" in metrics
+    assert 'pymotifcounter_runs_started_total{backend="EchoCounter"} 4.0\n' in metrics
+    assert 'pymotifcounter_graph_edges_total{backend="EchoCounter"} 10.0\n' in metrics
+    assert 'pymotifcounter_processes_running{backend="EchoCounter"} 0.0\n' in metrics
+    assert 'pymotifcounter_phase_seconds_count{backend="EchoCounter",phase="process"} 4.0\n' in metrics
+    assert "errors_total" not in metrics
+
+    # A stand-in of a collector that receives the metrics
+    received = []
+
+    class CollectorHandler(http.server.BaseHTTPRequestHandler):
+        def do_PUT(self):
+            received.append(self.rfile.read(int(self.headers["Content-Length"])).decode())
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), CollectorHandler)
+    threading.Thread(target=server.handle_request, daemon=True).start()
+    try:
+        assert collector.push(f"http://127.0.0.1:{server.server_port}/metrics/job/test") == 200
+    finally:
+        server.server_close()
+    assert received == [metrics]
+
+    collector.unregister(counter)
+    assert all(len(hooks) == 0 for hooks in counter._hooks.values())
@@ -0,0 +1,118 @@
+"""
+Ensures that the input transformers of each concrete counter produce the edge list that each binary expects.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import itertools
+import numpy
+import pandas
+import networkx
+import pytest
+from pymotifcounter.concretecounters import (PyMotifCounterInputTransformerMfinder,
+                                             PyMotifCounterInputTransformerFanmod,
+                                             PyMotifCounterInputTransformerNetMODE,
+                                             PyMotifCounterInputTransformerPgd)
+from pymotifcounter.exceptions import PyMotifCounterError
+from echocounter import EchoCounter
+
+
+def legacy_edge_list(a_graph, edge_format, with_header=False):
+    """
+    The per edge implementation of the input transformers, that the bulk implementation must reproduce.
+    """
+    nodeid_to_num = dict(zip(a_graph.nodes(), range(1, a_graph.number_of_nodes() + 1)))
+    header = [f"{a_graph.number_of_nodes()+1}\n"] if with_header else []
+    return "".join(itertools.chain(header, (edge_format.format(nodeid_to_num[x[0]], nodeid_to_num[x[1]])
+                                            for x in networkx.to_edgelist(a_graph))))
+
+
+TRANSFORMERS = [(PyMotifCounterInputTransformerMfinder(), "{}\t{}\t1\n", False),
+                (PyMotifCounterInputTransformerFanmod(), "{}\t{}\n", False),
+                (PyMotifCounterInputTransformerNetMODE(), "{}\t{}\n", True),
+                (PyMotifCounterInputTransformerPgd(), "{}, {}\n", False)]
+
+GRAPHS = [networkx.DiGraph(),
+          networkx.path_graph(1),
+          networkx.gnp_random_graph(50, 0.1, directed=True, seed=0),
+          networkx.gnm_random_graph(3000, 20000, seed=1),
+          networkx.relabel_nodes(networkx.gnp_random_graph(40, 0.2, directed=True, seed=2),
+                                 lambda x: f"node_{(x * 7) % 40}"),
+          networkx.DiGraph([(3, 3), (10, 2), (2, 10), (7, 3)]),
+          networkx.Graph([(3, 3), (10, 2), (2, 10), (7, 3), (1, 7)]),
+          networkx.MultiDiGraph([(1, 2), (1, 2), (2, 1), (3, 1)]),
+          networkx.gnp_random_graph(60, 0.2, seed=4).subgraph(range(10, 50))]
+
+
+@pytest.mark.parametrize("a_transformer, edge_format, with_header", TRANSFORMERS)
+@pytest.mark.parametrize("a_graph", GRAPHS)
+def test_byte_identity(a_transformer, edge_format, with_header, a_graph):
+    """
+    Ensures that the bulk edge lists are byte-identical to the per edge ones.
+    """
+    assert "".join(a_transformer(a_graph)).encode() == legacy_edge_list(a_graph, edge_format, with_header).encode()
+
+
+def test_to_file(tmp_path):
+    """
+    Ensures that an edge list that spans multiple blocks is written to a file in full.
+    """
+    a_graph = networkx.gnm_random_graph(3000, 20000, directed=True, seed=3)
+    a_transformer = PyMotifCounterInputTransformerMfinder()
+    a_transformer.to_file(a_graph, str(tmp_path / "edges"))
+    assert (tmp_path / "edges").read_text() == legacy_edge_list(a_graph, "{}\t{}\t1\n")
+
+
+@pytest.mark.parametrize("a_transformer, edge_format, with_header", TRANSFORMERS)
+def test_edge_array_inputs(a_transformer, edge_format, with_header):
+    """
+    Ensures that edge arrays, sparse adjacency matrices and edge DataFrames produce the same edge list as the
+    networkx graph they describe.
+    """
+    scipy_sparse = pytest.importorskip("scipy.sparse")
+    edges = numpy.array(sorted(networkx.gnp_random_graph(200, 0.05, directed=True, seed=5).edges()))
+    a_graph = networkx.DiGraph()
+    a_graph.add_nodes_from(range(200))
+    a_graph.add_edges_from(edges.tolist())
+    expected = legacy_edge_list(a_graph, edge_format, with_header)
+
+    assert "".join(a_transformer(edges)) == expected
+    assert "".join(a_transformer(edges.astype(numpy.int32))) == expected
+    adj_mat = networkx.to_scipy_sparse_array(a_graph, format="coo")
+    assert "".join(a_transformer(adj_mat)) == expected
+    assert "".join(a_transformer(scipy_sparse.csr_matrix(adj_mat))) == expected
+
+    # Edges are in the order of the rows, rather than grouped by their source node as in networkx
+    edges_df = networkx.to_pandas_edgelist(networkx.relabel_nodes(a_graph, lambda x: f"node_{(x * 7) % 200}"))
+    assert sorted("".join(a_transformer(edges_df)).splitlines()) == \
+           sorted(legacy_edge_list(networkx.from_pandas_edgelist(edges_df, create_using=networkx.DiGraph),
+                                   edge_format, with_header).splitlines())
+
+
+def test_edge_array_errors():
+    """
+    Ensures that invalid or unsupported graphs are rejected.
+    """
+    a_transformer = PyMotifCounterInputTransformerFanmod()
+    with pytest.raises(PyMotifCounterError):
+        a_transformer(numpy.zeros((4, 3), dtype=int))
+    with pytest.raises(PyMotifCounterError):
+        a_transformer(numpy.zeros((4, 2), dtype=float))
+    with pytest.raises(PyMotifCounterError):
+        a_transformer(numpy.array([[0, 1], [-1, 2]]))
+    with pytest.raises(PyMotifCounterError):
+        a_transformer(pandas.DataFrame({"u": [1], "v": [2]}))
+    with pytest.raises(TypeError):
+        a_transformer([(0, 1)])
+
+
+def test_count_edge_array():
+    """
+    Ensures that a counter accepts an edge array in place of a networkx graph.
+    """
+    edges = numpy.array([[0, 1], [1, 2], [2, 0], [4, 1]])
+    a_graph = networkx.DiGraph()
+    a_graph.add_nodes_from(range(5))
+    a_graph.add_edges_from(edges.tolist())
+    counter = EchoCounter()
+    assert counter(edges).equals(counter(a_graph))
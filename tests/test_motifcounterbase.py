@@ -4,17 +4,22 @@ Ensures the functionality of PyMotifCounterBase.
 :author: Athanasios Anastasiou
 :date: Nov 2021
 """
+import os
 import pytest
 import re
+import networkx
 from pymotifcounter.abstractcounter import (PyMotifCounterBase,
                                             PyMotifCounterInputTransformerBase,
-                                            PyMotifCounterOutputTransformerBase)
+                                            PyMotifCounterOutputTransformerBase,
+                                            PyMotifCounterPreparedGraph,
+                                            get_default_scratch_dir)
 
 from pymotifcounter.parameters import (PyMotifCounterParameterInt,
                                        PyMotifCounterParameterStr,
                                        PyMotifCounterParameterFilepath)
 
 from pymotifcounter.exceptions import PyMotifCounterError
+from echocounter import EchoCounter, ScriptCounter
 
 
 def test_init_binary_is_invalid():
@@ -74,3 +79,81 @@ def get_unknown_parameter_error():
     with pytest.raises(PyMotifCounterError):
         b.get_parameter("l")
 
+
+def test_count_many():
+    """
+    Ensures that a batch count returns the same results as counting each graph separately.
+    """
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 7)]
+    counter = EchoCounter()
+    results = counter.count_many(graphs)
+    assert list(results.columns) == ["graph_index", "source", "target"]
+    for a_graph_idx, a_graph in enumerate(graphs):
+        a_result = results[results["graph_index"] == a_graph_idx]
+        assert a_result.drop(columns="graph_index").reset_index(drop=True).equals(counter(a_graph))
+        assert len(a_result) == a_graph.number_of_edges()
+
+
+def test_count_many_generator():
+    """
+    Ensures that a batch count can be consumed lazily and that it removes its temporary files once exhausted.
+    """
+    graphs = (networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 5))
+    counter = EchoCounter()
+    batch_ctxs = []
+    setup_batch = counter._setup_batch
+    counter._setup_batch = lambda: batch_ctxs.append(setup_batch()) or batch_ctxs[-1]
+    results = counter.count_many(graphs, as_generator=True)
+    # The batch is set up as soon as count_many() is called
+    tmp_dir = batch_ctxs[0]["base_tmp_dir"]
+    assert os.path.isdir(tmp_dir)
+    a_graph_idx, a_result = next(results)
+    assert a_graph_idx == 0 and len(a_result) == 1
+    assert [a_graph_idx for a_graph_idx, _ in results] == [1, 2]
+    assert not os.path.exists(tmp_dir)
+
+
+def test_count_many_interleaved():
+    """
+    Ensures that an open batch count is not affected by other counts of the same counter.
+    """
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 6)]
+    counter = EchoCounter()
+    results = counter.count_many(graphs, as_generator=True)
+    other_results = counter.count_many(graphs, as_generator=True)
+    assert len(next(results)[1]) == 1
+    assert len(counter(graphs[3])) == 4
+    assert len(next(other_results)[1]) == 1
+    assert [len(a_result) for _, a_result in results] == [2, 3, 4]
+    assert [len(a_result) for _, a_result in other_results] == [2, 3, 4]
+
+
+def test_scratch_dir(tmp_path, monkeypatch):
+    """
+    Ensures that each count runs in a private scratch directory of ``scratch_dir`` that is removed with everything the
+    process left in it.
+    """
+    scratch_dir = tmp_path / "scratch"
+    scratch_dir.mkdir()
+    cwd_file = tmp_path / "cwd"
+    counter = ScriptCounter(f"touch leftover\npwd >> {cwd_file}\nprintf '1\\t2\\n'\n")
+    counter.scratch_dir = str(scratch_dir)
+    counter(networkx.path_graph(3))
+    counter.count_many([networkx.path_graph(3)] * 3)
+    cwds = cwd_file.read_text().split()
+    assert len(cwds) == 4 and len(set(cwds)) == 2
+    assert all(os.path.dirname(a_cwd) == str(scratch_dir) for a_cwd in cwds)
+    assert list(scratch_dir.iterdir()) == []
+
+    # The default scratch directory is that of tempfile, unless it is set by the environment
+    monkeypatch.delenv("PYMOTIFCOUNTER_SCRATCH_DIR", raising=False)
+    assert get_default_scratch_dir() is None
+    monkeypatch.setenv("PYMOTIFCOUNTER_SCRATCH_DIR", str(scratch_dir))
+    assert get_default_scratch_dir() == str(scratch_dir)
+    with PyMotifCounterPreparedGraph(networkx.path_graph(3)) as prepared_graph:
+        assert os.path.dirname(prepared_graph.get_file(EchoCounter().in_transformer)) in \
+            [str(a_dir) for a_dir in scratch_dir.iterdir()]
+    assert list(scratch_dir.iterdir()) == []
+
+    with pytest.raises(PyMotifCounterError):
+        counter.scratch_dir = str(tmp_path / "missing")
@@ -55,6 +55,20 @@ def test_flag_output():
     assert p.get_parameter_form() == ["-s", ]
 
 
+def test_flag_output_value():
+    """
+    Ensures that a flag falls back to its default value when it is not set and that a given value does not modify it.
+    """
+    p = PyMotifCounterParameterFlag("s",
+                                    alias="size",
+                                    default_value=False)
+    assert p.get_parameter_form() == []
+    assert p.get_parameter_form(True) == ["-s", ] and p.get_parameter_form() == []
+    p.value = True
+    assert p.get_parameter_form() == ["-s", ]
+    assert p.get_parameter_form(False) == []
+
+
 def test_non_flag_output():
     """
     Ensures that the default parameter's form is its name followed by a string representation of its value
@@ -0,0 +1,131 @@
+"""
+Ensures the functionality of the counters that do not run an external binary.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import shutil
+import asyncio
+import itertools
+import numpy
+import networkx
+import pytest
+from pymotifcounter.util import adj_mat_to_motif_id
+from pymotifcounter.exceptions import PyMotifCounterParameterError
+from pymotifcounter.cache import PyMotifCounterResultCache
+from pymotifcounter.abstractcounter import PyMotifCounterPreparedGraph
+from pymotifcounter.counter_pgd import PyMotifCounterOutputTransformerPgd
+from pymotifcounter.concretecounters import (PyMotifCounterNativeTriads, PyMotifCounterNativeGraphlets,
+                                             PyMotifCounterMfinder, PyMotifCounterPgd)
+
+
+def test_triad_ids():
+    """
+    Ensures that the id of each triad is the mfinder id of its adjacency matrix.
+    """
+    for a_triad, a_motif_id in PyMotifCounterNativeTriads._triad_ids.items():
+        adj_mat = networkx.to_numpy_array(networkx.triad_graph(a_triad), nodelist=["a", "b", "c"], dtype=int)
+        assert min(adj_mat_to_motif_id(adj_mat[numpy.ix_(p, p)])
+                   for p in itertools.permutations(range(3))) == a_motif_id
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_native_triads(seed):
+    """
+    Ensures that the triad counts agree with the triad census of networkx.
+    """
+    a_graph = networkx.gnp_random_graph(60, 0.05 + 0.05 * seed, directed=True, seed=seed)
+    # Parallel edges and self loops are ignored
+    a_graph = networkx.MultiDiGraph(a_graph)
+    a_graph.add_edges_from([(0, 0), (1, 2), (1, 2)])
+    result = PyMotifCounterNativeTriads()(a_graph)
+    census = networkx.triadic_census(networkx.DiGraph(networkx.DiGraph(a_graph)))
+    expected = {a_motif_id: census[a_triad] for a_triad, a_motif_id in PyMotifCounterNativeTriads._triad_ids.items()}
+    assert dict(zip(result["motif_id"], result["nreal"])) == expected
+    assert list(result["motif_id"]) == sorted(expected)
+    assert result["creal_mili"].sum() == pytest.approx(1000)
+
+
+def test_native_triads_undirected():
+    """
+    Ensures that undirected triads are counted as paths and triangles.
+    """
+    a_graph = networkx.gnp_random_graph(80, 0.1, seed=0)
+    counter = PyMotifCounterNativeTriads()
+    counter.get_parameter("is_undirected").value = True
+    result = counter(a_graph)
+    n_triangles = sum(networkx.triangles(a_graph).values()) // 3
+    n_paths = sum(d * (d - 1) // 2 for _, d in a_graph.degree()) - 3 * n_triangles
+    assert dict(zip(result["motif_id"], result["nreal"])) == {78: n_paths, 238: n_triangles}
+
+    # The same graph as an edge array
+    assert counter(numpy.array(a_graph.edges())).equals(result)
+    with pytest.raises(PyMotifCounterParameterError):
+        counter.get_parameter("motif_size").value = 4
+
+
+def test_native_counter_interface():
+    """
+    Ensures that native counters support the interface of counters of binaries.
+    """
+    graphs = [networkx.gnp_random_graph(30, 0.1, directed=True, seed=k) for k in range(4)]
+    counter = PyMotifCounterNativeTriads()
+    expected = counter.count_many(graphs)
+    assert asyncio.run(counter.count_async(graphs[1])).equals(expected[expected["graph_index"] == 1]
+                                                               .drop(columns="graph_index").reset_index(drop=True))
+    with PyMotifCounterPreparedGraph(graphs[0]) as prepared_graph:
+        assert counter(prepared_graph).equals(counter(graphs[0]))
+
+    counter.cache = PyMotifCounterResultCache()
+    counter(graphs[0])
+    a_result = counter(graphs[0])
+    assert a_result.attrs["run_stats"].cached and a_result.equals(counter(graphs[0].reverse().reverse()))
+
+
+@pytest.mark.skipif(shutil.which("mfinder") is None, reason="mfinder is not installed")
+def test_native_triads_mfinder_parity():
+    """
+    Ensures that the triad counts agree with those of mfinder.
+    """
+    a_graph = networkx.gnp_random_graph(80, 0.06, directed=True, seed=0)
+    mfinder_result = PyMotifCounterMfinder()(a_graph)
+    native_result = PyMotifCounterNativeTriads()(a_graph)
+    assert dict(zip(mfinder_result["motif_id"], mfinder_result["nreal"])) == \
+        dict(zip(native_result["motif_id"], native_result["nreal"]))
+
+
+@pytest.mark.parametrize("a_graph", [networkx.gnp_random_graph(12, 0.1 + 0.2 * k, seed=k) for k in range(4)] +
+                                    [networkx.compose(networkx.complete_graph(5), networkx.path_graph(range(5, 9)))])
+def test_native_graphlets(a_graph):
+    """
+    Ensures that the graphlet counts agree with those of the enumeration of every subset of nodes.
+    """
+    # Each graphlet of pgd, by the sorted degrees of its nodes
+    graphlets = {(1, 1): "total_2_1edge", (0, 0): "total_2_indep",
+                 (2, 2, 2): "total_3_tris", (1, 1, 2): "total_2_star", (0, 1, 1): "total_3_1edge",
+                 (0, 0, 0): "total_3_indep",
+                 (3, 3, 3, 3): "total_4_clique", (2, 2, 3, 3): "total_4_chordcycle", (1, 2, 2, 3): "total_4_tailed_tris",
+                 (2, 2, 2, 2): "total_4_cycle", (1, 1, 1, 3): "total_3_star", (1, 1, 2, 2): "total_4_path",
+                 (0, 0, 1, 1): "total_4_1edge", (1, 1, 1, 1): "total_4_2edge", (0, 1, 1, 2): "total_4_2star",
+                 (0, 2, 2, 2): "total_4_tri", (0, 0, 0, 0): "total_4_indep"}
+    expected = dict.fromkeys(graphlets.values(), 0)
+    # As for pgd, nodes without edges are not part of the graph
+    nodes = [a_node for a_node, a_degree in a_graph.degree() if a_degree > 0]
+    for size in range(2, 5):
+        for some_nodes in itertools.combinations(nodes, size):
+            expected[graphlets[tuple(sorted(d for _, d in a_graph.subgraph(some_nodes).degree()))]] += 1
+
+    result = PyMotifCounterNativeGraphlets()(a_graph)
+    graphlet_ids = PyMotifCounterOutputTransformerPgd._graphlet_to_id
+    assert dict(zip(result["motif_id"], result["count"])) == {graphlet_ids[a_graphlet]: a_count
+                                                              for a_graphlet, a_count in expected.items()}
+
+
+@pytest.mark.skipif(shutil.which("pgd") is None, reason="pgd is not installed")
+def test_native_graphlets_pgd_parity():
+    """
+    Ensures that the graphlet counts are those of pgd, in the same rows and data types.
+    """
+    for a_graph in [networkx.barabasi_albert_graph(200, 3, seed=0),
+                    networkx.gnp_random_graph(100, 0.1, directed=True, seed=0)]:
+        assert PyMotifCounterNativeGraphlets()(a_graph).equals(PyMotifCounterPgd()(a_graph))
@@ -0,0 +1,165 @@
+"""
+Ensures the functionality of the random network null model.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import shutil
+import collections
+import numpy
+import networkx
+import pytest
+from pymotifcounter.nullmodel import PyMotifCounterNullModel
+from pymotifcounter.exceptions import PyMotifCounterError
+from pymotifcounter.concretecounters import (PyMotifCounterNativeTriads, PyMotifCounterEsu, PyMotifCounterMfinder,
+                                             PyMotifCounterNetMODE)
+from echocounter import EchoCounter
+
+
+def get_graph():
+    a_graph = networkx.gnp_random_graph(40, 0.1, directed=True, seed=0)
+    a_graph.add_edges_from([(v, u) for u, v in list(a_graph.edges())[:30]])
+    return a_graph
+
+
+def get_bidirectional_degree(a_graph):
+    return collections.Counter(u for u, v in a_graph.edges() if a_graph.has_edge(v, u))
+
+
+@pytest.mark.parametrize("bidirectional", ["fixed", "no_regard", "local_constant"])
+def test_randomise_directed(bidirectional):
+    """
+    Ensures that random networks preserve the degrees of each node and, by policy, its bidirectional edges.
+    """
+    a_graph = get_graph()
+    null_model = PyMotifCounterNullModel(bidirectional=bidirectional, n_workers=1, seed=0)
+    n_different = 0
+    for random_edges in null_model.randomise(a_graph, 3):
+        random_graph = networkx.DiGraph(random_edges.tolist())
+        assert random_graph.number_of_edges() == len(random_edges) == a_graph.number_of_edges()
+        assert networkx.number_of_selfloops(random_graph) == 0
+        assert dict(random_graph.in_degree()) == dict(a_graph.in_degree())
+        assert dict(random_graph.out_degree()) == dict(a_graph.out_degree())
+        if bidirectional != "no_regard":
+            assert get_bidirectional_degree(random_graph) == get_bidirectional_degree(a_graph)
+        if bidirectional == "fixed":
+            assert all(random_graph.has_edge(u, v) for u, v in a_graph.edges() if a_graph.has_edge(v, u))
+        n_different += len(set(random_graph.edges()) - set(a_graph.edges()))
+    assert n_different > 0
+
+
+def test_randomise_undirected():
+    """
+    Ensures that random networks of undirected graphs preserve the degree of each node.
+    """
+    a_graph = networkx.barabasi_albert_graph(60, 3, seed=0)
+    for random_edges in PyMotifCounterNullModel(n_workers=1, seed=0).randomise(a_graph, 3):
+        random_graph = networkx.Graph(random_edges.tolist())
+        assert len(random_edges) == random_graph.number_of_edges() == a_graph.number_of_edges()
+        assert dict(random_graph.degree()) == dict(a_graph.degree())
+
+
+def test_randomise_seed():
+    """
+    Ensures that the random networks of a seed do not depend on the number of workers.
+    """
+    a_graph = get_graph()
+    serial = list(PyMotifCounterNullModel(n_workers=1, seed=1).randomise(a_graph, 4))
+    parallel = list(PyMotifCounterNullModel(n_workers=2, seed=1).randomise(a_graph, 4))
+    assert all(numpy.array_equal(a, b) for a, b in zip(serial, parallel)) and len(parallel) == 4
+    assert not numpy.array_equal(serial[0], serial[1])
+
+
+def test_null_model_count():
+    """
+    Ensures that the statistics of the counts of random networks are added to the columns of the counter.
+    """
+    a_graph = get_graph()
+    counter = PyMotifCounterNativeTriads()
+    result = PyMotifCounterNullModel(n_workers=2, seed=0).count(counter, a_graph, 20)
+    assert result.attrs["n_random"] == 20
+    assert list(result.columns) == ["motif_id", "nreal", "creal_mili", "nrand_stats_m", "nrand_stats_s",
+                                    "nreal_z_score", "nreal_pval"]
+    assert result[["motif_id", "nreal", "creal_mili"]].equals(counter(a_graph))
+
+    random_counts = numpy.array([counter(random_edges)["nreal"] for random_edges in
+                                 PyMotifCounterNullModel(n_workers=1, seed=0).randomise(a_graph, 20)])
+    assert numpy.allclose(result["nrand_stats_m"], random_counts.mean(axis=0))
+    assert numpy.allclose(result["nrand_stats_s"], random_counts.std(axis=0))
+    assert numpy.allclose(result["nreal_pval"], (random_counts >= result["nreal"].to_numpy()).mean(axis=0))
+    has_sd = result["nrand_stats_s"] > 0
+    assert numpy.allclose(result["nreal_z_score"][has_sd],
+                          ((result["nreal"] - result["nrand_stats_m"]) / result["nrand_stats_s"])[has_sd])
+    assert result["nreal_z_score"][~has_sd].isna().all()
+
+
+def test_null_model_new_motifs():
+    """
+    Ensures that motifs that only occur in random networks are added to the result.
+    """
+    # A graph without triangles, whose random networks have them
+    a_graph = networkx.cycle_graph(30)
+    counter = PyMotifCounterEsu()
+    counter.get_parameter("is_undirected").value = True
+    result = PyMotifCounterNullModel(n_workers=1, seed=0).count(counter, a_graph, 10)
+    assert list(result["motif_id"]) == [78, 238]
+    triangles = result.set_index("motif_id").loc[238]
+    assert triangles["nreal"] == triangles["nsampled"] == 0 and triangles["nrand_stats_m"] > 0
+    assert triangles["nreal_pval"] == 1
+    assert result["nsampled"].dtype == "int64"
+
+
+def test_null_model_errors():
+    """
+    Ensures that invalid null models and counters without random network statistics are rejected.
+    """
+    with pytest.raises(PyMotifCounterError):
+        PyMotifCounterNullModel(bidirectional="global_constant")
+    with pytest.raises(PyMotifCounterError):
+        PyMotifCounterNullModel(n_switches=0)
+    with pytest.raises(PyMotifCounterError):
+        PyMotifCounterNullModel(n_workers=1).count(EchoCounter(), get_graph(), 2)
+
+
+@pytest.mark.skipif(shutil.which("mfinder") is None or shutil.which("NetMODE") is None,
+                    reason="mfinder or NetMODE is not installed")
+def test_null_model_backends():
+    """
+    Ensures that the statistics of random networks are set to the columns that the binaries report them in.
+    """
+    a_graph = get_graph()
+    null_model = PyMotifCounterNullModel(n_workers=2, seed=0)
+    for counter in [PyMotifCounterMfinder(), PyMotifCounterNetMODE()]:
+        counter.get_parameter("n_random").value = 5
+        expected = counter(a_graph)
+        result = null_model.count(counter, a_graph, 10)
+        assert list(result.columns) == list(expected.columns)
+        assert result.dtypes.equals(expected.dtypes)
+        assert result.attrs["n_random"] == 10
+    assert (result["ave_rand_conc"] > 0).all() and result["c-ZScore"].notna().any()
+    # The counter itself is not changed
+    assert counter.get_parameter("n_random").value == 5
+
+
+def test_null_model_early_stopping():
+    """
+    Ensures that counts stop once every z-score is within the tolerance and report the random networks they used.
+    """
+    a_graph = get_graph()
+    counter = PyMotifCounterNativeTriads()
+    result = PyMotifCounterNullModel(n_workers=2, seed=0).count(counter, a_graph, 1000, tolerance=0.5, batch_size=10)
+    n_random = result.attrs["n_random"]
+    assert result.attrs["converged"] and n_random < 1000 and n_random % 10 == 0
+    half_width = 1.96 * numpy.sqrt((1 + result["nreal_z_score"] ** 2 / 2) / n_random)
+    assert (half_width.dropna() < 0.5).all()
+    # The random networks are the first ones of the seed
+    expected = PyMotifCounterNullModel(n_workers=1, seed=0).count(counter, a_graph, n_random)
+    assert numpy.allclose(result["nrand_stats_m"], expected["nrand_stats_m"])
+    assert expected.attrs["converged"] is None
+
+    result = PyMotifCounterNullModel(n_workers=1, seed=0).count(counter, a_graph, 15, tolerance=0.01, batch_size=10)
+    assert result.attrs["n_random"] == 15 and not result.attrs["converged"]
+
+    for invalid_parameters in [{"tolerance": 0}, {"batch_size": 0}, {"confidence": 1}]:
+        with pytest.raises(PyMotifCounterError):
+            PyMotifCounterNullModel(n_workers=1).count(counter, a_graph, 10, **invalid_parameters)
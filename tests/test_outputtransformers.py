@@ -0,0 +1,138 @@
+"""
+Ensures the functionality of the output transformers of each concrete counter.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import concurrent.futures
+import pytest
+import pandas
+from pymotifcounter.concretecounters import (PyMotifCounterOutputTransformerMfinder,
+                                             PyMotifCounterOutputTransformerFanmod,
+                                             PyMotifCounterOutputTransformerNetMODE,
+                                             PyMotifCounterOutputTransformerPgd)
+
+MFINDER_OUTPUT = """
+Full list of subgraphs size 3 ids:
+
+	( Total num of different subgraphs size 3 is : 3 )
+
+MOTIF	NREAL	NRAND		NREAL	NREAL	CREAL	UNIQ
+ID		STATS		ZSCORE	PVAL	[MILI]
+6	254	254.0+-0.0	-0.10	1.000	333.33	170
+
+12	504	503.5+-1.3	0.36	0.870	661.42	72
+
+14	0	0.0+-0.0	888888	1.000	0.00	0
+
+
+
+ (Application total runtime was:   18.0 seconds.)
+"""
+
+FANMOD_OUTPUT = """
+Result overview:
+
+ID,Adj-Matrix,Frequency,Mean-Freq,Standard-Dev,Z-Score,p-Value
+,,[Original],[Random],[Random]
+
+78,001,71.58%,99.961%,0.00074998,-378.43,1
+,001
+,110
+
+238,011,28.42%,0.039255%,0.00074998,378.43,0
+,101
+,110
+
+"""
+
+NETMODE_OUTPUT = """calc Z-Score
+gID:   6  freq:    80  ave_rand_freq:     -nan (sd:   -nan)  conc: 0.16393  ave_rand_conc: -nan (sd: -nan)  f-ZScore:   -nan  f-pValue: -nan  c-ZScore:   -nan  c-pValue: -nan
+gID:  12  freq:   103  ave_rand_freq:    101.5 (sd:   2.25)  conc: 0.21107  ave_rand_conc: 0.2 (sd: 0.01)  f-ZScore:   0.66  f-pValue: 0.3  c-ZScore:   1.1  c-pValue: 0.2
+"""
+
+PGD_OUTPUT = """K = 4
+************************************************************
+total_2_1edge = 14267
+total_2_indep = 16502611
+----------------------------------------
+total_3_tris = 9286
+total_2_star = 35397
+total_3_1edge = 81879530
+total_3_indep = 31553402783
+************************************************************
+graphlet decomposition time: 0.0163529 sec
+"""
+
+
+def test_mfinder_output():
+    """
+    Ensures that mfinder's output is converted to a DataFrame with numeric columns.
+    """
+    df = PyMotifCounterOutputTransformerMfinder()(MFINDER_OUTPUT)
+    assert list(df.columns) == ["motif_id", "nreal", "nrand_stats_m", "nrand_stats_s", "nreal_z_score",
+                                "nreal_pval", "creal_mili", "uniq"]
+    assert df["motif_id"].tolist() == [6, 12, 14]
+    assert df["nrand_stats_s"].tolist() == [0.0, 1.3, 0.0]
+    assert df["nreal_z_score"].tolist() == [-0.1, 0.36, 888888.0]
+    assert df["nreal"].dtype == "int64"
+    assert df["nreal_z_score"].dtype == "float64"
+
+
+def test_fanmod_output():
+    """
+    Ensures that fanmod's output is converted to a DataFrame with numeric columns.
+    """
+    df = PyMotifCounterOutputTransformerFanmod()(FANMOD_OUTPUT, None)
+    assert list(df.columns) == ["ID", "Frequency", "Mean_Freq", "Standard_Dev", "Z_Score", "p_Value"]
+    assert df["ID"].tolist() == [78, 238]
+    assert df["Mean_Freq"].tolist() == [99.961, 0.039255]
+    assert df["p_Value"].tolist() == [1.0, 0.0]
+    assert df["ID"].dtype == "int64"
+
+
+def test_netmode_output():
+    """
+    Ensures that NetMODE's output is converted to a DataFrame with numeric columns, including its ``-nan`` values.
+    """
+    df = PyMotifCounterOutputTransformerNetMODE()(NETMODE_OUTPUT)
+    assert df.columns[-2:].tolist() == ["ave_rand_freq_sd", "ave_rand_conc_sd"]
+    assert df["gID"].tolist() == [6, 12]
+    assert df["freq"].dtype == "int64"
+    assert df["ave_rand_freq"].isna().tolist() == [True, False]
+    assert df.loc[1, "ave_rand_freq_sd"] == pytest.approx(2.25)
+
+
+def test_pgd_output():
+    """
+    Ensures that pgd's output is converted to a DataFrame of graphlet counts.
+    """
+    df = PyMotifCounterOutputTransformerPgd()(PGD_OUTPUT)
+    assert df["motif_id"].tolist() == ["(60, 2)", "(0, 2)", "(238, 3)", "(78, 3)", "(160, 3)", "(0, 3)"]
+    assert df["count"].tolist() == [14267, 16502611, 9286, 35397, 81879530, 31553402783]
+    assert df["count"].dtype == "int64"
+
+
+def test_grammar_built_once():
+    """
+    Ensures that the grammar of a transformer is built once and shared by all of its instances.
+    """
+    assert PyMotifCounterOutputTransformerMfinder._get_cached_parser() is \
+           PyMotifCounterOutputTransformerMfinder()._get_cached_parser()
+    assert PyMotifCounterOutputTransformerMfinder._get_cached_parser() is not \
+           PyMotifCounterOutputTransformerPgd._get_cached_parser()
+
+
+def test_grammar_concurrent_use():
+    """
+    Ensures that a shared grammar returns the same results when it is used by multiple threads at once.
+    """
+    transformers_outputs = [(PyMotifCounterOutputTransformerMfinder(engine="pyparsing"), MFINDER_OUTPUT),
+                            (PyMotifCounterOutputTransformerFanmod(engine="pyparsing"), FANMOD_OUTPUT),
+                            (PyMotifCounterOutputTransformerNetMODE(engine="pyparsing"), NETMODE_OUTPUT),
+                            (PyMotifCounterOutputTransformerPgd(engine="pyparsing"), PGD_OUTPUT)] * 25
+    expected = [a_transformer(a_output, None) for a_transformer, a_output in transformers_outputs]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda x: x[0](x[1], None), transformers_outputs))
+    for a_result, an_expected_result in zip(results, expected):
+        pandas.testing.assert_frame_equal(a_result, an_expected_result)
@@ -0,0 +1,123 @@
+"""
+Ensures that the fast and pyparsing engines of the output transformers produce the same results.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import os
+import re
+import random
+import pytest
+import pandas
+from pymotifcounter.concretecounters import (PyMotifCounterOutputTransformerMfinder,
+                                             PyMotifCounterOutputTransformerFanmod,
+                                             PyMotifCounterOutputTransformerNetMODE,
+                                             PyMotifCounterOutputTransformerPgd)
+from pymotifcounter.exceptions import PyMotifCounterError
+
+RAW_OUTPUTS_DIR = os.path.join(os.path.dirname(__file__), "..", "doc", "source", "resources", "raw_outputs")
+
+
+def random_float(rnd):
+    return rnd.choice([f"{rnd.uniform(-1000, 1000):.3f}", f"{rnd.random():.5f}", "nan", "-nan", ".5"])
+
+
+def synthetic_mfinder_output(n_rows, rnd):
+    rows = "\n\n".join(f"{k}\t{rnd.randint(0, 5000)}\t{rnd.uniform(0, 5000):.1f}+-{rnd.uniform(0, 50):.1f}\t"
+                       f"{rnd.choice([random_float(rnd), '888888'])}\t{rnd.random():.3f}\t"
+                       f"{rnd.uniform(0, 1000):.2f}\t{rnd.randint(0, 200)}" for k in range(n_rows))
+    return f"Full list of subgraphs size 4 ids:\n\nMOTIF\tNREAL\tNRAND\n{rows}\n\n (Application total runtime)\n"
+
+
+def synthetic_fanmod_output(n_rows, rnd, with_stats=True):
+    stats = (lambda: f",{rnd.uniform(0, 100):.3f}%,{rnd.random():.5f},{random_float(rnd)},"
+                     f"{rnd.choice([f'{rnd.random():.3f}', '0', '1'])}") if with_stats else (lambda: "")
+    rows = "\n\n".join(f"{k},0110,{rnd.uniform(0, 100):.3f}%{stats()}\n,1001\n,1001\n,0110" for k in range(n_rows))
+    return f"Result overview:\n\nID,Adj-Matrix,Frequency,Mean-Freq,Standard-Dev,Z-Score,p-Value\n\n{rows}\n\n"
+
+
+def synthetic_netmode_output(n_rows, rnd):
+    rows = "\n".join(f"gID: {k:>4}  freq: {rnd.randint(0, 5000):>5}  ave_rand_freq: {random_float(rnd):>8} "
+                     f"(sd: {random_float(rnd)})  conc: {random_float(rnd)}  ave_rand_conc: {random_float(rnd)} "
+                     f"(sd: {random_float(rnd)})  f-ZScore: {random_float(rnd)}  f-pValue: {random_float(rnd)}  "
+                     f"c-ZScore: {random_float(rnd)}  c-pValue: {random_float(rnd)}" for k in range(n_rows))
+    return f"calc Z-Score\n{rows}\n"
+
+
+def assert_engine_parity(transformer_class, str_data, expect_fast=True):
+    """
+    Parses ``str_data`` with both engines and ensures that the resulting DataFrames are identical.
+    """
+    fast_transformer = transformer_class(engine="fast")
+    grammar_transformer = transformer_class(engine="pyparsing")
+    assert (fast_transformer._parse_fast(str_data) is not None) == expect_fast
+    pandas.testing.assert_frame_equal(fast_transformer(str_data, None), grammar_transformer(str_data, None))
+
+
+@pytest.mark.parametrize("transformer_class, file_name",
+                         [(PyMotifCounterOutputTransformerMfinder, "mfinder_out.txt"),
+                          (PyMotifCounterOutputTransformerFanmod, "fanmod_out.txt"),
+                          (PyMotifCounterOutputTransformerNetMODE, "netmode_out_1.txt")])
+def test_parity_raw_outputs(transformer_class, file_name):
+    """
+    Ensures engine parity over actual outputs of each binary.
+    """
+    with open(os.path.join(RAW_OUTPUTS_DIR, file_name), "rt") as fd:
+        assert_engine_parity(transformer_class, fd.read())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parity_synthetic_outputs(seed):
+    """
+    Ensures engine parity over large synthetic outputs.
+    """
+    rnd = random.Random(seed)
+    assert_engine_parity(PyMotifCounterOutputTransformerMfinder, synthetic_mfinder_output(500, rnd))
+    assert_engine_parity(PyMotifCounterOutputTransformerFanmod, synthetic_fanmod_output(500, rnd))
+    assert_engine_parity(PyMotifCounterOutputTransformerFanmod, synthetic_fanmod_output(500, rnd, False))
+    assert_engine_parity(PyMotifCounterOutputTransformerNetMODE, synthetic_netmode_output(500, rnd))
+
+
+def test_fallback_on_interrupted_table():
+    """
+    Ensures that tables the fast engine cannot fully account for are handed over to the pyparsing engine.
+    """
+    rnd = random.Random(0)
+    str_data = synthetic_mfinder_output(20, rnd).replace("\n10\t", "\n(interruption)\n10\t")
+    assert_engine_parity(PyMotifCounterOutputTransformerMfinder, str_data, expect_fast=False)
+    assert len(PyMotifCounterOutputTransformerMfinder()(str_data)) == 10
+
+    str_data = synthetic_netmode_output(20, rnd).replace("gID:    5", "gID: xx")
+    assert_engine_parity(PyMotifCounterOutputTransformerNetMODE, str_data, expect_fast=False)
+
+
+def test_parity_int64_overflow():
+    """
+    Ensures that both engines retain counts that exceed the ``int64`` range as Python integers.
+    """
+    str_data = re.sub(r"\n1\t[0-9]+\t", "\n1\t99999999999999999999\t", synthetic_mfinder_output(3, random.Random(0)))
+    df = PyMotifCounterOutputTransformerMfinder()(str_data)
+    assert df["nreal"].dtype == object
+    assert df.loc[1, "nreal"] == 99999999999999999999
+    assert_engine_parity(PyMotifCounterOutputTransformerMfinder, str_data)
+
+
+def test_unknown_engine_error():
+    """
+    Ensures that only known parsing engines can be selected.
+    """
+    with pytest.raises(PyMotifCounterError):
+        PyMotifCounterOutputTransformerMfinder(engine="lex")
+
+
+@pytest.mark.parametrize("transformer_class", [PyMotifCounterOutputTransformerMfinder,
+                                               PyMotifCounterOutputTransformerFanmod,
+                                               PyMotifCounterOutputTransformerPgd])
+@pytest.mark.parametrize("engine", ["fast", "pyparsing"])
+@pytest.mark.parametrize("str_data", ["garbage", "", "Full list of subgraphs size 4 ids:\n\nMOTIF\tNREAL\n"])
+def test_unparsable_output_error(transformer_class, engine, str_data):
+    """
+    Ensures that outputs that do not contain an enumeration are rejected by both engines, rather than parsed as empty.
+    """
+    with pytest.raises(PyMotifCounterError):
+        transformer_class(engine=engine)(str_data, None)
@@ -0,0 +1,56 @@
+"""
+Ensures the functionality of prepared graphs.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import os
+import networkx
+import pytest
+from pymotifcounter.abstractcounter import PyMotifCounterPreparedGraph
+from pymotifcounter.cache import PyMotifCounterResultCache
+from pymotifcounter.exceptions import PyMotifCounterError
+from echocounter import EchoCounter, StdinEchoCounter
+
+
+def test_prepared_graph():
+    """
+    Ensures that a prepared graph is transformed once and produces the same results as the graph itself.
+    """
+    a_graph = networkx.gnp_random_graph(30, 0.2, directed=True, seed=0)
+    counter = EchoCounter()
+    stdin_counter = StdinEchoCounter()
+    expected = counter(a_graph)
+    with PyMotifCounterPreparedGraph(a_graph) as prepared_graph:
+        assert counter(prepared_graph).equals(expected)
+        # Any further counts can only succeed by re-using the transformed graph
+        prepared_graph._graph = None
+        for _ in range(3):
+            assert counter(prepared_graph).equals(expected)
+            assert stdin_counter(prepared_graph).equals(expected)
+        # The counters expect the same format, therefore they share its file.
+        assert len(os.listdir(prepared_graph._tmp_dir)) == 1
+        tmp_dir = prepared_graph._tmp_dir
+    assert prepared_graph.closed and not os.path.exists(tmp_dir)
+    with pytest.raises(PyMotifCounterError):
+        counter(prepared_graph)
+
+
+def test_prepared_graph_batch():
+    """
+    Ensures that prepared graphs can be mixed with other graphs in a batch and that they share cached results.
+    """
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 8)]
+    counter = EchoCounter()
+    expected = counter.count_many(graphs)
+    prepared_graphs = [PyMotifCounterPreparedGraph(a_graph) if k % 2 == 0 else a_graph
+                       for k, a_graph in enumerate(graphs)]
+    assert counter.count_many(prepared_graphs).equals(expected)
+    assert counter.count_many(prepared_graphs).equals(expected)
+
+    counter.cache = PyMotifCounterResultCache()
+    counter(graphs[0])
+    counter(prepared_graphs[0])
+    assert counter.cache.stats["hits"] == 1
+    for a_graph in prepared_graphs[::2]:
+        a_graph.close()
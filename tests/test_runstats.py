@@ -0,0 +1,70 @@
+"""
+Ensures that the timings and resource usage of motif counts are recorded.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import asyncio
+import networkx
+from pymotifcounter.runstats import PyMotifCounterRunStats
+from pymotifcounter.cache import PyMotifCounterResultCache
+from echocounter import EchoCounter, StdinEchoCounter, ScriptCounter
+
+
+def test_run_stats():
+    """
+    Ensures that each phase of a count is timed and that the resource usage of its process is recorded.
+    """
+    a_graph = networkx.gnm_random_graph(2000, 20000, directed=True, seed=0)
+    for counter in [EchoCounter(), StdinEchoCounter()]:
+        stats = counter(a_graph).attrs["run_stats"]
+        assert isinstance(stats, PyMotifCounterRunStats)
+        assert stats.transform_time > 0 and stats.process_time > 0 and stats.parse_time > 0
+        assert stats.total_time >= stats.transform_time + stats.parse_time
+        assert stats.peak_rss > 0 and stats.cpu_user_time >= 0 and stats.cpu_system_time >= 0
+        assert (stats.returncode, stats.timed_out, stats.cached) == (0, False, False)
+    # Only file inputs are written by the counter
+    assert EchoCounter()(a_graph).attrs["run_stats"].io_time > 0
+
+    # The process that does more work uses more CPU time
+    busy_stats = ScriptCounter("i=0; while [ $i -lt 100000 ]; do i=$((i+1)); done\n")(a_graph).attrs["run_stats"]
+    idle_stats = ScriptCounter("sleep 0.2\n")(a_graph).attrs["run_stats"]
+    assert busy_stats.cpu_user_time > idle_stats.cpu_user_time
+    assert idle_stats.process_time >= 0.2
+
+    stats = asyncio.run(EchoCounter().count_async(a_graph)).attrs["run_stats"]
+    assert stats.process_time > 0 and stats.peak_rss is None
+
+
+def test_run_stats_cached_and_batches():
+    """
+    Ensures that cached counts are marked as such and that batches list the stats of each count.
+    """
+    counter = EchoCounter()
+    counter.cache = PyMotifCounterResultCache()
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 6)]
+    counter(graphs[0])
+    stats = counter(graphs[0]).attrs["run_stats"]
+    assert stats.cached and stats.process_time is None
+
+    all_stats = counter.count_many(graphs).attrs["run_stats"]
+    assert [a_stats.cached for a_stats in all_stats] == [True, False, False, False]
+    assert set(all_stats[0].as_dict()) >= {"transform_time", "io_time", "process_time", "parse_time",
+                                           "total_time", "peak_rss", "cpu_user_time", "cpu_system_time"}
+
+
+def test_run_stats_rusage():
+    """
+    Ensures that the resource usage of every process is recorded, including that of processes that time out.
+    """
+    counter = EchoCounter()
+    all_stats = counter.count_many([networkx.path_graph(n, create_using=networkx.DiGraph)
+                                    for n in range(2, 30)]).attrs["run_stats"]
+    assert all(a_stats.peak_rss is not None and a_stats.cpu_user_time is not None for a_stats in all_stats)
+
+    counter = ScriptCounter("printf '1\\t2\\n'\nexec sleep 5\n")
+    counter.timeout = 0.3
+    counter.salvage_partial = True
+    stats = counter(networkx.path_graph(3)).attrs["run_stats"]
+    assert stats.timed_out and stats.process_time < 5
+    assert stats.peak_rss is not None and stats.cpu_user_time is not None
@@ -0,0 +1,60 @@
+"""
+Ensures the functionality of streaming the input of a process to its stdin.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import asyncio
+import networkx
+import pytest
+from pymotifcounter.cache import PyMotifCounterResultCache
+from echocounter import StdinEchoCounter
+
+
+@pytest.fixture(scope="module")
+def large_graph():
+    # Large enough for both the input and the output of the process to exceed the capacity of a pipe
+    return networkx.gnm_random_graph(5000, 60000, directed=True, seed=0)
+
+
+def test_streamed_input(large_graph):
+    """
+    Ensures that a streamed input produces the same results as an input that is transformed in advance.
+    """
+    counter = StdinEchoCounter()
+    streamed_result = counter(large_graph)
+    assert len(streamed_result) == large_graph.number_of_edges()
+    counter.stream_input = False
+    assert counter(large_graph).equals(streamed_result)
+    assert asyncio.run(counter.count_async(large_graph)).equals(streamed_result)
+    counter.stream_input = True
+    assert asyncio.run(counter.count_async(large_graph)).equals(streamed_result)
+
+    # A cache consumes the stream to derive its key
+    counter.cache = PyMotifCounterResultCache()
+    assert counter(large_graph).equals(streamed_result)
+
+    with pytest.raises(TypeError):
+        counter.stream_input = 1
+
+
+def test_input_chunks():
+    """
+    Ensures that the input is written in chunks of at least ``_stdin_chunk_size`` characters (except the last one).
+    """
+    counter = StdinEchoCounter()
+    lines = [f"{k}\t{k + 1}\n" for k in range(50000)]
+    chunks = list(counter._iter_input_chunks(iter(lines)))
+    assert "".join(chunks) == "".join(lines)
+    assert all(len(a_chunk) >= counter._stdin_chunk_size for a_chunk in chunks[:-1])
+    assert list(counter._iter_input_chunks("".join(lines))) != [] and \
+           "".join(counter._iter_input_chunks("".join(lines))) == "".join(lines)
+
+
+def test_unconsumed_input(large_graph):
+    """
+    Ensures that a process that exits without reading its input does not block or fail the count.
+    """
+    counter = StdinEchoCounter("true")
+    assert len(counter(large_graph)) == 0
+    assert len(asyncio.run(counter.count_async(large_graph))) == 0
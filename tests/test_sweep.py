@@ -0,0 +1,80 @@
+"""
+Ensures the functionality of parameter sweeps.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import networkx
+import pytest
+from pymotifcounter.abstractcounter import PyMotifCounterPreparedGraph
+from pymotifcounter.sweep import PyMotifCounterSweep
+from pymotifcounter.exceptions import PyMotifCounterParameterError
+from echocounter import EchoCounter, ParamEchoCounter
+
+
+def test_sweep():
+    """
+    Ensures that a sweep runs each combination of the grid over each graph and indexes the results by it.
+    """
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in (3, 5)]
+    sweep = PyMotifCounterSweep({"echo": ParamEchoCounter(), "plain": EchoCounter()},
+                                {"motif_size": [3, 4, 5], "n_random": [0, 10]}, n_workers=3)
+    results = sweep(graphs)
+    assert results.index.names == ["backend", "graph_index", "motif_size", "n_random"]
+
+    echo_results = results.loc["echo"]
+    assert len(echo_results.index.unique()) == 3 * 2 * 2
+    for (a_graph_idx, motif_size, n_random), a_result in echo_results.groupby(level=[0, 1, 2]):
+        # The echoed edges followed by the parameters that the process received
+        assert len(a_result) == graphs[a_graph_idx].number_of_edges() + 1
+        assert a_result.iloc[-1].tolist() == [motif_size, n_random]
+
+    # A counter that defines none of the parameters of the grid runs once per graph
+    plain_results = results.loc["plain"]
+    assert len(plain_results.index.unique()) == 2
+    assert plain_results.reset_index()[["motif_size", "n_random"]].isna().all().all()
+
+
+class OrderedParamEchoCounter(ParamEchoCounter):
+    """
+    Records the parameters of each run, in the order in which runs execute.
+    """
+    # A class attribute, as sweeps run copies of the counter
+    run_order = []
+
+    def _run(self, ctx):
+        OrderedParamEchoCounter.run_order.append((self.get_parameter("motif_size").value,
+                                                  self.get_parameter("n_random").value))
+        return super()._run(ctx)
+
+
+def test_sweep_order():
+    """
+    Ensures that runs are scheduled in ascending order of their estimated cost, while results remain in grid order.
+    """
+    sweep = PyMotifCounterSweep(OrderedParamEchoCounter(), {"motif_size": [5, 3, 4], "n_random": [100, 0]},
+                                n_workers=1)
+    results = sweep(networkx.path_graph(4, create_using=networkx.DiGraph))
+    assert [a_run[2:] for a_run in results.index.unique()] == [(5, 100), (5, 0), (3, 100), (3, 0), (4, 100), (4, 0)]
+    assert OrderedParamEchoCounter.run_order == [(3, 0), (4, 0), (5, 0), (3, 100), (4, 100), (5, 100)]
+
+
+def test_sweep_estimate_cost():
+    """
+    Ensures that the estimated cost of a run depends on the number of edges of its graph, regardless of its type.
+    """
+    a_graph = networkx.gnm_random_graph(30, 60, directed=True, seed=0)
+    counter = EchoCounter()
+    with PyMotifCounterPreparedGraph(a_graph) as prepared_graph:
+        costs = [PyMotifCounterSweep.estimate_cost(counter, a_graph_form) for a_graph_form in
+                 [a_graph, networkx.to_pandas_edgelist(a_graph), networkx.to_scipy_sparse_array(a_graph),
+                  prepared_graph]]
+    assert costs == [61.0] * 4
+
+
+def test_sweep_errors():
+    """
+    Ensures that invalid grids are rejected before any run.
+    """
+    with pytest.raises(PyMotifCounterParameterError):
+        PyMotifCounterSweep(ParamEchoCounter(), {"motif_size": [3, "4"]})
@@ -0,0 +1,59 @@
+"""
+Ensures that one counter instance can be shared by multiple threads.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import os
+import shutil
+import concurrent.futures
+import networkx
+import pytest
+from pymotifcounter.concretecounters import PyMotifCounterNetMODE
+from echocounter import EchoCounter
+
+
+def count_concurrently(counter, graphs, n_threads):
+    """
+    Counts the motifs of each graph with the same counter from ``n_threads`` threads at once.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_threads) as executor:
+        return list(executor.map(counter, graphs))
+
+
+def test_shared_counter_stress():
+    """
+    Ensures that concurrent calls of a shared counter return the results of their own graph.
+    """
+    graphs = [networkx.gnp_random_graph(10 + k % 15, 0.3, directed=True, seed=k) for k in range(400)]
+    counter = EchoCounter()
+    in_value, out_value = counter.in_param.value, counter.out_param.value
+    for a_result, a_graph in zip(count_concurrently(counter, graphs, 16), graphs):
+        assert len(a_result) == a_graph.number_of_edges()
+        assert set(zip(a_result["source"], a_result["target"])) == {(u + 1, v + 1) for u, v in a_graph.edges()}
+    # Calls do not leave any state behind in the counter
+    assert (counter.in_param.value, counter.out_param.value) == (in_value, out_value)
+
+
+def test_shared_counter_batches():
+    """
+    Ensures that concurrent batch counts of a shared counter do not interfere with each other.
+    """
+    graphs = [networkx.path_graph(n, create_using=networkx.DiGraph) for n in range(2, 40)]
+    counter = EchoCounter()
+    expected = counter.count_many(graphs)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: counter.count_many(graphs), range(16)))
+    assert all(a_result.equals(expected) for a_result in results)
+
+
+@pytest.mark.skipif(shutil.which("NetMODE") is None, reason="NetMODE is not installed")
+def test_shared_netmode_counter():
+    """
+    Ensures that concurrent NetMODE calls do not share the adjacency matrix file they create in their CWD.
+    """
+    graphs = [networkx.gnp_random_graph(12, 0.3, directed=True, seed=k) for k in range(24)]
+    counter = PyMotifCounterNetMODE()
+    for a_result, a_graph in zip(count_concurrently(counter, graphs, 8), graphs):
+        assert a_result.equals(counter(a_graph))
+    assert not os.path.exists("adjMat.txt")
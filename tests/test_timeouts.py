@@ -0,0 +1,78 @@
+"""
+Ensures that processes that time out or fail are handled.
+
+:author: Athanasios Anastasiou
+:date: Oct 2026
+"""
+import time
+import asyncio
+import networkx
+import pytest
+from pymotifcounter.exceptions import (PyMotifCounterError,
+                                       PyMotifCounterTimeoutError,
+                                       PyMotifCounterProcessError)
+from echocounter import SleepCounter, ScriptCounter
+from test_asynccounter import process_exists
+
+
+def test_timeout(tmp_path):
+    """
+    Ensures that a count that times out raises an error and that its process is terminated.
+    """
+    pid_file = tmp_path / "pid"
+    counter = SleepCounter(30, pid_file)
+    start_time = time.monotonic()
+    with pytest.raises(PyMotifCounterTimeoutError):
+        counter(networkx.path_graph(3), timeout=0.5)
+    assert time.monotonic() - start_time < 10
+    assert not process_exists(int(pid_file.read_text()))
+
+    # The timeout of the counter applies to calls that do not set one
+    counter.timeout = 0.5
+    with pytest.raises(PyMotifCounterTimeoutError):
+        counter.count_many([networkx.path_graph(3)])
+    with pytest.raises(PyMotifCounterError):
+        counter.timeout = 0
+
+
+def test_timeout_escalation(tmp_path):
+    """
+    Ensures that a process that ignores SIGTERM is killed once ``kill_grace`` has elapsed.
+    """
+    pid_file = tmp_path / "pid"
+    counter = ScriptCounter(f"trap '' TERM\necho $$ > {pid_file}\nwhile :; do sleep 0.1; done\n")
+    counter.kill_grace = 1
+    start_time = time.monotonic()
+    with pytest.raises(PyMotifCounterTimeoutError):
+        counter(networkx.path_graph(3), timeout=0.5)
+    assert 1.5 <= time.monotonic() - start_time < 10
+    assert not process_exists(int(pid_file.read_text()))
+
+
+def test_salvage_partial():
+    """
+    Ensures that the output that a process produced before it timed out can be salvaged.
+    """
+    counter = ScriptCounter("printf '1\\t2\\n3\\t4\\n'\nexec sleep 30\n")
+    counter.salvage_partial = True
+    for a_result in [counter(networkx.path_graph(3), timeout=0.5),
+                     asyncio.run(counter.count_async(networkx.path_graph(3), timeout=0.5))]:
+        assert a_result.attrs["timed_out"]
+        assert list(a_result["source"]) == [1, 3]
+
+    # Partial output that can not be parsed
+    counter = ScriptCounter("printf '1\\t'\nexec sleep 30\n")
+    counter.salvage_partial = True
+    with pytest.raises(PyMotifCounterTimeoutError):
+        counter(networkx.path_graph(3), timeout=0.5)
+
+
+def test_process_error():
+    """
+    Ensures that a process that exits with an error raises an error that includes its stderr.
+    """
+    counter = ScriptCounter("echo 'Something went wrong' >&2\nexit 3\n")
+    with pytest.raises(PyMotifCounterProcessError, match="status 3: Something went wrong"):
+        counter(networkx.path_graph(3))
+    with pytest.raises(PyMotifCounterProcessError, match="status 3"):
+        asyncio.run(counter.count_async(networkx.path_graph(3)))